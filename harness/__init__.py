@@ -0,0 +1,7 @@
+"""
+Shared harness for 24h-testers UCP runs.
+
+Helpers used by run.py and by the tests agents generate under runs/.
+Each module is importable on its own and only needs the standard library
+unless stated otherwise.
+"""
@@ -0,0 +1,225 @@
+"""
+Adaptive agent concurrency and per-item timeouts for the DAG runner.
+
+`--batch-size` and `--timeout` are fixed for a whole session, so a box
+either sits idle while five agents wait on the model, or thrashes when
+several agents start Rust builds at once; and every item gets the same
+10-minute budget whether it usually takes two minutes or eight.
+
+ConcurrencyController adjusts the scheduler's slot count every
+`interval` seconds (additive increase, multiplicative decrease):
+
+- halve on any rate-limit error reported by the agent runtime since the
+  last update, then hold for `cooldown` seconds. Only the runtime's own
+  errors count (stderr, and error events of the `--usage` JSON stream):
+  agents read docs and logs that mention rate limits, and that tool
+  output is on stdout
+- drop one slot when load per CPU exceeds LOAD_HIGH or available memory
+  falls below MEMORY_LOW (Rust builds of ucp-api are the usual cause)
+- add one slot when load and memory are below LOAD_LOW / MEMORY_OK and
+  ready items are waiting for a slot
+
+TimeoutPolicy derives each item's timeout from completed runs recorded in
+.processor/ sessions: the item's own slowest completion when it has one,
+otherwise its tier's p95, otherwise the global p95, times MARGIN and
+clamped to [floor, ceiling]. Each attempt after a timeout gets
+ESCALATION times the previous budget.
+"""
+
+import json
+import os
+import re
+import time
+
+from harness import monitor
+
+# Load average per CPU
+LOAD_HIGH = 1.5
+LOAD_LOW = 0.75
+# Fraction of memory available
+MEMORY_LOW = 0.10
+MEMORY_OK = 0.25
+
+DEFAULT_INTERVAL = 15.0
+DEFAULT_COOLDOWN = 120.0
+
+# Runtime output that means the model provider is throttling us
+RATE_LIMIT_RE = re.compile(
+    r"rate[ _-]?limit|too many requests|(?:status|http|error)\W{0,3}429\b"
+    r"|overloaded_error|quota exceeded",
+    re.IGNORECASE,
+)
+
+MARGIN = 1.5
+ESCALATION = 1.5
+MIN_SAMPLES = 5
+
+
+def is_rate_limit(line, stderr=False):
+    """
+    True when a runtime output line reports throttling.
+
+    stderr lines are the runtime's own; on stdout only JSON error events
+    count (claude-code `result` with is_error, opencode `error`), since
+    everything else there may be tool output.
+    """
+    if stderr:
+        return bool(RATE_LIMIT_RE.search(line))
+    line = line.strip()
+    if not line.startswith("{"):
+        return False
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return False
+    if not isinstance(event, dict):
+        return False
+    if event.get("type") == "error":
+        detail = event.get("error")
+    elif event.get("type") == "result" and event.get("is_error"):
+        detail = event.get("result")
+    else:
+        return False
+    return bool(RATE_LIMIT_RE.search(json.dumps(detail)))
+
+
+def cpu_load():
+    """Return the 1-minute load average per CPU, or None if unavailable."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return None
+
+
+def memory_available(meminfo="/proc/meminfo"):
+    """Return MemAvailable / MemTotal, or None if unavailable."""
+    values = {}
+    try:
+        with open(meminfo) as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                values[name] = int(rest.split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    if not values.get("MemTotal") or "MemAvailable" not in values:
+        return None
+    return values["MemAvailable"] / values["MemTotal"]
+
+
+class ConcurrencyController:
+    """
+    Chooses the number of agent slots from load, memory and rate limits.
+
+    `probe()` returns (load per CPU, fraction of memory available), either
+    of which may be None; `on_change(old, new, reason)` is called whenever
+    the slot count moves.
+    """
+
+    def __init__(
+        self,
+        initial,
+        min_slots=1,
+        max_slots=None,
+        interval=DEFAULT_INTERVAL,
+        cooldown=DEFAULT_COOLDOWN,
+        probe=None,
+        clock=time.monotonic,
+        on_change=None,
+    ):
+        self.min_slots = max(1, min_slots)
+        self.max_slots = max(self.min_slots, max_slots or initial * 2)
+        self.slots = min(max(initial, self.min_slots), self.max_slots)
+        self.interval = interval
+        self.cooldown = cooldown
+        self.probe = probe or (lambda: (cpu_load(), memory_available()))
+        self.clock = clock
+        self.on_change = on_change
+        self._rate_limits = 0
+        self._hold_until = 0.0
+        self._last_update = None
+        self.history = []
+
+    def record_rate_limit(self):
+        """Note that an agent hit the runtime's rate limit."""
+        self._rate_limits += 1
+
+    def update(self, queue_depth):
+        """
+        Return the slot count to use now.
+
+        `queue_depth` is the number of ready items waiting for a slot.
+        Decisions are made at most once per interval.
+        """
+        now = self.clock()
+        if self._last_update is not None and now - self._last_update < self.interval:
+            return self.slots
+        self._last_update = now
+        load, memory = self.probe()
+        slots, reason = self.slots, None
+
+        if self._rate_limits:
+            slots = max(self.min_slots, self.slots // 2)
+            reason = f"{self._rate_limits} rate-limit error(s)"
+            self._rate_limits = 0
+            self._hold_until = now + self.cooldown
+        elif memory is not None and memory < MEMORY_LOW:
+            slots, reason = self.slots - 1, f"memory available {memory:.0%}"
+        elif load is not None and load > LOAD_HIGH:
+            slots, reason = self.slots - 1, f"load {load:.2f}/cpu"
+        elif (
+            queue_depth > 0
+            and now >= self._hold_until
+            and (load is None or load < LOAD_LOW)
+            and (memory is None or memory > MEMORY_OK)
+        ):
+            slots, reason = self.slots + 1, f"{queue_depth} item(s) waiting"
+
+        slots = min(max(slots, self.min_slots), self.max_slots)
+        if slots != self.slots:
+            self.history.append(
+                {"at": now, "from": self.slots, "to": slots, "reason": reason}
+            )
+            if self.on_change is not None:
+                self.on_change(self.slots, slots, reason)
+            self.slots = slots
+        return self.slots
+
+
+class TimeoutPolicy:
+    """Per-item agent timeouts from historical completed-run durations."""
+
+    def __init__(self, rows, default_ms, floor_ms=None, ceiling_ms=None):
+        self.default_ms = default_ms
+        self.floor_ms = floor_ms if floor_ms is not None else default_ms // 4
+        self.ceiling_ms = ceiling_ms if ceiling_ms is not None else default_ms * 2
+        self.by_item, self.by_tier, self.all = {}, {}, []
+        for row in rows:
+            if row["status"] != "completed" or not row["duration_ms"]:
+                continue
+            self.by_item.setdefault(row["item"], []).append(row["duration_ms"])
+            self.by_tier.setdefault(row["tier"], []).append(row["duration_ms"])
+            self.all.append(row["duration_ms"])
+
+    @classmethod
+    def from_history(cls, default_ms, **kwargs):
+        """Build a policy from every session under .processor/."""
+        store = monitor.SessionStore()
+        store.refresh()
+        return cls(store.rows(), default_ms, **kwargs)
+
+    def base_ms(self, item):
+        """Return (timeout before escalation, where it came from)."""
+        if self.by_item.get(item.id):
+            return max(self.by_item[item.id]) * MARGIN, "item"
+        tier = self.by_tier.get(item.tier, [])
+        if len(tier) >= MIN_SAMPLES:
+            return monitor.percentile(tier, 0.95) * MARGIN, "tier p95"
+        if len(self.all) >= MIN_SAMPLES:
+            return monitor.percentile(self.all, 0.95) * MARGIN, "global p95"
+        return self.default_ms, "default"
+
+    def timeout_for(self, item, timeouts=0):
+        """Timeout in ms for an item that has already timed out `timeouts` times."""
+        base, _ = self.base_ms(item)
+        timeout = base * ESCALATION**timeouts
+        return int(min(max(timeout, self.floor_ms), self.ceiling_ms))
@@ -0,0 +1,234 @@
+"""
+Run a single checklist item through the agent runtime.
+
+Renders agent-resources/prompts/AGENT_SYSTEM_PROMPT.md for the item and
+invokes the opencode or claude-code CLI non-interactively, writing the
+session to runs/<tier>/<ITEM>/results/agent-<ITEM>-<ms>.log in the same
+format the processor uses.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from harness.adaptive import is_rate_limit
+from harness.checklist import CHECKLIST_PATH
+from harness.logindex import strip_ansi
+from harness.paths import REPO_ROOT
+from harness.usage import Usage, UsageMeter
+
+COMPLETION_MARKER = "ITEM_COMPLETE"
+MISSION_BRIEF_PATH = REPO_ROOT / "SUT-PACKET.md"
+
+# Agents print long tool outputs on a single line
+STREAM_LIMIT = 1 << 20
+
+# Processes started by run_agent(), so a signal handler can stop them
+_active_processes = set()
+
+
+@dataclass
+class AgentResult:
+    """Outcome of one agent attempt."""
+
+    item_id: str
+    attempt: int
+    returncode: int
+    duration_ms: float
+    log_path: str
+    completed: bool
+    timed_out: bool = False
+    rate_limited: bool = False
+    usage: Usage = None
+
+
+class CompletionTracker:
+    """
+    Decide from an agent run's stdout whether the agent finished the item.
+
+    Only the agent's final text counts, and only when its last line is
+    COMPLETION_MARKER: stdout also echoes tool output and file contents,
+    so a `cat` of this prompt or of an old log must not complete an item.
+    With JSON events the final text is claude-code's `result` event or
+    opencode's last `text` part; in text output it is the last line
+    printed, since tool output comes before the answer.
+    """
+
+    def __init__(self, json_events=False):
+        self.json_events = json_events
+        self.final_text = ""
+
+    def feed(self, line):
+        line = strip_ansi(line).strip()
+        if not self.json_events:
+            if line:
+                self.final_text = line
+            return
+        if not line.startswith("{"):
+            return
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+        if event.get("type") == "result":
+            result = event.get("result")
+            error = event.get("is_error")
+            self.final_text = result if isinstance(result, str) and not error else ""
+        elif event.get("type") == "text":
+            text = (event.get("part") or {}).get("text")
+            if isinstance(text, str) and text.strip():
+                self.final_text = text
+
+    @property
+    def completed(self):
+        lines = [line for line in self.final_text.splitlines() if line.strip()]
+        return bool(lines) and lines[-1].strip(" `*") == COMPLETION_MARKER
+
+
+def render_prompt(item, agent_resources_dir):
+    """Fill the agent system prompt placeholders for an item."""
+    template = (agent_resources_dir / "prompts" / "AGENT_SYSTEM_PROMPT.md").read_text()
+    values = {
+        "ENTRY_ID": item.id,
+        "ENTRY_TITLE": item.target,
+        "PRIORITY": item.priority,
+        "RISK_CLASS": item.risk,
+        "CHECKLIST_FILE": str(CHECKLIST_PATH),
+        "MISSION_BRIEF": str(MISSION_BRIEF_PATH),
+        "RUN_DIR": str(item.run_dir),
+    }
+    for key, value in values.items():
+        template = template.replace("{{" + key + "}}", value)
+    return template
+
+
+def build_command(runtime, prompt, model=None, json_events=False):
+    """
+    Return the argv for a non-interactive agent invocation.
+
+    With `json_events` the runtime prints JSON events, which carry token
+    usage, instead of formatted text.
+    """
+    if runtime == "claude-code":
+        cmd = ["claude", "-p", prompt, "--dangerously-skip-permissions"]
+        if json_events:
+            cmd += ["--output-format", "stream-json", "--verbose"]
+    else:
+        cmd = ["opencode", "run", prompt]
+        if json_events:
+            cmd += ["--format", "json"]
+    if model:
+        cmd += ["--model", model]
+    return cmd
+
+
+async def run_agent(
+    item,
+    agent_resources_dir,
+    runtime="opencode",
+    model=None,
+    timeout_ms=600000,
+    attempt=1,
+    on_start=None,
+    json_events=False,
+):
+    """
+    Run one agent attempt for an item and return an AgentResult.
+
+    `on_start(pid, log_path)` is called once the runtime process exists.
+    The result's `usage` holds tool calls, and tokens when `json_events`.
+    """
+    results_dir = item.run_dir / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    log_path = results_dir / f"agent-{item.id}-{int(time.time() * 1000)}.log"
+
+    header = (
+        f"=== Agent Run: {item.id} ===\n"
+        f"Started: {datetime.now().isoformat()}\n"
+        f"Runtime: {runtime}\n"
+        f"Model: {model or 'default'}\n"
+        f"Timeout: {timeout_ms}ms ({timeout_ms // 1000}s)\n"
+        f"Attempt: {attempt}\n"
+        f"{'=' * 50}\n\n"
+    )
+
+    prompt = render_prompt(item, agent_resources_dir)
+    start = time.perf_counter()
+    timed_out = False
+    rate_limited = False
+    meter = UsageMeter()
+    tracker = CompletionTracker(json_events)
+
+    with open(log_path, "w") as log:
+        log.write(header)
+        log.flush()
+        proc = await asyncio.create_subprocess_exec(
+            *build_command(runtime, prompt, model, json_events),
+            cwd=REPO_ROOT,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            # Kept apart so tool output on stdout can't look like a runtime error
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            limit=STREAM_LIMIT,
+        )
+        _active_processes.add(proc)
+        if on_start is not None:
+            on_start(proc.pid, str(log_path))
+
+        async def pump(stream, stderr):
+            nonlocal rate_limited
+            async for raw in stream:
+                line = raw.decode(errors="replace")
+                rate_limited = rate_limited or is_rate_limit(line, stderr)
+                if not stderr:
+                    tracker.feed(line)
+                    meter.feed(line)
+                log.write(line)
+                log.flush()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(pump(proc.stdout, False), pump(proc.stderr, True)),
+                timeout=timeout_ms / 1000,
+            )
+            await proc.wait()
+        except asyncio.TimeoutError:
+            timed_out = True
+            terminate(proc)
+            await proc.wait()
+            log.write(f"\n=== Timed out after {timeout_ms}ms ===\n")
+        finally:
+            _active_processes.discard(proc)
+
+    return AgentResult(
+        item_id=item.id,
+        attempt=attempt,
+        returncode=proc.returncode,
+        duration_ms=round((time.perf_counter() - start) * 1000, 1),
+        log_path=str(log_path),
+        completed=tracker.completed and proc.returncode == 0,
+        timed_out=timed_out,
+        rate_limited=rate_limited,
+        usage=meter.usage,
+    )
+
+
+def terminate(proc):
+    """Kill an agent process and everything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def terminate_all():
+    """Kill every agent process started by run_agent()."""
+    for proc in list(_active_processes):
+        terminate(proc)
@@ -0,0 +1,18 @@
+"""
+Tier 19 (Performance & Scale) benchmark suite.
+
+The same workload is driven through every SDK so numbers are comparable:
+
+- python:     harness.benchmarks.python_driver (the `ucp` module)
+- javascript: drivers/bench.js (the `ucp-content` package)
+- rust:       drivers/rust (the `ucp-api` crate, built via the shared cache)
+- cli:        harness.benchmarks.cli_driver (the `ucp` binary)
+
+Each driver prints one JSON report of raw nanosecond samples; statistics,
+PRF budgets and baseline comparison are computed here in one place.
+
+Usage:
+    python -m harness.benchmarks                          # python, 1K + 10K
+    python -m harness.benchmarks --platforms all --sizes 1000,10000,100000
+    python -m harness.benchmarks --update-baseline        # record new baselines
+"""
@@ -0,0 +1,187 @@
+"""Command-line entry point: python -m harness.benchmarks."""
+
+import argparse
+import json
+import sys
+
+from harness.benchmarks import memory
+from harness.benchmarks.suite import (
+    ALL_SIZES,
+    DEFAULT_MAX_SECONDS,
+    DEFAULT_REPEAT,
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    DEFAULT_WARMUP,
+    PLATFORMS,
+    TIER_DIR,
+    case_results,
+    check_budgets,
+    compare,
+    load_baseline,
+    run_driver,
+    save_baseline,
+    write_results,
+)
+from harness.budgets import BudgetPolicy
+from harness.checklist import parse_checklist
+
+
+def parse_list(value, choices, everything):
+    if value == "all":
+        return list(everything)
+    values = [v for v in value.split(",") if v]
+    unknown = [v for v in values if choices is not None and v not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown value(s): {', '.join(unknown)}")
+    return values
+
+
+def profile_memory(platforms, sizes):
+    """Run every driver once per size in --memory mode; write PRF-008 results."""
+    platform_steps = {}
+    for platform in platforms:
+        print(f"Profiling {platform} memory...", flush=True)
+        steps = []
+        for size in sizes:
+            try:
+                report = run_driver(platform, [size], 0, 0, 0, memory=True)
+            except Exception as e:
+                print(f"  {platform} @{size}: {e}")
+                break
+            steps.extend(report.get("memory", []))
+        if steps:
+            platform_steps[platform] = steps
+
+    profile = memory.profile(platform_steps, memory.load_sample())
+    results_dir = TIER_DIR / "PRF-008" / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    (results_dir / "memory_profile.json").write_text(json.dumps(profile, indent=2))
+    report = memory.format_profile(profile)
+    (results_dir / "memory_profile.md").write_text(report)
+    print(report)
+    print(f"Memory profile: {results_dir / 'memory_profile.md'}")
+
+    superlinear = [p for p, data in profile["platforms"].items() if data["superlinear"]]
+    for platform in superlinear:
+        print(f"SUPERLINEAR memory growth: {platform}")
+    if not platform_steps:
+        return 2
+    return 1 if superlinear else 0
+
+
+def main(argv=None):
+    """Run the benchmark drivers, check budgets and compare to baselines."""
+    parser = argparse.ArgumentParser(description="Tier 19 UCP benchmark suite")
+    parser.add_argument(
+        "--platforms",
+        default="python",
+        type=lambda v: parse_list(v, PLATFORMS, PLATFORMS),
+        help=f"Comma-separated subset of {', '.join(PLATFORMS)}, or 'all'",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(size) for size in parse_list(v, None, ALL_SIZES)],
+        help="Comma-separated block counts, or 'all' for 1K..1M "
+        f"(default: {DEFAULT_SIZES}, or {memory.MEMORY_SIZES} with --memory)",
+    )
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=DEFAULT_MAX_SECONDS,
+        help="Time spent per case before repetition stops early",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed median slowdown versus baseline (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Profile memory growth per size (PRF-008) instead of latency",
+    )
+    parser.add_argument(
+        "--config",
+        help="Run config whose success_criteria override the PRF budgets "
+        "(default: config/run_config.json, else the template)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        return profile_memory(args.platforms, args.sizes or memory.MEMORY_SIZES)
+    args.sizes = args.sizes or DEFAULT_SIZES
+
+    reports, results = [], []
+    for platform in args.platforms:
+        print(f"Running {platform} driver...", flush=True)
+        try:
+            report = run_driver(
+                platform, args.sizes, args.warmup, args.repeat, args.max_seconds
+            )
+        except Exception as e:
+            print(f"  {platform}: {e}")
+            continue
+        reports.append(report)
+        results.extend(case_results(report))
+
+    for result in results:
+        if result.stats is None:
+            print(f"  {result.platform:10} {result.key:22} skipped: {result.error}")
+        else:
+            print(f"  {result.platform:10} {result.key:22} {result.stats.describe()}")
+
+    budgets = BudgetPolicy.from_config(args.config).benchmark_budgets(
+        parse_checklist()
+    )
+    violations = check_budgets(results, budgets)
+    for budget, result in violations:
+        print(
+            f"BUDGET {budget.item_id} ({result.platform}): {result.key} p50 "
+            f"{result.stats.p50_ns / 1e6:.1f}ms > {budget.limit_ms:g}ms"
+        )
+
+    regressions, seeded = [], []
+    if args.update_baseline:
+        for report in reports:
+            path = save_baseline(report["platform"], results, report.get("sdk_version"))
+            print(f"Baseline written: {path}")
+    else:
+        baselines = {
+            report["platform"]: load_baseline(report["platform"]) for report in reports
+        }
+        # No recorded baseline yet: this run seeds it, and is not compared
+        for report in reports:
+            platform = report["platform"]
+            if not baselines[platform]:
+                path = save_baseline(platform, results, report.get("sdk_version"))
+                seeded.append(platform)
+                print(
+                    f"No {platform} baseline: seeded {path} from this run "
+                    "(no regression check; commit it from the reference machine)"
+                )
+        regressions = compare(results, baselines, args.threshold)
+        for result, baseline, ratio in regressions:
+            print(
+                f"REGRESSION {result.platform} {result.key}: "
+                f"{ratio:.2f}x baseline median"
+            )
+
+    report_path = write_results(
+        results, reports, violations, regressions, args.threshold, seeded
+    )
+    print(f"Report: {report_path}")
+    if not reports:
+        return 2
+    return 1 if violations or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
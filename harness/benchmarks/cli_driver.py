@@ -0,0 +1,212 @@
+"""
+`ucp` CLI driver for the Tier 19 benchmark suite.
+
+The CLI works on JSON files, so every sample includes process start-up and
+loading the document; compare CLI numbers with each other and with their
+baseline rather than with the in-process SDKs. Blocks are created with one
+`ucp ucl exec` script, which cannot address blocks it creates, so the CLI
+document is flat: sections, tagged code blocks and paragraphs all sit
+directly under the root. find_by_type and from_json are reported as
+unsupported: the CLI has no type filter, and no command only loads a
+document.
+
+In `--memory` mode the reported RSS is the peak of the `ucp ucl exec`
+process that builds the document.
+
+Usage:
+    python -m harness.benchmarks.cli_driver --sizes 1000,10000
+    python -m harness.benchmarks.cli_driver --sizes 100000 --memory
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness.benchmarks.suite import (
+    BENCH_TAG,
+    UCL_COMMANDS,
+    block_kind,
+    parse_driver_args,
+    sample,
+)
+from harness.fingerprint import sdk_versions
+
+
+def ucp(*args):
+    """Run a ucp subcommand and return its stdout, raising on failure."""
+    proc = subprocess.run(["ucp", *args], capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ucp {args[0]} exited {proc.returncode}: {proc.stderr}")
+    return proc.stdout
+
+
+def peak_rss(*args):
+    """Run a ucp subcommand and return its peak RSS in bytes."""
+    # stderr goes to a file: a pipe nobody reads until wait4 returns would
+    # block a child that writes more than the pipe buffer holds
+    with tempfile.TemporaryFile() as errors:
+        proc = subprocess.Popen(
+            ["ucp", *args], stdout=subprocess.DEVNULL, stderr=errors
+        )
+        _, status, usage = os.wait4(proc.pid, 0)
+        # wait4 reaped the child; stop Popen from waiting on it again
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        errors.seek(0)
+        stderr = errors.read().decode(errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"ucp {args[0]} exited {proc.returncode}: {stderr}")
+    # ru_maxrss is in KiB on Linux
+    return usage.ru_maxrss * 1024
+
+
+def root_id(doc_path):
+    info = json.loads(ucp("info", "--input", str(doc_path), "--format", "json"))
+    return info["root"]
+
+
+def build_script(root, size):
+    """Return the UCL script that appends the benchmark blocks."""
+    lines = []
+    for index in range(size):
+        kind = block_kind(index)
+        if kind == "section":
+            lines.append(
+                f'APPEND {root} text WITH role="heading2" :: "Section {index}"'
+            )
+        elif kind == "code":
+            lines.append(
+                f'APPEND {root} code WITH tags=["{BENCH_TAG}"] '
+                f':: "value_{index} = {index}"'
+            )
+        else:
+            lines.append(
+                f'APPEND {root} text WITH role="paragraph" :: "Paragraph {index}"'
+            )
+    return "\n".join(lines) + "\n"
+
+
+def cases(workdir, size):
+    """Yield (operation, zero-argument callable) pairs for one size."""
+    empty = workdir / "empty.json"
+    doc = workdir / f"doc-{size}.json"
+    scratch = workdir / "scratch.json"
+    ucp("create", "--title", "Benchmark", "--output", str(empty))
+    root = root_id(empty)
+    build = workdir / f"build-{size}.ucl"
+    build.write_text(build_script(root, size))
+    commands = workdir / "commands.ucl"
+    commands.write_text(
+        "".join(
+            f'APPEND {root} text :: "UCL command {index}"\n'
+            for index in range(UCL_COMMANDS)
+        )
+    )
+
+    def create(output):
+        ucp(
+            "ucl",
+            "exec",
+            "--file",
+            str(build),
+            "--input",
+            str(empty),
+            "--output",
+            str(output),
+        )
+
+    create(doc)
+    yield "create", lambda: create(scratch)
+    yield "find_by_tag", lambda: ucp("find", "--input", str(doc), "--tag", BENCH_TAG)
+    yield "to_json", lambda: ucp("export", "json", "--input", str(doc))
+    yield "validate", lambda: ucp("validate", "--input", str(doc))
+    yield "execute_ucl", lambda: ucp(
+        "ucl",
+        "exec",
+        "--file",
+        str(commands),
+        "--input",
+        str(doc),
+        "--output",
+        str(scratch),
+    )
+
+
+def memory_step(workdir, size):
+    """Build one document with the CLI and report its peak RSS."""
+    empty = workdir / "empty.json"
+    doc = workdir / f"doc-{size}.json"
+    ucp("create", "--title", "Benchmark", "--output", str(empty))
+    build = workdir / f"build-{size}.ucl"
+    build.write_text(build_script(root_id(empty), size))
+    rss = peak_rss(
+        "ucl",
+        "exec",
+        "--file",
+        str(build),
+        "--input",
+        str(empty),
+        "--output",
+        str(doc),
+    )
+    return {
+        "size": size,
+        "rss_bytes": rss,
+        "heap_bytes": None,
+        "peak_bytes": None,
+        "json_bytes": doc.stat().st_size,
+    }
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_driver_args("Benchmark the ucp CLI", argv)
+    report = {
+        "platform": "cli",
+        "sdk_version": sdk_versions()["ucp-cli"],
+        "cases": [],
+    }
+    with tempfile.TemporaryDirectory(prefix="ucp-bench-") as tmp:
+        if args.memory:
+            report["memory"] = [memory_step(Path(tmp), size) for size in args.sizes]
+            print(json.dumps(report))
+            return 0
+        for size in args.sizes:
+            try:
+                size_cases = list(cases(Path(tmp), size))
+            except Exception as e:
+                report["cases"].append(
+                    {"operation": "create", "size": size, "error": str(e)}
+                )
+                continue
+            for operation, fn in size_cases:
+                case = {"operation": operation, "size": size}
+                try:
+                    case["samples_ns"] = sample(
+                        fn,
+                        args.warmup,
+                        args.repeat,
+                        args.max_seconds,
+                        time.perf_counter_ns,
+                    )
+                except Exception as e:
+                    case["error"] = str(e)
+                report["cases"].append(case)
+            # Every CLI command loads the document; none only deserializes it
+            for operation in ("find_by_type", "from_json"):
+                report["cases"].append(
+                    {
+                        "operation": operation,
+                        "size": size,
+                        "error": "not supported by the CLI",
+                    }
+                )
+    print(json.dumps(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+/**
+ * JavaScript SDK driver for the Tier 19 benchmark suite.
+ *
+ * Builds the same document and runs the same operations as
+ * harness/benchmarks/python_driver.py; see harness/benchmarks/suite.py for
+ * the workload and the JSON report format printed on stdout.
+ *
+ * Usage: node bench.js --sizes 1000,10000 --warmup 2 --repeat 15 --max-seconds 30
+ *        node --expose-gc bench.js --sizes 100000 --memory
+ */
+
+const ucp = require('ucp-content');
+
+// Keep in sync with harness/benchmarks/suite.py
+const SECTION_SIZE = 100;
+const TAG_EVERY = 10;
+const BENCH_TAG = 'bench';
+const UCL_COMMANDS = 100;
+const MIN_SAMPLES = 3;
+
+function parseArgs(argv) {
+    const args = { sizes: [1000, 10000], warmup: 2, repeat: 15, maxSeconds: 30, memory: false };
+    for (let i = 0; i < argv.length; i += 2) {
+        const value = argv[i + 1];
+        switch (argv[i]) {
+            case '--memory': args.memory = true; i -= 1; break;
+            case '--sizes': args.sizes = value.split(',').filter(Boolean).map(Number); break;
+            case '--warmup': args.warmup = Number(value); break;
+            case '--repeat': args.repeat = Number(value); break;
+            case '--max-seconds': args.maxSeconds = Number(value); break;
+            default: throw new Error(`Unknown argument: ${argv[i]}`);
+        }
+    }
+    return args;
+}
+
+function blockKind(index) {
+    if (index % SECTION_SIZE === 0) return 'section';
+    if (index % TAG_EVERY === 0) return 'code';
+    return 'paragraph';
+}
+
+function buildDocument(size) {
+    const doc = ucp.createDocument('Benchmark');
+    const root = doc.rootId;
+    let section = root;
+    for (let index = 0; index < size; index++) {
+        const kind = blockKind(index);
+        if (kind === 'section') {
+            section = doc.addBlock(root, `Section ${index}`, 'heading2');
+        } else if (kind === 'code') {
+            const blockId = doc.addCode(section, 'python', `value_${index} = ${index}`);
+            doc.addTag(blockId, BENCH_TAG);
+        } else {
+            doc.addBlock(section, `Paragraph ${index}`, 'paragraph');
+        }
+    }
+    return doc;
+}
+
+function* cases(size) {
+    const doc = buildDocument(size);
+    const payload = JSON.stringify(doc.toJson());
+    const root = doc.rootId;
+
+    yield ['create', () => buildDocument(size)];
+    yield ['find_by_tag', () => doc.findByTag(BENCH_TAG)];
+    yield ['find_by_type', () => doc.findByType('code')];
+    yield ['to_json', () => JSON.stringify(doc.toJson())];
+    yield ['from_json', () => ucp.Document.fromJson(payload)];
+    yield ['validate', () => doc.validate()];
+    // Grows the document, so it runs after the read-only cases
+    yield ['execute_ucl', () => {
+        for (let index = 0; index < UCL_COMMANDS; index++) {
+            ucp.executeUcl(doc, `APPEND ${root} text :: "UCL command ${index}"`);
+        }
+    }];
+}
+
+function sample(fn, warmup, repeat, maxSeconds) {
+    for (let i = 0; i < warmup; i++) fn();
+    const samples = [];
+    let spent = 0n;
+    while (samples.length < repeat) {
+        const start = process.hrtime.bigint();
+        fn();
+        const elapsed = process.hrtime.bigint() - start;
+        samples.push(Number(elapsed));
+        spent += elapsed;
+        if (spent >= BigInt(Math.round(maxSeconds * 1e9)) && samples.length >= MIN_SAMPLES) break;
+    }
+    return samples;
+}
+
+function collect() {
+    if (global.gc) global.gc();
+}
+
+function memoryStep(size) {
+    collect();
+    const before = process.memoryUsage();
+    const doc = buildDocument(size);
+    collect();
+    const after = process.memoryUsage();
+    return {
+        size,
+        rss_bytes: after.rss - before.rss,
+        heap_bytes: after.heapUsed - before.heapUsed + (after.external - before.external),
+        // V8 does not expose a per-step peak
+        peak_bytes: null,
+        json_bytes: Buffer.byteLength(JSON.stringify(doc.toJson())),
+    };
+}
+
+function main() {
+    const args = parseArgs(process.argv.slice(2));
+    let sdkVersion = null;
+    try {
+        sdkVersion = require('ucp-content/package.json').version;
+    } catch (e) {
+        // Version is informational only
+    }
+    const report = { platform: 'javascript', sdk_version: sdkVersion, cases: [] };
+    if (args.memory) {
+        report.memory = args.sizes.map(memoryStep);
+        console.log(JSON.stringify(report));
+        return;
+    }
+    for (const size of args.sizes) {
+        for (const [operation, fn] of cases(size)) {
+            const result = { operation, size };
+            try {
+                result.samples_ns = sample(fn, args.warmup, args.repeat, args.maxSeconds);
+            } catch (e) {
+                result.error = `${e.name}: ${e.message}`;
+            }
+            report.cases.push(result);
+            console.error(`javascript ${operation}@${size} done`);
+        }
+    }
+    console.log(JSON.stringify(report));
+}
+
+main();
@@ -0,0 +1,219 @@
+//! Rust SDK driver for the Tier 19 benchmark suite.
+//!
+//! Builds the same document and runs the same operations as
+//! harness/benchmarks/python_driver.py; see harness/benchmarks/suite.py for
+//! the workload and the JSON report format printed on stdout.
+
+use std::alloc::{GlobalAlloc, Layout, System};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::Instant;
+
+use serde_json::{json, Value};
+use ucm_core::{Block, Content, Document};
+use ucp_api::UcpClient;
+
+// Keep in sync with harness/benchmarks/suite.py
+const SECTION_SIZE: usize = 100;
+const TAG_EVERY: usize = 10;
+const BENCH_TAG: &str = "bench";
+const UCL_COMMANDS: usize = 100;
+const MIN_SAMPLES: usize = 3;
+
+/// System allocator that tracks live and peak heap bytes for `--memory`.
+struct CountingAllocator;
+
+static LIVE_BYTES: AtomicUsize = AtomicUsize::new(0);
+static PEAK_BYTES: AtomicUsize = AtomicUsize::new(0);
+
+unsafe impl GlobalAlloc for CountingAllocator {
+    unsafe fn alloc(&self, layout: Layout) -> *mut u8 {
+        let ptr = System.alloc(layout);
+        if !ptr.is_null() {
+            let live = LIVE_BYTES.fetch_add(layout.size(), Ordering::Relaxed) + layout.size();
+            PEAK_BYTES.fetch_max(live, Ordering::Relaxed);
+        }
+        ptr
+    }
+
+    unsafe fn dealloc(&self, ptr: *mut u8, layout: Layout) {
+        System.dealloc(ptr, layout);
+        LIVE_BYTES.fetch_sub(layout.size(), Ordering::Relaxed);
+    }
+}
+
+#[global_allocator]
+static ALLOCATOR: CountingAllocator = CountingAllocator;
+
+struct Args {
+    sizes: Vec<usize>,
+    warmup: usize,
+    repeat: usize,
+    max_seconds: f64,
+    memory: bool,
+}
+
+fn parse_args() -> Args {
+    let mut args = Args {
+        sizes: vec![1000, 10000],
+        warmup: 2,
+        repeat: 15,
+        max_seconds: 30.0,
+        memory: false,
+    };
+    let mut argv = std::env::args().skip(1);
+    while let Some(flag) = argv.next() {
+        if flag == "--memory" {
+            args.memory = true;
+            continue;
+        }
+        let value = argv.next().unwrap_or_default();
+        match flag.as_str() {
+            "--sizes" => {
+                args.sizes = value
+                    .split(',')
+                    .filter(|s| !s.is_empty())
+                    .map(|s| s.parse().expect("invalid size"))
+                    .collect()
+            }
+            "--warmup" => args.warmup = value.parse().expect("invalid --warmup"),
+            "--repeat" => args.repeat = value.parse().expect("invalid --repeat"),
+            "--max-seconds" => args.max_seconds = value.parse().expect("invalid --max-seconds"),
+            other => panic!("Unknown argument: {}", other),
+        }
+    }
+    args
+}
+
+fn build_document(client: &UcpClient, size: usize) -> Document {
+    let mut doc = client.create_document();
+    let root = doc.root.clone();
+    let mut section = root.clone();
+    for index in 0..size {
+        if index % SECTION_SIZE == 0 {
+            let block = Block::new(Content::text(&format!("Section {}", index)), Some("heading2"));
+            section = doc.add_block(block, &root).expect("add section");
+        } else if index % TAG_EVERY == 0 {
+            let code = format!("value_{} = {}", index, index);
+            let block = Block::new(Content::code("python", &code), Some("code")).with_tag(BENCH_TAG);
+            doc.add_block(block, &section).expect("add code");
+        } else {
+            let block = Block::new(Content::text(&format!("Paragraph {}", index)), Some("paragraph"));
+            doc.add_block(block, &section).expect("add paragraph");
+        }
+    }
+    doc
+}
+
+fn rss_bytes() -> Option<i64> {
+    // VmRSS is in kB whatever the page size (statm counts pages)
+    let status = std::fs::read_to_string("/proc/self/status").ok()?;
+    let line = status.lines().find(|line| line.starts_with("VmRSS:"))?;
+    let kib: i64 = line.split_whitespace().nth(1)?.parse().ok()?;
+    Some(kib * 1024)
+}
+
+fn memory_step(client: &UcpClient, size: usize) -> Value {
+    let rss_before = rss_bytes();
+    let live_before = LIVE_BYTES.load(Ordering::Relaxed);
+    PEAK_BYTES.store(live_before, Ordering::Relaxed);
+    let doc = build_document(client, size);
+    let heap = LIVE_BYTES.load(Ordering::Relaxed).saturating_sub(live_before);
+    let peak = PEAK_BYTES.load(Ordering::Relaxed).saturating_sub(live_before);
+    let rss = match (rss_before, rss_bytes()) {
+        (Some(before), Some(after)) => Some(after - before),
+        _ => None,
+    };
+    let json_bytes = client.to_json(&doc).map(|s| s.len()).ok();
+    json!({
+        "size": size,
+        "rss_bytes": rss,
+        "heap_bytes": heap,
+        "peak_bytes": peak,
+        "json_bytes": json_bytes,
+    })
+}
+
+fn sample<F: FnMut()>(mut f: F, args: &Args) -> Vec<u128> {
+    for _ in 0..args.warmup {
+        f();
+    }
+    let mut samples = Vec::new();
+    let mut spent = 0u128;
+    while samples.len() < args.repeat {
+        let start = Instant::now();
+        f();
+        let elapsed = start.elapsed().as_nanos();
+        samples.push(elapsed);
+        spent += elapsed;
+        if spent as f64 >= args.max_seconds * 1e9 && samples.len() >= MIN_SAMPLES {
+            break;
+        }
+    }
+    samples
+}
+
+fn main() {
+    let args = parse_args();
+    let client = UcpClient::new();
+    let mut cases: Vec<Value> = Vec::new();
+
+    if args.memory {
+        let steps: Vec<Value> = args
+            .sizes
+            .iter()
+            .map(|&size| memory_step(&client, size))
+            .collect();
+        let report = json!({
+            "platform": "rust",
+            "sdk_version": Value::Null,
+            "cases": cases,
+            "memory": steps,
+        });
+        println!("{}", report);
+        return;
+    }
+
+    for &size in &args.sizes {
+        let mut doc = build_document(&client, size);
+        let root = doc.root.clone();
+        let mut record = |operation: &str, samples: Vec<u128>| {
+            cases.push(json!({"operation": operation, "size": size, "samples_ns": samples}));
+            eprintln!("rust {}@{} done", operation, size);
+        };
+
+        record("create", sample(|| drop(build_document(&client, size)), &args));
+        record("find_by_tag", sample(|| drop(doc.indices.find_by_tag(BENCH_TAG)), &args));
+        record("find_by_type", sample(|| drop(doc.indices.find_by_type("code")), &args));
+        record("to_json", sample(|| drop(client.to_json(&doc)), &args));
+        record("validate", sample(|| drop(doc.validate()), &args));
+        // Grows the document, so it runs after the read-only cases
+        record(
+            "execute_ucl",
+            sample(
+                || {
+                    for index in 0..UCL_COMMANDS {
+                        let command = format!("APPEND {} text :: \"UCL command {}\"", root, index);
+                        client.execute_ucl(&mut doc, &command).expect("execute UCL");
+                    }
+                },
+                &args,
+            ),
+        );
+        // ucp-api has no document loader and ucm-core's Document is not
+        // Deserialize; parsing into serde_json::Value would time generic JSON
+        cases.push(json!({
+            "operation": "from_json",
+            "size": size,
+            "error": "unsupported: no Rust document deserializer",
+        }));
+        eprintln!("rust from_json@{} unsupported", size);
+    }
+
+    let report = json!({
+        "platform": "rust",
+        // Resolved ucp-api version is read from Cargo.lock by the harness
+        "sdk_version": Value::Null,
+        "cases": cases,
+    });
+    println!("{}", report);
+}
@@ -0,0 +1,193 @@
+"""
+Memory profiling for PRF-008 ("memory usage scales linearly with blocks").
+
+Each size step runs in a fresh driver process so allocator state from a
+previous step cannot hide or inflate the next one. Per platform and step:
+
+- python:     RSS growth while building, plus tracemalloc current/peak
+              (tracemalloc only sees the Python allocator, not the native
+              document, so RSS is the number that matters for `ucp`)
+- javascript: process.memoryUsage() rss and heapUsed growth after gc()
+- rust:       live and peak heap bytes from a counting global allocator
+- cli:        peak RSS of the `ucp ucl exec` process that builds the document
+
+A least-squares line through (blocks, bytes) gives the bytes-per-block
+cost. Growth is flagged superlinear when the marginal cost of the last
+step exceeds that of the first by SUPERLINEAR_RATIO.
+
+The serialized field breakdown attributes every block's JSON bytes to its
+id, content, content_hash, timestamps, version record and JSON framing,
+using the `json` document dump at the repository root by default.
+"""
+
+import json
+from pathlib import Path
+
+from harness.paths import REPO_ROOT
+
+SAMPLE_DOCUMENT = REPO_ROOT / "json"
+MEMORY_SIZES = (1000, 10000, 100000)
+EXTRAPOLATE_TO = 1_000_000
+
+# Last-step marginal bytes/block over first-step marginal bytes/block
+SUPERLINEAR_RATIO = 1.5
+
+# Metrics reported by drivers; json_bytes is shown but never flags growth
+METRICS = ("rss_bytes", "peak_bytes", "heap_bytes", "json_bytes")
+
+
+def fit_line(points):
+    """Return (slope, intercept, r_squared) of a least-squares fit."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    if sxx == 0:
+        return 0.0, mean_y, 0.0
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for _, y in points)
+    ss_res = sum((y - (slope * x + intercept)) ** 2 for x, y in points)
+    r_squared = 1 - ss_res / ss_tot if ss_tot else 1.0
+    return slope, intercept, r_squared
+
+
+def marginal_costs(points):
+    """Bytes per added block between consecutive size steps."""
+    ordered = sorted(points)
+    return [
+        (y2 - y1) / (x2 - x1)
+        for (x1, y1), (x2, y2) in zip(ordered, ordered[1:])
+        if x2 != x1
+    ]
+
+
+def growth_curve(steps, metric):
+    """
+    Summarize one metric across size steps, or None without enough data.
+
+    Returns a dict with bytes_per_block, intercept_bytes, r_squared,
+    marginal bytes/block per step, the projected cost at EXTRAPOLATE_TO
+    blocks and whether growth looks superlinear.
+    """
+    points = [
+        (step["size"], step[metric]) for step in steps if step.get(metric) is not None
+    ]
+    if len(points) < 2:
+        return None
+    slope, intercept, r_squared = fit_line(points)
+    marginals = marginal_costs(points)
+    superlinear = (
+        len(marginals) >= 2
+        and marginals[0] > 0
+        and marginals[-1] > marginals[0] * SUPERLINEAR_RATIO
+    )
+    return {
+        "metric": metric,
+        "bytes_per_block": round(slope, 1),
+        "intercept_bytes": round(intercept),
+        "r_squared": round(r_squared, 4),
+        "marginal_bytes_per_block": [round(m, 1) for m in marginals],
+        "projected_bytes": round(slope * EXTRAPOLATE_TO + intercept),
+        "superlinear": superlinear,
+    }
+
+
+def field_costs(document):
+    """
+    Average serialized bytes per block, split by field.
+
+    `document` is a parsed UCM JSON document (see the repo-root `json`).
+    """
+    totals = {}
+    blocks = document.get("blocks", {})
+    for block_key, block in blocks.items():
+        metadata = block.get("metadata", {})
+        parts = {
+            "id": [block_key, block.get("id")],
+            "content": block.get("content"),
+            "content_hash": metadata.get("content_hash"),
+            "timestamps": [metadata.get("created_at"), metadata.get("modified_at")],
+            "version": block.get("version"),
+            "other_metadata": {
+                key: value
+                for key, value in metadata.items()
+                if key not in ("content_hash", "created_at", "modified_at")
+            },
+        }
+        whole = len(json.dumps({block_key: block}, separators=(",", ":")))
+        accounted = 0
+        for name, value in parts.items():
+            size = len(json.dumps(value, separators=(",", ":")))
+            totals[name] = totals.get(name, 0) + size
+            accounted += size
+        # Key names, braces and separators around the fields above
+        totals["framing"] = totals.get("framing", 0) + whole - accounted
+    count = len(blocks) or 1
+    return {name: round(total / count, 1) for name, total in totals.items()}
+
+
+def load_sample(path=SAMPLE_DOCUMENT):
+    return json.loads(Path(path).read_text())
+
+
+def profile(platform_steps, sample=None):
+    """Build the PRF-008 memory profile from per-platform driver steps."""
+    per_block = field_costs(sample) if sample else {}
+    result = {
+        "extrapolate_to": EXTRAPOLATE_TO,
+        "platforms": {},
+        "serialized_block_fields": {
+            name: {"bytes": size, "projected_bytes": round(size * EXTRAPOLATE_TO)}
+            for name, size in per_block.items()
+        },
+    }
+    for platform, steps in platform_steps.items():
+        curves = [growth_curve(steps, metric) for metric in METRICS]
+        curves = [curve for curve in curves if curve is not None]
+        result["platforms"][platform] = {
+            "steps": steps,
+            "curves": curves,
+            "superlinear": any(
+                curve["superlinear"]
+                for curve in curves
+                if curve["metric"] != "json_bytes"
+            ),
+        }
+    return result
+
+
+def format_profile(profile):
+    """Render a memory profile as Markdown."""
+    millions = profile["extrapolate_to"] / 1e6
+    lines = [
+        "# PRF-008 Memory Profile",
+        "",
+        "| Platform | Metric | Bytes/block | R² | Marginal bytes/block "
+        f"| At {millions:g}M blocks | Growth |",
+        "|----------|--------|-------------|----|----------------------|"
+        "----------------|--------|",
+    ]
+    for platform, data in profile["platforms"].items():
+        for curve in data["curves"]:
+            marginals = ", ".join(f"{m:g}" for m in curve["marginal_bytes_per_block"])
+            growth = "SUPERLINEAR" if curve["superlinear"] else "linear"
+            lines.append(
+                f"| {platform} | {curve['metric']} | {curve['bytes_per_block']:g} "
+                f"| {curve['r_squared']:.3f} | {marginals} "
+                f"| {curve['projected_bytes'] / 1e6:.1f} MB | {growth} |"
+            )
+    fields = profile["serialized_block_fields"]
+    if fields:
+        lines += [
+            "",
+            "## Serialized cost per block",
+            "",
+            f"| Field | Bytes/block | At {millions:g}M blocks |",
+            "|-------|-------------|----------------|",
+        ]
+        for name, cost in fields.items():
+            projected = cost["projected_bytes"] / 1e6
+            lines.append(f"| {name} | {cost['bytes']:g} | {projected:.1f} MB |")
+    return "\n".join(lines) + "\n"
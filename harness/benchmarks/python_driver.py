@@ -0,0 +1,125 @@
+"""
+Python SDK driver for the Tier 19 benchmark suite.
+
+Usage:
+    python -m harness.benchmarks.python_driver --sizes 1000,10000
+    python -m harness.benchmarks.python_driver --sizes 100000 --memory
+"""
+
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+from harness.benchmarks.suite import (
+    BENCH_TAG,
+    UCL_COMMANDS,
+    block_kind,
+    parse_driver_args,
+    sample,
+)
+from harness.fingerprint import python_sdk_version
+
+
+def build_document(ucp, size):
+    """Build the benchmark document with `size` blocks."""
+    doc = ucp.Document.create()
+    root = doc.root_id
+    section = root
+    for index in range(size):
+        kind = block_kind(index)
+        if kind == "section":
+            section = doc.add_block_with_content(
+                root, ucp.Content.text(f"Section {index}"), role="heading2"
+            )
+        elif kind == "code":
+            block_id = doc.add_block_with_content(
+                section, ucp.Content.code("python", f"value_{index} = {index}")
+            )
+            doc.add_tag(block_id, BENCH_TAG)
+        else:
+            doc.add_block_with_content(
+                section, ucp.Content.text(f"Paragraph {index}"), role="paragraph"
+            )
+    return doc
+
+
+def cases(ucp, size):
+    """Yield (operation, zero-argument callable) pairs for one size."""
+    doc = build_document(ucp, size)
+    payload = doc.to_json()
+    root = doc.root_id
+
+    def execute_ucl():
+        for index in range(UCL_COMMANDS):
+            ucp.execute_ucl(doc, f'APPEND {root} text :: "UCL command {index}"')
+
+    yield "create", lambda: build_document(ucp, size)
+    yield "find_by_tag", lambda: doc.find_by_tag(BENCH_TAG)
+    yield "find_by_type", lambda: doc.find_by_type("code")
+    yield "to_json", doc.to_json
+    yield "from_json", lambda: ucp.Document.from_json(payload)
+    yield "validate", doc.validate
+    # Grows the document, so it runs after the read-only cases
+    yield "execute_ucl", execute_ucl
+
+
+def _rss_bytes():
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak rather than current RSS, but still grows with the document
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def memory_step(ucp, size):
+    """Build one document and report what it costs in memory."""
+    gc.collect()
+    rss_before = _rss_bytes()
+    tracemalloc.start()
+    doc = build_document(ucp, size)
+    heap, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    return {
+        "size": size,
+        "rss_bytes": _rss_bytes() - rss_before,
+        "heap_bytes": heap,
+        "peak_bytes": peak,
+        "json_bytes": len(doc.to_json().encode()),
+    }
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    args = parse_driver_args("Benchmark the Python UCP SDK", argv)
+    import ucp
+
+    report = {"platform": "python", "sdk_version": python_sdk_version(), "cases": []}
+    if args.memory:
+        report["memory"] = [memory_step(ucp, size) for size in args.sizes]
+        print(json.dumps(report))
+        return 0
+
+    for size in args.sizes:
+        for operation, fn in cases(ucp, size):
+            case = {"operation": operation, "size": size}
+            try:
+                case["samples_ns"] = sample(
+                    fn, args.warmup, args.repeat, args.max_seconds, time.perf_counter_ns
+                )
+            except Exception as e:
+                case["error"] = f"{type(e).__name__}: {e}"
+            report["cases"].append(case)
+            print(f"python {operation}@{size} done", file=sys.stderr, flush=True)
+    print(json.dumps(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
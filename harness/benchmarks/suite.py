@@ -0,0 +1,399 @@
+"""
+Workload definition, PRF budgets and baseline comparison.
+
+Benchmark document shape (identical in every driver): block i of n is
+
+- a "heading2" section under the root when i % SECTION_SIZE == 0
+- a python code block tagged BENCH_TAG when i % TAG_EVERY == 0
+- a paragraph otherwise
+
+with non-section blocks appended to the most recent section. Operations:
+
+    create        build the n-block document from scratch
+    find_by_tag   doc.find_by_tag(BENCH_TAG)
+    find_by_type  doc.find_by_type("code")
+    to_json       serialize the document
+    from_json     deserialize the serialized document (not in Rust or the
+                  CLI: no loader / no load-only command)
+    execute_ucl   UCL_COMMANDS APPEND commands, one execute call each
+    validate      doc.validate()
+
+Drivers accept `--sizes --warmup --repeat --max-seconds` and print
+
+    {"platform": ..., "sdk_version": ..., "cases": [
+        {"operation": ..., "size": ..., "samples_ns": [...]},
+        {"operation": ..., "size": ..., "error": "..."}]}
+
+With `--memory` they instead build one document per size and report its
+memory cost (see harness.benchmarks.memory):
+
+    {"platform": ..., "sdk_version": ..., "cases": [], "memory": [
+        {"size": ..., "rss_bytes": ..., "heap_bytes": ..., "peak_bytes": ...,
+         "json_bytes": ...}]}
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from harness import rust_cache
+from harness.paths import REPO_ROOT, RUNS_DIR
+from harness.timing import TimingStats
+
+OPERATIONS = (
+    "create",
+    "find_by_tag",
+    "find_by_type",
+    "to_json",
+    "from_json",
+    "execute_ucl",
+    "validate",
+)
+PLATFORMS = ("python", "javascript", "rust", "cli")
+
+SECTION_SIZE = 100
+TAG_EVERY = 10
+BENCH_TAG = "bench"
+UCL_COMMANDS = 100
+
+DEFAULT_SIZES = (1000, 10000)
+ALL_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_WARMUP = 2
+DEFAULT_REPEAT = 15
+# Stop repeating a case after this long, once MIN_SAMPLES have been taken
+DEFAULT_MAX_SECONDS = 30.0
+MIN_SAMPLES = 3
+
+# A case regresses when its median is this much slower than the baseline's
+DEFAULT_THRESHOLD = 0.25
+
+DRIVERS_DIR = Path(__file__).parent / "drivers"
+TIER_DIR = RUNS_DIR / "tier_19_performance_scale"
+BASELINE_DIR = TIER_DIR / "baselines"
+RESULTS_PATH = TIER_DIR / "benchmark-results.json"
+REPORT_PATH = TIER_DIR / "BENCHMARK-REPORT.md"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """A hard latency budget from the Tier 19 checklist."""
+
+    item_id: str
+    operation: str
+    size: int
+    limit_ms: float
+
+
+BUDGETS = (
+    Budget("PRF-001", "create", 1000, 1000),
+    Budget("PRF-002", "create", 10000, 10000),
+    Budget("PRF-003", "find_by_tag", 10000, 100),
+    Budget("PRF-004", "to_json", 10000, 1000),
+    Budget("PRF-005", "from_json", 10000, 1000),
+    Budget("PRF-006", "execute_ucl", 1000, 1000),
+    Budget("PRF-010", "validate", 10000, 500),
+)
+
+
+@dataclass
+class CaseResult:
+    """Statistics of one (platform, operation, size) case."""
+
+    platform: str
+    operation: str
+    size: int
+    stats: TimingStats = None
+    error: str = None
+
+    @property
+    def key(self):
+        return f"{self.operation}@{self.size}"
+
+
+def block_kind(index):
+    """Return "section", "code" or "paragraph" for block `index`."""
+    if index % SECTION_SIZE == 0:
+        return "section"
+    if index % TAG_EVERY == 0:
+        return "code"
+    return "paragraph"
+
+
+def sample(fn, warmup, repeat, max_seconds, clock):
+    """
+    Call fn `warmup` times untimed, then up to `repeat` times timed.
+
+    Repetition stops early once max_seconds have been spent on timed calls
+    and at least MIN_SAMPLES were taken, so 1M-block cases stay bounded.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    spent = 0
+    while len(samples) < repeat:
+        start = clock()
+        fn()
+        elapsed = clock() - start
+        samples.append(elapsed)
+        spent += elapsed
+        if spent >= max_seconds * 1e9 and len(samples) >= MIN_SAMPLES:
+            break
+    return samples
+
+
+def parse_driver_args(description, argv=None):
+    """Parse the arguments every driver accepts."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated block counts",
+    )
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+    parser.add_argument(
+        "--memory", action="store_true", help="Report memory per size instead"
+    )
+    args = parser.parse_args(argv)
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+    return args
+
+
+def driver_command(platform, sizes, warmup, repeat, max_seconds, memory=False):
+    """Return the command that runs a platform's driver."""
+    args = [
+        "--sizes",
+        ",".join(str(size) for size in sizes),
+        "--warmup",
+        str(warmup),
+        "--repeat",
+        str(repeat),
+        "--max-seconds",
+        str(max_seconds),
+    ]
+    if memory:
+        args.append("--memory")
+    if platform == "python":
+        return [sys.executable, "-m", "harness.benchmarks.python_driver", *args]
+    if platform == "cli":
+        return [sys.executable, "-m", "harness.benchmarks.cli_driver", *args]
+    if platform == "javascript":
+        # --expose-gc lets the memory mode collect before each reading
+        return ["node", "--expose-gc", str(DRIVERS_DIR / "bench.js"), *args]
+    if platform == "rust":
+        return [str(rust_driver()), *args]
+    raise ValueError(f"Unknown platform: {platform}")
+
+
+@lru_cache(maxsize=None)
+def rust_driver():
+    """Build the Rust driver once per process and return its binary."""
+    stats = rust_cache.build_crate(DRIVERS_DIR / "rust", release=True)
+    if not stats.success:
+        raise RuntimeError(f"Rust driver build failed (exit {stats.returncode})")
+    return Path(stats.target_dir) / "release" / "ucp-bench"
+
+
+def _locked_version(crate_dir, package):
+    """Return the version of `package` resolved in a crate's Cargo.lock."""
+    try:
+        lock = (crate_dir / "Cargo.lock").read_text()
+    except OSError:
+        return None
+    match = re.search(rf'name = "{re.escape(package)}"\nversion = "([^"]+)"', lock)
+    return match.group(1) if match else None
+
+
+def run_driver(
+    platform, sizes, warmup, repeat, max_seconds, memory=False, timeout=None
+):
+    """Run one driver in its own process and return its parsed report."""
+    cmd = driver_command(platform, sizes, warmup, repeat, max_seconds, memory)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])
+    )
+    proc = subprocess.run(
+        cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=timeout
+    )
+    lines = proc.stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(
+            f"{platform} driver exited {proc.returncode}: {proc.stderr.strip()[-500:]}"
+        )
+    report = json.loads(lines[-1])
+    if platform == "rust" and not report.get("sdk_version"):
+        report["sdk_version"] = _locked_version(DRIVERS_DIR / "rust", "ucp-api")
+    return report
+
+
+def case_results(report):
+    """Turn a driver report into CaseResults."""
+    results = []
+    for case in report["cases"]:
+        result = CaseResult(report["platform"], case["operation"], case["size"])
+        if case.get("error"):
+            result.error = case["error"]
+        else:
+            result.stats = TimingStats.from_samples(
+                case["operation"], case["samples_ns"]
+            )
+        results.append(result)
+    return results
+
+
+def check_budgets(results, budgets=BUDGETS):
+    """Return (budget, result) pairs whose median exceeds the budget."""
+    by_key = {(r.platform, r.operation, r.size): r for r in results}
+    violations = []
+    for platform in sorted({r.platform for r in results}):
+        for budget in budgets:
+            result = by_key.get((platform, budget.operation, budget.size))
+            if result is None or result.stats is None:
+                continue
+            if result.stats.p50_ns / 1e6 > budget.limit_ms:
+                violations.append((budget, result))
+    return violations
+
+
+def baseline_path(platform, directory=BASELINE_DIR):
+    return directory / f"{platform}.json"
+
+
+def load_baseline(platform, directory=BASELINE_DIR):
+    """Return the stored case key -> stats dict for a platform, or {}."""
+    try:
+        data = json.loads(baseline_path(platform, directory).read_text())
+    except (OSError, ValueError):
+        return {}
+    return data.get("cases", {})
+
+
+def save_baseline(platform, results, sdk_version, directory=BASELINE_DIR):
+    """Write a platform's successful cases as its new baseline."""
+    directory.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "platform": platform,
+        "sdk_version": sdk_version,
+        "recorded_at": datetime.now().isoformat(),
+        "machine": os.uname().machine if hasattr(os, "uname") else sys.platform,
+        "cases": {
+            result.key: asdict(result.stats)
+            for result in results
+            if result.platform == platform and result.stats is not None
+        },
+    }
+    path = baseline_path(platform, directory)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def is_regression(current, baseline, threshold):
+    """
+    A case regresses when its median exceeds the baseline median by more
+    than `threshold` and even its fastest sample is slower than the
+    baseline median, so a single noisy run does not fail the suite.
+    """
+    limit = baseline["p50_ns"] * (1 + threshold)
+    return current.p50_ns > limit and current.min_ns > baseline["p50_ns"]
+
+
+def compare(results, baselines, threshold=DEFAULT_THRESHOLD):
+    """Return (result, baseline stats, ratio) for every regressed case."""
+    regressions = []
+    for result in results:
+        baseline = baselines.get(result.platform, {}).get(result.key)
+        if result.stats is None or not baseline or not baseline["p50_ns"]:
+            continue
+        if is_regression(result.stats, baseline, threshold):
+            ratio = result.stats.p50_ns / baseline["p50_ns"]
+            regressions.append((result, baseline, ratio))
+    return regressions
+
+
+def write_results(results, reports, violations, regressions, threshold, seeded=()):
+    """
+    Write benchmark-results.json and BENCHMARK-REPORT.md for the tier.
+
+    `seeded` lists the platforms whose baseline this run created, which
+    therefore had no regression check.
+    """
+    TIER_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "generated_at": datetime.now().isoformat(),
+        "sdk_versions": {r["platform"]: r.get("sdk_version") for r in reports},
+        "threshold": threshold,
+        "cases": [
+            {
+                "platform": r.platform,
+                "operation": r.operation,
+                "size": r.size,
+                "error": r.error,
+                "stats": asdict(r.stats) if r.stats else None,
+            }
+            for r in results
+        ],
+        "budget_violations": [
+            {"item": budget.item_id, "platform": result.platform}
+            for budget, result in violations
+        ],
+        "regressions": [
+            {"platform": result.platform, "case": result.key, "ratio": round(ratio, 3)}
+            for result, _, ratio in regressions
+        ],
+        "baselines_seeded": list(seeded),
+    }
+    RESULTS_PATH.write_text(json.dumps(payload, indent=2) + "\n")
+
+    lines = [
+        "# Tier 19 Benchmark Report",
+        "",
+        f"**Generated**: {payload['generated_at']}",
+        f"**Regression threshold**: {threshold:.0%}",
+    ]
+    if seeded:
+        lines.append(
+            "**Baselines seeded by this run** (no regression check): "
+            f"{', '.join(seeded)}"
+        )
+    lines += [
+        "",
+        "| Platform | Operation | Size | p50 (ms) | p95 (ms) | n | Budget |",
+        "|----------|-----------|------|----------|----------|---|--------|",
+    ]
+    budgets = {(b.operation, b.size): b for b in BUDGETS}
+    failed = {(b.item_id, r.platform) for b, r in violations}
+    for r in results:
+        budget = budgets.get((r.operation, r.size))
+        verdict = "-"
+        if budget is not None and r.stats is not None:
+            state = "FAIL" if (budget.item_id, r.platform) in failed else "PASS"
+            verdict = f"{budget.item_id} <{budget.limit_ms:g}ms {state}"
+        if r.stats is None:
+            lines.append(
+                f"| {r.platform} | {r.operation} | {r.size} | - | - | 0 | {r.error} |"
+            )
+            continue
+        lines.append(
+            f"| {r.platform} | {r.operation} | {r.size} "
+            f"| {r.stats.p50_ns / 1e6:.3f} | {r.stats.p95_ns / 1e6:.3f} "
+            f"| {r.stats.count} | {verdict} |"
+        )
+    if regressions:
+        lines += ["", "## Regressions", ""]
+        for result, baseline, ratio in regressions:
+            lines.append(
+                f"- {result.platform} {result.key}: p50 "
+                f"{result.stats.p50_ns / 1e6:.3f}ms vs baseline "
+                f"{baseline['p50_ns'] / 1e6:.3f}ms ({ratio:.2f}x)"
+            )
+    REPORT_PATH.write_text("\n".join(lines) + "\n")
+    return REPORT_PATH
@@ -0,0 +1,281 @@
+"""
+Latency budgets from config/run_config.json, enforced on test timings.
+
+`success_criteria` in the run config sets the budgets:
+
+    "success_criteria": {
+      "max_latency_ms": 500,
+      "latency_percentile": "p95",
+      "operations_ms": {"document_create_10k": 10000},
+      "budgets_ms": {"SET-004": 2000},
+      "tiers": {
+        "19": {"max_latency_ms": 10000, "budgets_ms": {"PRF-003": 150}}
+      }
+    }
+
+Every operation an item records through harness.timing (results/
+timings.jsonl) is checked at `latency_percentile` against the first of:
+
+1. the item's tier override (`tiers`, keyed by tier number or runs/
+   folder name): `budgets_ms[item]`, then `operations_ms[operation]`
+2. the same two keys at the top level
+3. for PRF-001..PRF-010, the checklist threshold (harness.benchmarks),
+   but only for the operation that item measures (`find_by_tag` for
+   PRF-003, also matched as `find_by_tag_10k`); setup steps such as
+   building the document fall through to
+4. the tier's `max_latency_ms`, then the top-level `max_latency_ms`
+
+The same item overrides apply to the Tier 19 benchmark budgets. A
+violation keeps the measured distribution (percentiles plus a log-linear
+histogram of the raw samples) and is written to results/budget_check.json.
+config/run_config.json is used when present, else the template.
+
+Usage:
+    python -m harness.budgets                 # every item with timings
+    python -m harness.budgets PRF-003 SET-004
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+
+from harness.benchmarks.suite import BUDGETS, Budget
+from harness.checklist import parse_checklist
+from harness.histogram import LatencyHistogram
+from harness.paths import REPO_ROOT
+from harness.timing import TIMINGS_FILENAME
+
+CONFIG_PATH = REPO_ROOT / "config" / "run_config.json"
+TEMPLATE_PATH = REPO_ROOT / "config" / "run_config.json.template"
+RESULT_FILENAME = "budget_check.json"
+
+PERCENTILES = ("p50", "p90", "p95", "p99", "max")
+DEFAULT_PERCENTILE = "p95"
+
+# PRF items measured outside the benchmark suite (harness.traversal_load,
+# harness.translate); size is blocks for PRF-007 and bytes for PRF-009
+EXTRA_PRF_BUDGETS = (
+    Budget("PRF-007", "traverse", 1000, 500),
+    Budget("PRF-009", "parse_markdown", 100_000, 1000),
+)
+
+# Checklist thresholds of the PRF items: item ID -> (operation, limit)
+PRF_LIMITS_MS = {
+    budget.item_id: (budget.operation, budget.limit_ms)
+    for budget in BUDGETS + EXTRA_PRF_BUDGETS
+}
+
+
+def measures(operation, name):
+    """True when a recorded operation name is the PRF item's operation."""
+    return name == operation or name.startswith(f"{operation}_")
+
+
+def load_config(path=None):
+    """Load `path`, else config/run_config.json, else the template."""
+    if path is None:
+        path = CONFIG_PATH if CONFIG_PATH.exists() else TEMPLATE_PATH
+    return json.loads(Path(path).read_text())
+
+
+@dataclass
+class Violation:
+    """One operation whose measured latency exceeded its budget."""
+
+    item: str
+    platform: str
+    script: str
+    operation: str
+    percentile: str
+    measured_ms: float
+    budget_ms: float
+    # Where the budget came from, e.g. "tiers.19.budgets_ms.PRF-003"
+    source: str
+    distribution: dict = field(default_factory=dict)
+
+    def describe(self):
+        return (
+            f"{self.item} {self.platform} {self.operation}: {self.percentile} "
+            f"{self.measured_ms:.1f}ms > {self.budget_ms:g}ms ({self.source})"
+        )
+
+
+class BudgetPolicy:
+    """Resolve and check latency budgets from `success_criteria`."""
+
+    def __init__(self, criteria):
+        self.criteria = criteria or {}
+        self.percentile = self.criteria.get("latency_percentile", DEFAULT_PERCENTILE)
+        if self.percentile not in PERCENTILES:
+            raise ValueError(
+                f"latency_percentile must be one of {', '.join(PERCENTILES)}, "
+                f"not {self.percentile!r}"
+            )
+
+    @classmethod
+    def from_config(cls, path=None):
+        return cls(load_config(path).get("success_criteria"))
+
+    def _tier(self, item):
+        tiers = self.criteria.get("tiers") or {}
+        for key in (str(item.tier_number), item.tier_dir):
+            if key in tiers:
+                return f"tiers.{key}", tiers[key]
+        return None, {}
+
+    def budget_for(self, item, operation):
+        """Return (budget in ms, source) for an operation, or (None, None)."""
+        tier_name, tier = self._tier(item)
+        levels = [(None, self.criteria)]
+        if tier_name is not None:
+            levels.insert(0, (tier_name, tier))
+        for prefix, level in levels:
+            for key, name in (("budgets_ms", item.id), ("operations_ms", operation)):
+                value = (level.get(key) or {}).get(name)
+                if value is not None:
+                    source = ".".join(filter(None, (prefix, key, name)))
+                    return value, source
+        if item.id in PRF_LIMITS_MS:
+            measured, limit = PRF_LIMITS_MS[item.id]
+            if measures(measured, operation):
+                return limit, "checklist"
+        for prefix, level in levels:
+            if level.get("max_latency_ms") is not None:
+                source = ".".join(filter(None, (prefix, "max_latency_ms")))
+                return level["max_latency_ms"], source
+        return None, None
+
+    def benchmark_budgets(self, items):
+        """Tier 19 benchmark budgets with config overrides applied."""
+        by_id = {item.id: item for item in items}
+        budgets = []
+        for budget in BUDGETS:
+            item = by_id.get(budget.item_id)
+            if item is not None:
+                limit, _ = self.budget_for(item, budget.operation)
+                budget = replace(budget, limit_ms=limit)
+            budgets.append(budget)
+        return budgets
+
+    def check(self, item, records):
+        """Return the Violations among timings.jsonl records of one item."""
+        violations = []
+        for record in records:
+            budget, source = self.budget_for(item, record["operation"])
+            if budget is None or not record.get("count"):
+                continue
+            measured_ms = record[f"{self.percentile}_ns"] / 1e6
+            if measured_ms > budget:
+                violations.append(
+                    Violation(
+                        item=item.id,
+                        platform=record.get("platform", "python"),
+                        script=record.get("script"),
+                        operation=record["operation"],
+                        percentile=self.percentile,
+                        measured_ms=round(measured_ms, 3),
+                        budget_ms=budget,
+                        source=source,
+                        distribution=distribution(record),
+                    )
+                )
+        return violations
+
+
+def distribution(record):
+    """Percentiles of a timings record plus a histogram of its raw samples."""
+    histogram = LatencyHistogram()
+    for sample in record.get("samples_ns", []):
+        histogram.record(sample)
+    return {
+        "count": record["count"],
+        **{
+            f"{name}_ms": round(record[f"{name}_ns"] / 1e6, 3)
+            for name in ("min", "p50", "p90", "p95", "p99", "max")
+        },
+        "histogram_ns": histogram.to_dict(),
+    }
+
+
+def latest_timings(item, since=None):
+    """
+    Return the newest timings record per (platform, script, operation).
+
+    timings.jsonl is appended to by every run; `since` (an ISO timestamp)
+    additionally drops records written before it.
+    """
+    path = item.run_dir / "results" / TIMINGS_FILENAME
+    if not path.exists():
+        return []
+    latest = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            recorded_at = record.get("recorded_at") or ""
+            if since is not None and recorded_at < since:
+                continue
+            key = (record.get("platform"), record.get("script"), record["operation"])
+            if key not in latest or recorded_at >= latest[key].get("recorded_at", ""):
+                latest[key] = record
+    return list(latest.values())
+
+
+def enforce(item, policy, since=None):
+    """
+    Check an item's latest timings; write results/budget_check.json.
+
+    Returns the list of Violations (empty when within budget or when the
+    item recorded no timings).
+    """
+    records = latest_timings(item, since)
+    if not records:
+        return []
+    violations = policy.check(item, records)
+    payload = {
+        "item": item.id,
+        "checked_at": datetime.now().isoformat(),
+        "percentile": policy.percentile,
+        "operations": len(records),
+        "passed": not violations,
+        "violations": [asdict(violation) for violation in violations],
+    }
+    path = item.run_dir / "results" / RESULT_FILENAME
+    path.write_text(json.dumps(payload, indent=2))
+    return violations
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Check items' recorded timings against run_config budgets"
+    )
+    parser.add_argument("items", nargs="*", help="Item IDs (default: all)")
+    parser.add_argument("--config", type=Path, help="Run config JSON")
+    args = parser.parse_args(argv)
+
+    policy = BudgetPolicy.from_config(args.config)
+    items = parse_checklist()
+    if args.items:
+        items = [item for item in items if item.id in set(args.items)]
+
+    checked = failed = 0
+    for item in items:
+        if not latest_timings(item):
+            continue
+        checked += 1
+        violations = enforce(item, policy)
+        failed += bool(violations)
+        for violation in violations:
+            print(f"BUDGET {violation.describe()}")
+    print(f"{checked} item(s) checked at {policy.percentile}, {failed} over budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
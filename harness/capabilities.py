@@ -0,0 +1,450 @@
+"""
+Cached API capability map of the installed UCP SDKs.
+
+Generated tests keep rediscovering the same API surface: `getattr` chains
+for `root_id` / `root`, `block_count` / `blockCount`, `get_block` /
+`getBlock`, and try/except import fallbacks between `ucp` and
+`ucp_content`. This module probes each SDK once and stores the result
+keyed by the installed SDK versions:
+
+    .processor/capabilities/<versions hash>.json
+
+- python:     the first importable module of PYTHON_MODULES; public
+              functions and classes with their methods and properties
+- javascript: the first resolvable package of JS_PACKAGES, introspected
+              with node (exports, prototype methods and getters)
+- cli:        `ucp --help` and `ucp <command> --help` for every command;
+              the help captured in SET-003/results/*_help.txt is used
+              when `ucp` is not installed
+
+Tests resolve names through the map instead of probing:
+
+    from harness.capabilities import load, sdk
+    ucp = sdk()                               # no import fallbacks
+    caps = load()
+    root = caps.get(doc, "root_id")           # root_id, root or rootId
+    caps.member("javascript", "Document", "block_count")  # "blockCount"
+
+`python -m harness.capabilities --parity` writes the Python/JavaScript
+API differences to runs/tier_17_cross_platform_sdk_parity/API-PARITY.md.
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from harness.fingerprint import JS_PACKAGES, sdk_versions
+from harness.paths import PROCESSOR_DIR, REPO_ROOT, RUNS_DIR
+
+CACHE_DIR = PROCESSOR_DIR / "capabilities"
+PARITY_PATH = RUNS_DIR / "tier_17_cross_platform_sdk_parity" / "API-PARITY.md"
+HELP_DIR = RUNS_DIR / "tier_1_installation_setup_verification" / "SET-003" / "results"
+
+# Bump when the probe output changes shape
+PROBE_VERSION = 1
+
+PYTHON_MODULES = ("ucp", "ucp_content")
+
+# Canonical (snake_case) name -> other spellings seen across SDK versions
+ALIASES = {
+    "root_id": ("root", "rootId"),
+    "get_block": ("block", "getBlock"),
+    "block_count": ("blockCount",),
+    "to_json": ("toJson", "toJSON", "serialize"),
+    "from_json": ("fromJson", "fromJSON", "deserialize"),
+}
+
+_JS_PROBE = r"""
+const candidates = JSON.parse(process.argv[1]);
+let sdk = null, name = null;
+for (const candidate of candidates) {
+    try { sdk = require(candidate); name = candidate; break; } catch (e) {}
+}
+if (!sdk) { console.log("null"); process.exit(0); }
+let version = null;
+try { version = require(name + "/package.json").version; } catch (e) {}
+const members = (target) => {
+    const out = {};
+    if (!target) return out;
+    for (const key of Object.getOwnPropertyNames(target)) {
+        if (key === "constructor" || key.startsWith("_")) continue;
+        const desc = Object.getOwnPropertyDescriptor(target, key);
+        out[key] = desc.get ? "property"
+            : typeof desc.value === "function" ? "method" : "attribute";
+    }
+    return out;
+};
+const symbols = {};
+for (const key of Object.keys(sdk)) {
+    if (key.startsWith("_")) continue;
+    const value = sdk[key];
+    if (typeof value === "function" && value.prototype &&
+            Object.getOwnPropertyNames(value.prototype).length > 1) {
+        const statics = members(value);
+        for (const k of ["length", "name", "prototype"]) delete statics[k];
+        symbols[key] = {kind: "class", members: members(value.prototype),
+                        static: statics};
+    } else {
+        symbols[key] = {kind: typeof value === "function" ? "function" : "value"};
+    }
+}
+console.log(JSON.stringify({module: name, version, symbols}));
+"""
+
+_COMMANDS_RE = re.compile(r"^Commands:\n((?:  \S.*\n?)+)", re.MULTILINE)
+_FLAG_RE = re.compile(r"^\s+(?:-\w, )?(--[\w-]+)", re.MULTILINE)
+
+
+def snake_case(name):
+    """blockCount -> block_count"""
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+
+
+def _spellings(name):
+    """Canonical name, its camelCase form, then known aliases."""
+    camel = re.sub(r"_([a-z])", lambda m: m.group(1).upper(), name)
+    return (name, camel, *ALIASES.get(name, ()))
+
+
+def _member_kind(value):
+    if isinstance(value, (property, classmethod, staticmethod)):
+        return "property" if isinstance(value, property) else "method"
+    if inspect.isdatadescriptor(value) or inspect.isgetsetdescriptor(value):
+        return "property"
+    return "method" if callable(value) else "attribute"
+
+
+def probe_python(modules=PYTHON_MODULES):
+    """Return the Python SDK's symbols, or None when no module imports."""
+    for name in modules:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            continue
+        symbols = {}
+        for key in getattr(module, "__all__", None) or dir(module):
+            if key.startswith("_"):
+                continue
+            value = getattr(module, key, None)
+            if inspect.isclass(value):
+                members = {
+                    member: _member_kind(attr)
+                    for member, attr in vars(value).items()
+                    if not member.startswith("_")
+                }
+                symbols[key] = {"kind": "class", "members": members}
+            elif callable(value):
+                symbols[key] = {"kind": "function"}
+        return {
+            "module": name,
+            "version": getattr(module, "__version__", None),
+            "symbols": symbols,
+        }
+    return None
+
+
+def probe_javascript(packages=JS_PACKAGES):
+    """Return the JavaScript SDK's exports, or None without node or SDK."""
+    if shutil.which("node") is None:
+        return None
+    try:
+        proc = subprocess.run(
+            ["node", "-e", _JS_PROBE, json.dumps(packages)],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            timeout=60,
+        )
+        return json.loads(proc.stdout or "null")
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return None
+
+
+def parse_help(text):
+    """Return ({subcommand: description}, [flags]) from clap help output."""
+    commands = {}
+    match = _COMMANDS_RE.search(text)
+    if match:
+        for line in match.group(1).splitlines():
+            name, _, description = line.strip().partition(" ")
+            if name != "help":
+                commands[name] = description.strip()
+    flags = [flag for flag in _FLAG_RE.findall(text) if flag not in ("--help",)]
+    return commands, flags
+
+
+def _cli_help(args):
+    try:
+        proc = subprocess.run(
+            ["ucp", *args, "--help"], capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def probe_cli(help_dir=HELP_DIR):
+    """Return the CLI command tree, live when possible, else from SET-003."""
+    live = shutil.which("ucp") is not None
+
+    def help_for(args):
+        if live:
+            return _cli_help(args)
+        name = f"{args[-1]}_help.txt" if args else "main_help.txt"
+        path = help_dir / name
+        return path.read_text() if path.exists() else None
+
+    main_help = help_for([])
+    if main_help is None:
+        return None
+    top, flags = parse_help(main_help)
+    commands = {}
+    for command, description in top.items():
+        sub_help = help_for([command])
+        subcommands, sub_flags = parse_help(sub_help) if sub_help else ({}, [])
+        if live:
+            for sub in subcommands:
+                leaf = _cli_help([command, sub])
+                subcommands[sub] = parse_help(leaf)[1] if leaf else []
+        commands[command] = {
+            "description": description,
+            "subcommands": subcommands,
+            "flags": sub_flags,
+        }
+    return {
+        "source": "ucp --help" if live else str(help_dir.relative_to(REPO_ROOT)),
+        "version": sdk_versions().get("ucp-cli"),
+        "flags": flags,
+        "commands": commands,
+    }
+
+
+def _cache_key(versions):
+    data = json.dumps({"versions": versions, "probe": PROBE_VERSION}, sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+class Capabilities:
+    """Lookup helpers over a probed capability map."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def platform(self, platform):
+        return self.data.get(platform) or {}
+
+    def symbols(self, platform):
+        return self.platform(platform).get("symbols", {})
+
+    def members(self, platform, cls):
+        symbol = self.symbols(platform).get(cls) or {}
+        return {**symbol.get("static", {}), **symbol.get("members", {})}
+
+    def member(self, platform, cls, name):
+        """
+        Return the spelling of a member that exists on a class, or None.
+
+        `name` is canonical snake_case; its aliases and camelCase form are
+        tried in turn.
+        """
+        members = self.members(platform, cls)
+        for candidate in _spellings(name):
+            if candidate in members:
+                return candidate
+        return None
+
+    def has(self, platform, cls, name=None):
+        if name is None:
+            return cls in self.symbols(platform)
+        return self.member(platform, cls, name) is not None
+
+    def get(self, obj, name, default=None):
+        """
+        Read a canonical member from a Python SDK object.
+
+        Properties are returned as values and methods as bound methods,
+        e.g. `caps.get(doc, "block_count")`.
+        """
+        member = self.member("python", type(obj).__name__, name)
+        if member is not None:
+            return getattr(obj, member, default)
+        # Instance attributes are invisible to class introspection
+        for candidate in _spellings(name):
+            if candidate in getattr(obj, "__dict__", {}):
+                return obj.__dict__[candidate]
+        return default
+
+    def cli_has(self, *command):
+        """True if e.g. ("block", "add") is a CLI command."""
+        commands = self.platform("cli").get("commands", {})
+        if not command or command[0] not in commands:
+            return False
+        return len(command) == 1 or command[1] in commands[command[0]]["subcommands"]
+
+    def parity(self):
+        """
+        Return Python/JavaScript API differences per class.
+
+        Maps each class (and "<functions>" for module-level functions) to
+        {"python_only": [...], "javascript_only": [...]}, comparing
+        snake_case-normalized names.
+        """
+        python, javascript = self.symbols("python"), self.symbols("javascript")
+        gaps = {}
+
+        def names(symbols, cls):
+            symbol = symbols.get(cls) or {}
+            members = {**symbol.get("static", {}), **symbol.get("members", {})}
+            return {snake_case(name) for name in members}
+
+        for cls in sorted(set(python) | set(javascript)):
+            in_python, in_js = cls in python, cls in javascript
+            if in_python and in_js:
+                py_names, js_names = names(python, cls), names(javascript, cls)
+            elif python.get(cls, javascript.get(cls))["kind"] != "class":
+                continue
+            else:
+                py_names = {"<class>"} if in_python else set()
+                js_names = {"<class>"} if in_js else set()
+            diff = {
+                "python_only": sorted(py_names - js_names),
+                "javascript_only": sorted(js_names - py_names),
+            }
+            if diff["python_only"] or diff["javascript_only"]:
+                gaps[cls] = diff
+
+        def functions(symbols):
+            return {
+                snake_case(name)
+                for name, symbol in symbols.items()
+                if symbol["kind"] == "function"
+            }
+
+        py_fns, js_fns = functions(python), functions(javascript)
+        if py_fns != js_fns:
+            gaps["<functions>"] = {
+                "python_only": sorted(py_fns - js_fns),
+                "javascript_only": sorted(js_fns - py_fns),
+            }
+        return gaps
+
+
+def probe():
+    """Probe every SDK now, without the cache."""
+    return {
+        "versions": sdk_versions(),
+        "python": probe_python(),
+        "javascript": probe_javascript(),
+        "cli": probe_cli(),
+    }
+
+
+@lru_cache(maxsize=None)
+def load(refresh=False):
+    """
+    Return the Capabilities for the installed SDK versions.
+
+    Probes at most once per process, and only when no cache file matches
+    the current versions (or `refresh` is set).
+    """
+    versions = sdk_versions()
+    path = CACHE_DIR / f"{_cache_key(versions)}.json"
+    if not refresh:
+        try:
+            return Capabilities(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            pass
+    data = probe()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Processes started together may all miss the cache and probe; each
+    # writes its own temp file, and whichever replace lands last wins
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    tmp_path = Path(f.name)
+    try:
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        if not path.exists():
+            raise
+    return Capabilities(data)
+
+
+def sdk():
+    """Import and return the Python SDK module recorded in the map."""
+    module = load().platform("python").get("module")
+    if module is None:
+        raise ImportError(f"No UCP Python SDK installed (tried {PYTHON_MODULES})")
+    return importlib.import_module(module)
+
+
+def format_parity(caps):
+    """Render Python/JavaScript API differences as Markdown."""
+    versions = caps.data.get("versions", {})
+    lines = [
+        "# SDK API Parity",
+        "",
+        "Generated by `python -m harness.capabilities --parity`. Names are",
+        "compared after converting camelCase to snake_case.",
+        "",
+        "| SDK | Module | Version |",
+        "|-----|--------|---------|",
+    ]
+    for platform in ("python", "javascript", "cli"):
+        info = caps.platform(platform)
+        module = info.get("module") or info.get("source") or "not installed"
+        lines.append(f"| {platform} | {module} | {info.get('version') or '-'} |")
+    lines += ["", f"Installed versions: `{json.dumps(versions, sort_keys=True)}`", ""]
+    if not (caps.platform("python") and caps.platform("javascript")):
+        lines.append("Both the Python and JavaScript SDKs are needed for a comparison.")
+        return "\n".join(lines) + "\n"
+    gaps = caps.parity()
+    if not gaps:
+        lines.append("No differences.")
+        return "\n".join(lines) + "\n"
+    lines += ["| Symbol | Python only | JavaScript only |", "|---|---|---|"]
+    for symbol, diff in gaps.items():
+        python_only = ", ".join(diff["python_only"]) or "-"
+        js_only = ", ".join(diff["javascript_only"]) or "-"
+        lines.append(f"| {symbol} | {python_only} | {js_only} |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Probe and cache SDK capabilities")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cache")
+    parser.add_argument(
+        "--parity", action="store_true", help=f"Write {PARITY_PATH.name} for Tier 17"
+    )
+    args = parser.parse_args(argv)
+
+    caps = load(refresh=args.refresh)
+    for platform in ("python", "javascript", "cli"):
+        info = caps.platform(platform)
+        if not info:
+            print(f"{platform:10} not installed")
+            continue
+        count = len(info.get("symbols") or info.get("commands") or {})
+        name = info.get("module") or info.get("source")
+        print(f"{platform:10} {name} {info.get('version') or ''} ({count} entries)")
+    if args.parity:
+        PARITY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PARITY_PATH.write_text(format_parity(caps))
+        print(f"Parity report: {PARITY_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
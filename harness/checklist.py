@@ -0,0 +1,160 @@
+"""
+Parser for SUT-CHECKLIST.md.
+
+Items come from the `| ID | Target | Priority | Risk | Status |` tables under
+each `## Tier N: ...` heading. Ordering constraints come from the optional
+`## Dependencies` section, one rule per bullet:
+
+    - SET-002, SET-003 after SET-001
+    - Tier 8 after Tier 7
+
+Either side may list item IDs or `Tier N` references, comma-separated.
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from harness.paths import REPO_ROOT, RUNS_DIR
+
+CHECKLIST_PATH = REPO_ROOT / "SUT-CHECKLIST.md"
+COMPLETED_STATUS = "✅ Completed"
+
+_TIER_RE = re.compile(r"^##\s+(Tier\s+(\d+):.*?)\s*$")
+_SECTION_RE = re.compile(r"^##\s+")
+_ROW_RE = re.compile(r"^\|\s*([A-Z]+-\d+)\s*\|(.*)\|\s*$")
+_RULE_RE = re.compile(r"^[-*]\s+(.+?)\s+after\s+(.+?)\s*$", re.IGNORECASE)
+_TIER_REF_RE = re.compile(r"^tier\s+(\d+)$", re.IGNORECASE)
+
+PRIORITY_RANK = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+
+
+@dataclass
+class ChecklistItem:
+    """One row of the checklist."""
+
+    id: str
+    target: str
+    priority: str
+    risk: str
+    status: str
+    tier: str
+    tier_number: int
+    order: int
+
+    @property
+    def completed(self):
+        return self.status.startswith("✅")
+
+    @property
+    def tier_dir(self):
+        """Folder name of the tier under runs/, e.g. tier_1_installation_setup_verification."""
+        return tier_folder_name(self.tier)
+
+    @property
+    def run_dir(self):
+        return RUNS_DIR / self.tier_dir / self.id
+
+    @property
+    def sort_key(self):
+        """Scheduling preference: lower tiers, then higher priority, then file order."""
+        return (self.tier_number, PRIORITY_RANK.get(self.priority, 9), self.order)
+
+
+def tier_folder_name(tier):
+    """Convert a tier heading into its runs/ folder name."""
+    return re.sub(r"[^a-z0-9]+", "_", tier.lower()).strip("_")
+
+
+def parse_checklist(path=CHECKLIST_PATH):
+    """Return all checklist items in file order."""
+    items = []
+    tier, tier_number = None, 0
+    for line in Path(path).read_text().splitlines():
+        tier_match = _TIER_RE.match(line)
+        if tier_match:
+            tier, tier_number = tier_match.group(1), int(tier_match.group(2))
+            continue
+        if _SECTION_RE.match(line):
+            tier = None
+            continue
+        row = _ROW_RE.match(line)
+        if not row or tier is None:
+            continue
+        cells = [cell.strip() for cell in row.group(2).split("|")]
+        if len(cells) < 4:
+            continue
+        target, priority, risk, status = cells[:4]
+        items.append(
+            ChecklistItem(
+                id=row.group(1),
+                target=target,
+                priority=priority,
+                risk=risk,
+                status=status,
+                tier=tier,
+                tier_number=tier_number,
+                order=len(items),
+            )
+        )
+    return items
+
+
+def _expand_refs(refs, items):
+    """Resolve a comma-separated list of item IDs / `Tier N` refs to item IDs."""
+    ids = []
+    for ref in (part.strip() for part in refs.split(",")):
+        tier_match = _TIER_REF_RE.match(ref)
+        if tier_match:
+            number = int(tier_match.group(1))
+            ids.extend(item.id for item in items if item.tier_number == number)
+        elif ref:
+            ids.append(ref)
+    return ids
+
+
+def parse_dependencies(path=CHECKLIST_PATH, items=None):
+    """
+    Return a mapping of item ID -> set of prerequisite item IDs.
+
+    Raises ValueError for rules referencing unknown item IDs.
+    """
+    if items is None:
+        items = parse_checklist(path)
+    known = {item.id for item in items}
+    dependencies = {item.id: set() for item in items}
+
+    in_section = False
+    for line in Path(path).read_text().splitlines():
+        if _SECTION_RE.match(line):
+            in_section = line.strip().lower() == "## dependencies"
+            continue
+        if not in_section:
+            continue
+        rule = _RULE_RE.match(line.strip())
+        if not rule:
+            continue
+        targets = _expand_refs(rule.group(1), items)
+        prereqs = _expand_refs(rule.group(2), items)
+        unknown = [ref for ref in targets + prereqs if ref not in known]
+        if unknown:
+            raise ValueError(f"Unknown checklist IDs in dependency rule: {unknown}")
+        for target in targets:
+            dependencies[target].update(p for p in prereqs if p != target)
+    return dependencies
+
+
+def mark_status(item_id, status=COMPLETED_STATUS, path=CHECKLIST_PATH):
+    """Rewrite the status cell of one checklist row."""
+    path = Path(path)
+    lines = path.read_text().splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        row = _ROW_RE.match(line.rstrip("\n"))
+        if row and row.group(1) == item_id:
+            cells = line.rstrip("\n").split("|")
+            # ['', ' ID ', ' Target ', ' Priority ', ' Risk ', ' Status ', '']
+            cells[5] = f" {status} "
+            lines[index] = "|".join(cells) + "\n"
+            path.write_text("".join(lines))
+            return True
+    return False
@@ -0,0 +1,417 @@
+"""
+Long-lived UCP command server speaking line-delimited JSON-RPC 2.0.
+
+The `ucp` binary has no server mode: every command is a new process that
+re-reads the document from disk, so CLI-tier latencies are dominated by
+process spawn and JSON parsing. This server keeps documents in memory
+behind the Python SDK (the same Rust engine) and exposes the CLI's
+document commands as RPC methods:
+
+    document.create {title}              -> {doc, root}
+    document.load   {path | json}        -> {doc, root}
+    document.save   {doc, path}          -> {path, bytes}
+    document.close  {doc}                -> {}
+    info            {doc}                -> {root, block_count}
+    block.add       {doc, parent, content, content_type, language, role,
+                     label, tags}        -> {id}
+    block.delete    {doc, id, cascade, preserve_children} -> {affected}
+    block.move      {doc, id, parent}    -> {affected}
+    edge.add        {doc, source, target, edge_type} -> {affected}
+    ucl.exec        {doc, commands}      -> {affected}
+    find            {doc, tag | type}    -> {ids}
+    validate        {doc}                -> {valid, issues}
+    export.json     {doc}                -> {json}
+    cli             {doc, argv}          -> result of the mapped method
+
+`cli` accepts CLI-style arguments (`["block", "add", "--parent", id,
+"--content", "Hi", "--tags", "a,b"]`) so existing CLI scripts translate by
+dropping `ucp`, `--input` and `--output`. Flags are parsed by arity
+(`--cascade` takes no value); unknown flags, missing values and stray
+arguments are rejected, as are content types other than text and code.
+Every result carries `elapsed_ns`, measured around the engine call only.
+
+The server never runs the `ucp` binary, so these timings measure the
+Python binding: report them as such, not as `ucp` CLI latency
+(harness.benchmarks.cli_driver times the binary itself).
+
+Usage:
+    python -m harness.cli_server            # serve on stdin/stdout
+
+    from harness.cli_server import UcpServer
+    with UcpServer() as server:
+        doc = server.create("CLI tier")
+        doc.cli("block", "add", "--parent", doc.root, "--content", "Hello")
+        print(doc.validate())
+"""
+
+import itertools
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from harness.capabilities import sdk
+from harness.paths import REPO_ROOT
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+ENGINE_ERROR = -32000
+
+# block.add content types the Python binding can build
+CONTENT_TYPES = ("text", "code")
+
+
+class CliServerError(RuntimeError):
+    """An error response from the server."""
+
+    def __init__(self, code, message):
+        super().__init__(f"[{code}] {message}")
+        self.code = code
+        self.message = message
+
+
+class _Handlers:
+    """Method implementations over in-memory documents."""
+
+    def __init__(self, ucp):
+        self.ucp = ucp
+        self.documents = {}
+        self._ids = itertools.count(1)
+
+    def _doc(self, params):
+        try:
+            return self.documents[params["doc"]]
+        except KeyError:
+            message = f"unknown document {params.get('doc')}"
+            raise CliServerError(INVALID_PARAMS, message)
+
+    def _register(self, doc):
+        handle = f"d{next(self._ids)}"
+        self.documents[handle] = doc
+        return {"doc": handle, "root": str(doc.root_id)}
+
+    def _ucl(self, doc, commands):
+        results = self.ucp.execute_ucl(doc, commands)
+        return {"affected": len(results) if results is not None else 0}
+
+    # -- document lifecycle ---------------------------------------------------
+
+    def document_create(self, params):
+        if params.get("title"):
+            return self._register(self.ucp.Document.create(title=params["title"]))
+        return self._register(self.ucp.Document.create())
+
+    def document_load(self, params):
+        data = params.get("json")
+        if data is None:
+            data = Path(params["path"]).read_text()
+        return self._register(self.ucp.Document.from_json(data))
+
+    def document_save(self, params):
+        data = self._doc(params).to_json()
+        Path(params["path"]).write_text(data)
+        return {"path": params["path"], "bytes": len(data)}
+
+    def document_close(self, params):
+        self.documents.pop(params["doc"], None)
+        return {}
+
+    def info(self, params):
+        doc = self._doc(params)
+        return {"root": str(doc.root_id), "block_count": doc.block_count}
+
+    # -- mutations ------------------------------------------------------------
+
+    def block_add(self, params):
+        doc = self._doc(params)
+        parent = params.get("parent") or doc.root_id
+        content = params.get("content", "")
+        content_type = params.get("content_type", "text")
+        if content_type not in CONTENT_TYPES:
+            message = (
+                f"unsupported content type {content_type!r} "
+                f"(supported: {', '.join(CONTENT_TYPES)})"
+            )
+            raise CliServerError(INVALID_PARAMS, message)
+        if content_type == "code":
+            block_id = doc.add_code(parent, params.get("language", "text"), content)
+        else:
+            block_id = doc.add_block(parent, content, role=params.get("role"))
+        if params.get("label"):
+            doc.set_label(block_id, params["label"])
+        for tag in params.get("tags") or []:
+            doc.add_tag(block_id, tag)
+        return {"id": str(block_id)}
+
+    def block_delete(self, params):
+        command = f"DELETE {params['id']}"
+        if params.get("cascade"):
+            command += " CASCADE"
+        if params.get("preserve_children"):
+            command += " PRESERVE_CHILDREN"
+        return self._ucl(self._doc(params), command)
+
+    def block_move(self, params):
+        return self._ucl(
+            self._doc(params), f"MOVE {params['id']} TO {params['parent']}"
+        )
+
+    def edge_add(self, params):
+        edge_type = params.get("edge_type", "references")
+        command = f"LINK {params['source']} {edge_type} {params['target']}"
+        return self._ucl(self._doc(params), command)
+
+    def ucl_exec(self, params):
+        return self._ucl(self._doc(params), params["commands"])
+
+    # -- queries --------------------------------------------------------------
+
+    def find(self, params):
+        doc = self._doc(params)
+        if params.get("tag"):
+            ids = doc.find_by_tag(params["tag"])
+        elif params.get("type"):
+            ids = doc.find_by_type(params["type"])
+        else:
+            raise CliServerError(INVALID_PARAMS, "find needs tag or type")
+        return {"ids": [str(block_id) for block_id in ids]}
+
+    def validate(self, params):
+        issues = self._doc(params).validate()
+        issues = [str(issue) for issue in issues or []]
+        return {"valid": not issues, "issues": issues}
+
+    def export_json(self, params):
+        return {"json": self._doc(params).to_json()}
+
+    # -- CLI-style arguments --------------------------------------------------
+
+    # Flags that take no value; they map to True
+    SWITCH = object()
+
+    # Global `ucp` flags, accepted anywhere and ignored (param None)
+    GLOBAL_FLAGS = {
+        "-v": (None, SWITCH),
+        "--verbose": (None, SWITCH),
+        "--trace": (None, SWITCH),
+        "-f": (None, str),
+        "--format": (None, str),
+    }
+
+    # (subcommand words) -> (method, {flag: (param, SWITCH or str)})
+    CLI_COMMANDS = {
+        ("info",): ("info", {}),
+        ("validate",): ("validate", {}),
+        ("export", "json"): ("export_json", {"--pretty": (None, SWITCH)}),
+        ("find",): ("find", {"--tag": ("tag", str), "--type": ("type", str)}),
+        ("ucl", "exec"): ("ucl_exec", {"--commands": ("commands", str)}),
+        ("block", "add"): (
+            "block_add",
+            {
+                "--parent": ("parent", str),
+                "--content": ("content", str),
+                "--content-type": ("content_type", str),
+                "--language": ("language", str),
+                "--role": ("role", str),
+                "--label": ("label", str),
+                "--tags": ("tags", str),
+            },
+        ),
+        ("block", "delete"): (
+            "block_delete",
+            {
+                "--id": ("id", str),
+                "--cascade": ("cascade", SWITCH),
+                "--preserve-children": ("preserve_children", SWITCH),
+            },
+        ),
+        ("block", "move"): (
+            "block_move",
+            {
+                "--id": ("id", str),
+                "--parent": ("parent", str),
+                "--to-parent": ("parent", str),
+            },
+        ),
+        ("edge", "add"): (
+            "edge_add",
+            {
+                "--source": ("source", str),
+                "--target": ("target", str),
+                "--edge-type": ("edge_type", str),
+            },
+        ),
+    }
+
+    def cli(self, params):
+        argv = list(params["argv"])
+        # `ucp --format json info`: drop global flags before the subcommand
+        while argv and argv[0] in self.GLOBAL_FLAGS:
+            _, arity = self.GLOBAL_FLAGS[argv.pop(0)]
+            if arity is not self.SWITCH and argv:
+                argv.pop(0)
+        for words, (method, flags) in self.CLI_COMMANDS.items():
+            if tuple(argv[: len(words)]) == words:
+                break
+        else:
+            raise CliServerError(METHOD_NOT_FOUND, f"unsupported command: {argv}")
+
+        flags = {**self.GLOBAL_FLAGS, **flags}
+        mapped = {"doc": params["doc"]}
+        rest = iter(argv[len(words) :])
+        for flag in rest:
+            if flag not in flags:
+                if flag.startswith("-"):
+                    message = f"unsupported flag {flag} for {' '.join(words)}"
+                else:
+                    message = f"unexpected argument {flag!r}"
+                raise CliServerError(INVALID_PARAMS, message)
+            param, arity = flags[flag]
+            if arity is self.SWITCH:
+                value = True
+            else:
+                value = next(rest, None)
+                if value is None:
+                    raise CliServerError(INVALID_PARAMS, f"{flag} needs a value")
+            if param is not None:
+                mapped[param] = value
+        if "tags" in mapped:
+            mapped["tags"] = [tag for tag in mapped["tags"].split(",") if tag]
+        return getattr(self, method)(mapped)
+
+
+def handle_request(handlers, request):
+    """Execute one JSON-RPC request object and return its response."""
+    request_id = request.get("id")
+    method = str(request.get("method", "")).replace(".", "_")
+    handler = getattr(handlers, method, None)
+    if method.startswith("_") or not callable(handler):
+        error = {"code": METHOD_NOT_FOUND, "message": f"unknown method {method}"}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    try:
+        start = time.perf_counter_ns()
+        result = handler(request.get("params") or {})
+        elapsed_ns = time.perf_counter_ns() - start
+    except CliServerError as e:
+        error = {"code": e.code, "message": e.message}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    except (KeyError, TypeError) as e:
+        error = {"code": INVALID_PARAMS, "message": f"{type(e).__name__}: {e}"}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    except Exception as e:
+        error = {"code": ENGINE_ERROR, "message": f"{type(e).__name__}: {e}"}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    result["elapsed_ns"] = elapsed_ns
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout):
+    """Answer one request per input line until EOF."""
+    # The Python binding, not the `ucp` binary (see the module docstring)
+    handlers = _Handlers(sdk())
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": PARSE_ERROR, "message": str(e)},
+            }
+        else:
+            response = handle_request(handlers, request)
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+class ServerDocument:
+    """A document living inside a UcpServer."""
+
+    def __init__(self, server, handle, root):
+        self.server = server
+        self.handle = handle
+        self.root = root
+
+    def call(self, method, **params):
+        return self.server.call(method, doc=self.handle, **params)
+
+    def add_block(self, parent, content, **options):
+        return self.call("block.add", parent=parent, content=content, **options)["id"]
+
+    def ucl(self, commands):
+        return self.call("ucl.exec", commands=commands)["affected"]
+
+    def find(self, tag=None, type=None):
+        return self.call("find", tag=tag, type=type)["ids"]
+
+    def validate(self):
+        return self.call("validate")
+
+    def to_json(self):
+        return self.call("export.json")["json"]
+
+    def cli(self, *argv):
+        """Run a CLI-style command against this document."""
+        return self.call("cli", argv=list(argv))
+
+    def close(self):
+        self.call("document.close")
+
+
+class UcpServer:
+    """Client for a `python -m harness.cli_server` child process."""
+
+    def __init__(self, python=sys.executable):
+        self.proc = subprocess.Popen(
+            [python, "-m", "harness.cli_server"],
+            cwd=REPO_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self._ids = itertools.count(1)
+
+    def call(self, method, **params):
+        """Send one request and return its result, raising CliServerError."""
+        request_id = next(self._ids)
+        request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        request["params"] = {k: v for k, v in params.items() if v is not None}
+        self.proc.stdin.write(json.dumps(request) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise CliServerError(ENGINE_ERROR, "server exited")
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise CliServerError(error["code"], error["message"])
+        return response["result"]
+
+    def create(self, title=None):
+        result = self.call("document.create", title=title)
+        return ServerDocument(self, result["doc"], result["root"])
+
+    def load(self, path=None, data=None):
+        result = self.call("document.load", path=str(path) if path else None, json=data)
+        return ServerDocument(self, result["doc"], result["root"])
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,439 @@
+"""
+Seeded synthetic UCM documents with a content-addressed on-disk cache.
+
+Scale and structure tests (STR-017 deep, STR-018 wide, tier 6 edges, tier 3
+content types, tier 19 sizes) need large documents, and building them with
+one `add_block` call per block costs seconds per test. `CorpusSpec`
+describes a document; `generate` builds it deterministically from the spec,
+and the cache stores every rendering under the hash of the spec:
+
+    .processor/corpus/<key>.json   UCM JSON (shape of the repo-root `json`)
+    .processor/corpus/<key>.md     Markdown (like photosynthesis_test.md)
+    .processor/corpus/<key>.html   HTML
+
+Tree shape: a spine of `depth` blocks guarantees the requested depth, then
+blocks are added breadth-first with at most `width` children per parent
+and no block deeper than `depth`. Blocks with children are headings; leaves
+draw their content type from `mix`. `edge_density` edges per block connect
+random pairs of non-root blocks.
+
+A spec must fit its tree: at most width + width**2 + ... + width**depth
+blocks (11110 with the default depth 4 and width 10), so raise `width` or
+`depth` for larger documents.
+
+Usage in a test:
+    from harness.corpus import CorpusSpec, load
+    doc = Document.from_json(load(CorpusSpec(blocks=100_000, width=50)))
+
+    python -m harness.corpus --blocks 100000 --width 50 --format all
+    python -m harness.corpus --list
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import mmap
+import os
+import random
+import sys
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from harness.paths import PROCESSOR_DIR
+
+# Bump when generated output changes so stale cache entries are not reused
+GENERATOR_VERSION = 1
+
+CACHE_ENV_VAR = "UCP_CORPUS_CACHE"
+DEFAULT_CACHE_ROOT = PROCESSOR_DIR / "corpus"
+
+FORMATS = ("json", "md", "html")
+CONTENT_TYPES = ("text", "code", "table", "math", "json")
+DEFAULT_MIX = {"text": 70, "code": 15, "table": 10, "math": 5}
+EDGE_TYPES = ("references", "derived_from", "supports", "elaborates", "summarizes")
+
+ROOT_ID = "ff0000000000000000000000"
+TIMESTAMP = "2026-01-01T00:00:00Z"
+CORPUS_TAG = "corpus"
+TAG_EVERY = 10
+
+WORDS = (
+    "light energy water carbon oxygen glucose membrane protein enzyme cell "
+    "structure process reaction cycle electron gradient pigment photon leaf "
+    "stroma thylakoid chlorophyll synthesis pathway molecule"
+).split()
+LANGUAGES = ("python", "rust", "javascript")
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Parameters of one synthetic document; equal specs give equal output."""
+
+    blocks: int = 1000
+    depth: int = 4
+    width: int = 10
+    edge_density: float = 0.0
+    mix: dict = field(default_factory=lambda: dict(DEFAULT_MIX))
+    seed: int = 0
+    title: str = "Synthetic Corpus"
+
+    def __post_init__(self):
+        if self.blocks < 1 or self.depth < 1 or self.width < 1:
+            raise ValueError("blocks, depth and width must be positive")
+        unknown = set(self.mix) - set(CONTENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown content types {sorted(unknown)}")
+        if not self.mix or sum(self.mix.values()) <= 0:
+            raise ValueError("Content mix needs at least one positive weight")
+        capacity = sum(self.width**d for d in range(1, self.depth + 1))
+        if self.blocks > capacity:
+            raise ValueError(
+                f"{self.blocks} blocks do not fit in depth {self.depth} "
+                f"x width {self.width} (at most {capacity})"
+            )
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        """Content address of this spec's output."""
+        data = asdict(self)
+        data["mix"] = sorted(self.mix.items())
+        data["generator"] = GENERATOR_VERSION
+        encoded = json.dumps(data, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:20]
+
+
+# -- tree and content ---------------------------------------------------------
+
+
+def _sentence(rng, low=5, high=25):
+    words = rng.choices(WORDS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+
+def _content(rng, kind, index):
+    if kind == "text":
+        return {"type": "text", "text": _sentence(rng), "format": "plain"}
+    if kind == "code":
+        body = "\n".join(f"    step_{index}_{i}()" for i in range(rng.randint(1, 4)))
+        return {
+            "type": "code",
+            "language": rng.choice(LANGUAGES),
+            "source": f"def block_{index}():\n{body}\n",
+        }
+    if kind == "table":
+        columns = [{"name": name} for name in ("Component", "Input", "Output")]
+        rows = [
+            [rng.choice(WORDS), str(rng.randint(0, 99)), str(rng.random() < 0.5)]
+            for _ in range(rng.randint(2, 5))
+        ]
+        return {"type": "table", "columns": columns, "rows": rows}
+    if kind == "math":
+        a, b = rng.randint(1, 12), rng.randint(1, 12)
+        expression = f"{a}CO_2 + {b}H_2O \\rightarrow C_{{{a}}}H_{{{2 * b}}}O_{{{a}}}"
+        return {
+            "type": "math",
+            "format": "latex",
+            "expression": expression,
+            "display_mode": True,
+        }
+    return {
+        "type": "json",
+        "value": {"index": index, "label": rng.choice(WORDS), "ok": True},
+    }
+
+
+def _tree(spec):
+    """Return (parents, depths) lists; index 0 is the root."""
+    parents, depths, children = [None], [0], [0]
+    # Spine first, so the deepest level exists whatever the block count
+    for level in range(1, min(spec.depth, spec.blocks - 1) + 1):
+        parents.append(level - 1)
+        depths.append(level)
+        children[level - 1] += 1
+        children.append(0)
+    frontier = 0
+    while len(parents) < spec.blocks:
+        if depths[frontier] < spec.depth and children[frontier] < spec.width:
+            parents.append(frontier)
+            depths.append(depths[frontier] + 1)
+            children[frontier] += 1
+            children.append(0)
+        else:
+            frontier += 1
+    return parents, depths
+
+
+def generate(spec):
+    """Build the UCM JSON document (as a dict) described by spec."""
+    rng = random.Random(spec.seed)
+    parents, depths = _tree(spec)
+    ids = [ROOT_ID] + [f"{rng.getrandbits(96):024x}" for _ in parents[1:]]
+    keys = [f"blk_{block_id}" for block_id in ids]
+    has_children = set(parent for parent in parents if parent is not None)
+    kinds = list(spec.mix)
+    weights = [spec.mix[kind] for kind in kinds]
+
+    structure = {}
+    blocks = {}
+    for index, block_id in enumerate(ids):
+        if index == 0:
+            content = {"type": "text", "text": "", "format": "plain"}
+        elif index in has_children:
+            content = {"type": "text", "text": _sentence(rng, 2, 6), "format": "plain"}
+        else:
+            content = _content(rng, rng.choices(kinds, weights)[0], index)
+        encoded = json.dumps(content, sort_keys=True).encode()
+        metadata = {
+            "content_hash": hashlib.sha256(encoded).hexdigest(),
+            "created_at": TIMESTAMP,
+            "modified_at": TIMESTAMP,
+        }
+        if index in has_children and index:
+            metadata["semantic_role"] = f"heading{min(depths[index], 6)}"
+        if index and index % TAG_EVERY == 0:
+            metadata["tags"] = [CORPUS_TAG]
+        blocks[keys[index]] = {
+            "id": block_id,
+            "content": content,
+            "metadata": metadata,
+            "edges": [],
+            "version": {"counter": 1, "timestamp": TIMESTAMP},
+        }
+        if parents[index] is not None:
+            structure.setdefault(keys[parents[index]], []).append(keys[index])
+
+    if len(ids) > 2:
+        for _ in range(round(spec.edge_density * (len(ids) - 1))):
+            source, target = rng.sample(range(1, len(ids)), 2)
+            blocks[keys[source]]["edges"].append(
+                {
+                    "edge_type": rng.choice(EDGE_TYPES),
+                    "target": keys[target],
+                    "metadata": {},
+                    "created_at": TIMESTAMP,
+                }
+            )
+
+    return {
+        "id": f"doc_{rng.getrandbits(64):016x}",
+        "root": keys[0],
+        "structure": structure,
+        "blocks": blocks,
+        "metadata": {
+            "title": spec.title,
+            "authors": [],
+            "created_at": TIMESTAMP,
+            "modified_at": TIMESTAMP,
+        },
+        "version": 1,
+    }
+
+
+# -- renderers ----------------------------------------------------------------
+
+
+def _walk(document):
+    """Yield (depth, block) in document order, root excluded."""
+    structure, blocks = document["structure"], document["blocks"]
+    stack = [(1, key) for key in reversed(structure.get(document["root"], []))]
+    while stack:
+        depth, key = stack.pop()
+        yield depth, blocks[key]
+        stack.extend((depth + 1, child) for child in reversed(structure.get(key, [])))
+
+
+def to_markdown(document):
+    lines = [f"# {document['metadata']['title']}", ""]
+    for _, block in _walk(document):
+        content = block["content"]
+        role = block["metadata"].get("semantic_role", "")
+        kind = content["type"]
+        if role.startswith("heading"):
+            level = min(int(role[len("heading") :]) + 1, 6)
+            lines.append(f"{'#' * level} {content['text']}")
+        elif kind == "text":
+            lines.append(content["text"])
+        elif kind == "code":
+            lines += [f"```{content['language']}", content["source"].rstrip(), "```"]
+        elif kind == "table":
+            names = [column["name"] for column in content["columns"]]
+            lines.append("| " + " | ".join(names) + " |")
+            lines.append("|" + "|".join("---" for _ in names) + "|")
+            lines += ["| " + " | ".join(row) + " |" for row in content["rows"]]
+        elif kind == "math":
+            lines.append(f"$${content['expression']}$$")
+        else:
+            lines += ["```json", json.dumps(content["value"]), "```"]
+        lines.append("")
+    return "\n".join(lines)
+
+
+def to_html(document):
+    title = html.escape(document["metadata"]["title"])
+    parts = ["<!DOCTYPE html>", f"<html><head><title>{title}</title></head><body>"]
+    parts.append(f"<h1>{title}</h1>")
+    for _, block in _walk(document):
+        content = block["content"]
+        role = block["metadata"].get("semantic_role", "")
+        kind = content["type"]
+        if role.startswith("heading"):
+            level = min(int(role[len("heading") :]) + 1, 6)
+            parts.append(f"<h{level}>{html.escape(content['text'])}</h{level}>")
+        elif kind == "text":
+            parts.append(f"<p>{html.escape(content['text'])}</p>")
+        elif kind == "code":
+            parts.append(
+                f'<pre><code class="language-{content["language"]}">'
+                f"{html.escape(content['source'])}</code></pre>"
+            )
+        elif kind == "table":
+            cells = [[column["name"] for column in content["columns"]]]
+            cells += content["rows"]
+            rows = "".join(
+                "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row)
+                + "</tr>"
+                for row in cells
+            )
+            parts.append(f"<table>{rows}</table>")
+        elif kind == "math":
+            expression = html.escape(content["expression"])
+            parts.append(f'<div class="math">{expression}</div>')
+        else:
+            parts.append(f"<pre>{html.escape(json.dumps(content['value']))}</pre>")
+    parts.append("</body></html>")
+    return "\n".join(parts) + "\n"
+
+
+def render(document, fmt):
+    if fmt == "json":
+        return json.dumps(document, separators=(",", ":"))
+    if fmt == "md":
+        return to_markdown(document)
+    if fmt == "html":
+        return to_html(document)
+    raise ValueError(f"Unknown format {fmt!r}; use {FORMATS}")
+
+
+# -- cache --------------------------------------------------------------------
+
+
+def cache_root():
+    """Return the corpus cache directory."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    return Path(override) if override else DEFAULT_CACHE_ROOT
+
+
+def corpus_path(spec, fmt="json"):
+    """
+    Return the cached file for spec in fmt, generating it on a miss.
+
+    A miss renders every format at once (generation dominates rendering)
+    and writes each file atomically, so concurrent tests never read a
+    partial file.
+    """
+    root = cache_root()
+    path = root / f"{spec.key}.{fmt}"
+    if path.exists():
+        return path
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; use {FORMATS}")
+    root.mkdir(parents=True, exist_ok=True)
+    document = generate(spec)
+    for name in FORMATS:
+        target = root / f"{spec.key}.{name}"
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(render(document, name), encoding="utf-8")
+        os.replace(tmp, target)
+    manifest = {"spec": asdict(spec), "generator": GENERATOR_VERSION}
+    (root / f"{spec.key}.spec.json").write_text(json.dumps(manifest, indent=2))
+    return path
+
+
+@contextmanager
+def mapped(spec, fmt="json"):
+    """Memory-map the cached file read-only; yields an mmap (bytes-like)."""
+    with open(corpus_path(spec, fmt), "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def load(spec, fmt="json"):
+    """Return the cached rendering as text, e.g. for Document.from_json."""
+    with mapped(spec, fmt) as view:
+        return str(view[:], "utf-8")
+
+
+def cached_specs():
+    """Return [(key, manifest, bytes)] for every cache entry."""
+    entries = []
+    root = cache_root()
+    for manifest_path in sorted(root.glob("*.spec.json")):
+        key = manifest_path.name[: -len(".spec.json")]
+        size = sum(p.stat().st_size for p in root.glob(f"{key}.*") if p.is_file())
+        entries.append((key, json.loads(manifest_path.read_text()), size))
+    return entries
+
+
+def parse_mix(text):
+    """Parse "text=70,code=30" into {type: weight}."""
+    mix = {}
+    for part in filter(None, text.split(",")):
+        name, _, weight = part.partition("=")
+        mix[name.strip().lower()] = float(weight or 1)
+    return mix
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Synthetic UCM corpus generator")
+    parser.add_argument("--blocks", type=int, default=CorpusSpec.blocks)
+    parser.add_argument("--depth", type=int, default=CorpusSpec.depth)
+    parser.add_argument("--width", type=int, default=CorpusSpec.width)
+    parser.add_argument("--edge-density", type=float, default=0.0)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help=f"Content type weights over {', '.join(CONTENT_TYPES)}",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--format", choices=FORMATS + ("all",), default="json", help="Output format"
+    )
+    parser.add_argument("--list", action="store_true", help="List cache entries")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for key, manifest, size in cached_specs():
+            spec = manifest["spec"]
+            print(
+                f"{key}  {spec['blocks']:>8} blocks  depth {spec['depth']:>3}  "
+                f"width {spec['width']:>4}  edges {spec['edge_density']:g}  "
+                f"{size / 1e6:.1f} MB"
+            )
+        return 0
+
+    try:
+        spec = CorpusSpec(
+            blocks=args.blocks,
+            depth=args.depth,
+            width=args.width,
+            edge_density=args.edge_density,
+            mix=args.mix,
+            seed=args.seed,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    for fmt in FORMATS if args.format == "all" else (args.format,):
+        print(corpus_path(spec, fmt))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Input fingerprints for incremental checklist runs.
+
+An item's fingerprint hashes everything that can change its outcome:
+
+- its checklist row (ID, target, priority, risk; not the status column)
+- the prompt files in agent-resources/prompts/
+- the installed SDK versions: `ucp-content` (Python), the first of
+  JS_PACKAGES under node_modules/ (JavaScript) and `ucp --version` (CLI)
+- the test sources under runs/<tier>/<ITEM>/tests/ (build output excluded)
+
+Fingerprints of successfully completed items are stored in
+.processor/fingerprints.json; `run.py --incremental` re-runs only items
+whose current fingerprint differs from the stored one.
+"""
+
+import hashlib
+import json
+import subprocess
+from functools import lru_cache
+from importlib import metadata
+
+from harness.paths import PROCESSOR_DIR, REPO_ROOT
+
+FINGERPRINTS_PATH = PROCESSOR_DIR / "fingerprints.json"
+PROMPTS_DIR = REPO_ROOT / "agent-resources" / "prompts"
+
+# Directories under tests/ that hold build output rather than sources
+IGNORED_DIRS = {"target", "node_modules", "__pycache__", ".pytest_cache"}
+IGNORED_FILES = {"Cargo.lock"}
+
+# JavaScript SDK package names across releases, first found wins (shared
+# with harness.capabilities)
+JS_PACKAGES = ("ucp-content", "@ucp-core/core", "@ucp-js/sdk")
+
+
+def python_sdk_version():
+    """Return the installed ucp-content version, or None."""
+    try:
+        return metadata.version("ucp-content")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def js_sdk_version(packages=JS_PACKAGES):
+    """Return "<package>@<version>" of the installed JavaScript SDK, or None."""
+    for package in packages:
+        manifest = REPO_ROOT / "node_modules" / package / "package.json"
+        try:
+            version = json.loads(manifest.read_text()).get("version")
+        except (OSError, ValueError):
+            continue
+        return f"{package}@{version}"
+    return None
+
+
+def _cli_version():
+    try:
+        proc = subprocess.run(
+            ["ucp", "--version"], capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return proc.stdout.strip() or None
+
+
+@lru_cache(maxsize=None)
+def sdk_versions():
+    """Return the installed UCP SDK versions, probed once per process."""
+    return {
+        "ucp-content": python_sdk_version(),
+        "javascript": js_sdk_version(),
+        "ucp-cli": _cli_version(),
+    }
+
+
+def _hash_tree(digest, root):
+    """Feed every source file below root (path and bytes) into digest."""
+    if not root.exists():
+        return
+    for path in sorted(root.rglob("*")):
+        relative = path.relative_to(root)
+        if IGNORED_DIRS.intersection(relative.parts) or path.name in IGNORED_FILES:
+            continue
+        if path.is_file():
+            digest.update(str(relative).encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+
+
+@lru_cache(maxsize=None)
+def _prompts_digest():
+    digest = hashlib.sha256()
+    _hash_tree(digest, PROMPTS_DIR)
+    return digest.hexdigest()
+
+
+def item_fingerprint(item):
+    """Return the hex fingerprint of an item's current inputs."""
+    digest = hashlib.sha256()
+    row = [item.id, item.target, item.priority, item.risk]
+    digest.update(json.dumps(row).encode())
+    digest.update(_prompts_digest().encode())
+    digest.update(json.dumps(sdk_versions(), sort_keys=True).encode())
+    _hash_tree(digest, item.run_dir / "tests")
+    return digest.hexdigest()
+
+
+def load_fingerprints(path=FINGERPRINTS_PATH):
+    """Return the stored item ID -> fingerprint mapping."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_fingerprints(fingerprints, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(fingerprints, indent=2, sort_keys=True))
+    tmp_path.replace(path)
+
+
+def record_fingerprint(item, path=FINGERPRINTS_PATH):
+    """Store the current fingerprint of a completed item."""
+    fingerprints = load_fingerprints(path)
+    fingerprints[item.id] = item_fingerprint(item)
+    _save_fingerprints(fingerprints, path)
+
+
+def changed_items(items, path=FINGERPRINTS_PATH):
+    """
+    Return the items whose fingerprint differs from the stored one.
+
+    Items already marked completed but never fingerprinted (e.g. finished
+    before incremental mode existed) are adopted as a baseline instead of
+    being re-run.
+    """
+    stored = load_fingerprints(path)
+    changed, adopted = [], False
+    for item in items:
+        current = item_fingerprint(item)
+        if item.id not in stored and item.completed:
+            stored[item.id] = current
+            adopted = True
+        elif stored.get(item.id) != current:
+            changed.append(item)
+    if adopted:
+        _save_fingerprints(stored, path)
+    return changed
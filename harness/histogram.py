@@ -0,0 +1,109 @@
+"""
+Log-linear latency histogram in the style of HdrHistogram.
+
+Values (nanoseconds) are bucketed by power of two and then linearly into
+2**SUB_BUCKET_BITS sub-buckets, so any recorded value is reproduced to
+within 1 / 2**SUB_BUCKET_BITS (< 1%) while memory stays proportional to
+the number of distinct magnitudes rather than the number of samples.
+That keeps 10K-100K samples per command type cheap to record and merge.
+"""
+
+from dataclasses import dataclass, field
+
+SUB_BUCKET_BITS = 7
+
+
+def _bucket(value):
+    """Return the (magnitude, sub-bucket) key holding value."""
+    magnitude = value.bit_length()
+    shift = max(magnitude - SUB_BUCKET_BITS, 0)
+    return magnitude, value >> shift
+
+
+def _bucket_value(key):
+    """Return the midpoint value represented by a bucket key."""
+    magnitude, sub = key
+    shift = max(magnitude - SUB_BUCKET_BITS, 0)
+    return (sub << shift) + ((1 << shift) >> 1)
+
+
+@dataclass
+class LatencyHistogram:
+    """Sparse log-linear histogram of non-negative integer latencies."""
+
+    counts: dict = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+    min: int = None
+    max: int = None
+
+    def record(self, value):
+        value = max(int(value), 0)
+        key = _bucket(value)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Add every sample of another histogram to this one."""
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for bound, pick in (("min", min), ("max", max)):
+            theirs = getattr(other, bound)
+            if theirs is not None:
+                mine = getattr(self, bound)
+                setattr(self, bound, theirs if mine is None else pick(mine, theirs))
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def value_at(self, fraction):
+        """Return the value at a percentile given as a fraction (0.99 = p99)."""
+        if not self.count:
+            return 0
+        target = max(1, round(fraction * self.count))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= target:
+                return min(max(_bucket_value(key), self.min), self.max)
+        return self.max
+
+    def summary(self):
+        """Percentile summary in nanoseconds."""
+        return {
+            "count": self.count,
+            "min_ns": self.min or 0,
+            "mean_ns": round(self.mean, 1),
+            "p50_ns": self.value_at(0.50),
+            "p90_ns": self.value_at(0.90),
+            "p99_ns": self.value_at(0.99),
+            "p999_ns": self.value_at(0.999),
+            "max_ns": self.max or 0,
+        }
+
+    def to_dict(self):
+        """JSON-friendly form; restore with from_dict."""
+        return {
+            "buckets": [[m, s, c] for (m, s), c in sorted(self.counts.items())],
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            counts={(m, s): c for m, s, c in data["buckets"]},
+            count=data["count"],
+            total=data["total"],
+            min=data["min"],
+            max=data["max"],
+        )
@@ -0,0 +1,254 @@
+"""
+Append-only, crash-safe session journal.
+
+The processor rewrites `.processor/session-*.json` (and its copy
+`active-runs.json`) in full on every state transition. The journal instead
+appends one JSON line per transition to `.processor/<session>.jsonl`, so
+each write is O(1) and a crash loses at most the line being written.
+
+Every `compact_every` events the in-memory state is checkpointed to
+`.processor/<session>.json` in the processor's snapshot format (also
+mirrored to `active-runs.json` for existing monitors) and the journal is
+truncated. Loading a session reads the checkpoint and replays the journal
+tail; a torn final line is ignored.
+
+Usage:
+    python -m harness.journal                 # list sessions
+    python -m harness.journal <session-id>    # show one session's summary
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from harness.paths import PROCESSOR_DIR
+
+# Mirror of the current session kept for monitors written against the processor
+ACTIVE_RUNS_NAME = "active-runs.json"
+DEFAULT_COMPACT_EVERY = 200
+
+# Run statuses counted as "active" in the summary
+_ACTIVE_STATUSES = {"running", "pending_retry"}
+
+
+def _now():
+    return datetime.now().isoformat()
+
+
+def _atomic_write(path, data):
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def summarize(state):
+    """Return the processor-style summary block for a session state."""
+    runs = state["runs"]
+    latest = {}
+    for run in runs:
+        latest[run["item_id"]] = run
+    statuses = [run["status"] for run in latest.values()]
+    return {
+        "session_id": state["sessionId"],
+        "status": state["status"],
+        "total": len(latest),
+        "pending": statuses.count("pending"),
+        "active": sum(status in _ACTIVE_STATUSES for status in statuses),
+        "completed": statuses.count("completed"),
+        "failed": statuses.count("failed"),
+        "timeout": statuses.count("timeout"),
+        "perf_failed": statuses.count("perf_failed"),
+    }
+
+
+class SessionJournal:
+    """Session state backed by a checkpoint plus an append-only journal."""
+
+    def __init__(
+        self, session_id, directory=PROCESSOR_DIR, compact_every=DEFAULT_COMPACT_EVERY
+    ):
+        self.session_id = session_id
+        self.directory = directory
+        self.compact_every = compact_every
+        self.snapshot_path = directory / f"{session_id}.json"
+        self.journal_path = directory / f"{session_id}.jsonl"
+        self.state = {
+            "sessionId": session_id,
+            "status": "running",
+            "startedAt": _now(),
+            "completedAt": None,
+            "runs": [],
+        }
+        self._run_index = {}
+        self._pending_events = 0
+        self._file = None
+
+    # -- construction -----------------------------------------------------
+
+    @classmethod
+    def create(cls, directory=PROCESSOR_DIR, **kwargs):
+        """Start a new session and checkpoint its empty state."""
+        directory.mkdir(parents=True, exist_ok=True)
+        journal = cls(f"session-{int(time.time() * 1000)}", directory, **kwargs)
+        journal.checkpoint()
+        return journal
+
+    @classmethod
+    def load(cls, session_id, directory=PROCESSOR_DIR, repair=False, **kwargs):
+        """
+        Load a session from its checkpoint and replay the journal tail.
+
+        Loading is read-only, so inspecting a live session is safe. Pass
+        repair=True only from the process taking the session over (resume):
+        it cuts a torn final line off the journal so later appends start
+        on a clean line.
+        """
+        journal = cls(session_id, directory, **kwargs)
+        if journal.snapshot_path.exists():
+            state = json.loads(journal.snapshot_path.read_text())
+            state.pop("summary", None)
+            journal.state = state
+            journal._reindex()
+        if journal.journal_path.exists():
+            valid_bytes = 0
+            with open(journal.journal_path, "rb") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # Torn write from a crash (or a write in progress):
+                        # everything before it is intact
+                        break
+                    journal._apply(event)
+                    journal._pending_events += 1
+                    valid_bytes += len(line)
+            if repair:
+                os.truncate(journal.journal_path, valid_bytes)
+        return journal
+
+    @classmethod
+    def latest_running(cls, directory=PROCESSOR_DIR, repair=False, **kwargs):
+        """
+        Return the most recent session left in "running" state, or None.
+
+        With repair=True the returned session is loaded for appending (see
+        load); the sessions skipped on the way are only read.
+        """
+        for session_id in reversed(list_sessions(directory)):
+            journal = cls.load(session_id, directory, **kwargs)
+            if journal.state["status"] == "running":
+                if repair:
+                    journal = cls.load(session_id, directory, repair=True, **kwargs)
+                return journal
+        return None
+
+    # -- state transitions ------------------------------------------------
+
+    def _reindex(self):
+        self._run_index = {run["id"]: run for run in self.state["runs"]}
+
+    def _apply(self, event):
+        if event["op"] == "session":
+            self.state.update(event["fields"])
+        elif event["op"] == "run":
+            run = self._run_index.get(event["id"])
+            if run is None:
+                run = {"id": event["id"]}
+                self.state["runs"].append(run)
+                self._run_index[event["id"]] = run
+            run.update(event["fields"])
+
+    def _append(self, event):
+        if self._file is None:
+            self._file = open(self.journal_path, "a")
+        self._apply(event)
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+        self._pending_events += 1
+        if self._pending_events >= self.compact_every:
+            self.checkpoint()
+
+    def update_run(self, run_id, **fields):
+        """Record a run's changed fields (creating the run if new)."""
+        self._append({"op": "run", "id": run_id, "ts": _now(), "fields": fields})
+
+    def update_session(self, **fields):
+        """Record changed session-level fields."""
+        self._append({"op": "session", "ts": _now(), "fields": fields})
+
+    def finish(self, status="completed"):
+        """Mark the session finished and write a final checkpoint."""
+        self.update_session(status=status, completedAt=_now())
+        self.checkpoint()
+        self.close()
+
+    def recover(self):
+        """Mark runs left "running" by a crashed process as interrupted."""
+        stale = [run for run in self.state["runs"] if run.get("status") == "running"]
+        for run in stale:
+            self.update_run(run["id"], status="interrupted", error="session interrupted")
+        return stale
+
+    # -- persistence ------------------------------------------------------
+
+    def snapshot(self):
+        """Return the full session document in the processor's format."""
+        return dict(self.state, summary=summarize(self.state))
+
+    def checkpoint(self):
+        """Write the snapshot atomically and truncate the journal."""
+        data = json.dumps(self.snapshot(), indent=2)
+        _atomic_write(self.snapshot_path, data)
+        _atomic_write(self.directory / ACTIVE_RUNS_NAME, data)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.journal_path.unlink(missing_ok=True)
+        self._pending_events = 0
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def list_sessions(directory=PROCESSOR_DIR):
+    """Return known session IDs, oldest first."""
+    ids = {
+        path.name.split(".")[0]
+        for pattern in ("session-*.json", "session-*.jsonl")
+        for path in directory.glob(pattern)
+    }
+    # session-<epoch ms>: numeric order is chronological order
+    return sorted(ids, key=lambda session_id: session_id.split("-")[-1].zfill(20))
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Inspect session journals")
+    parser.add_argument("session_id", nargs="?", help="Session to show")
+    args = parser.parse_args(argv)
+
+    if not args.session_id:
+        for session_id in list_sessions():
+            summary = summarize(SessionJournal.load(session_id).state)
+            print(
+                f"{session_id}  {summary['status']:10} "
+                f"{summary['completed']}/{summary['total']} completed, "
+                f"{summary['failed']} failed"
+            )
+        return 0
+
+    summary = SessionJournal.load(args.session_id).snapshot()["summary"]
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
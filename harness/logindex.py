@@ -0,0 +1,358 @@
+"""
+Streaming full-text index of agent session logs.
+
+Agent logs (runs/<tier>/<ITEM>/results/agent-<ITEM>-<ms>.log) are raw
+terminal output: a header, agent prose, and one coloured `| <Tool> <what>`
+line per tool invocation followed by that tool's output. This module
+strips the ANSI escapes, splits each log into entries (the prose before
+the first tool call, then one entry per tool call with its output) and
+stores them in SQLite with an FTS5 index:
+
+    logs(path, item, offset, size, runtime, model, attempt, started,
+         exit_code)
+    entries(id, path, item, seq, offset, tool, description, output,
+            failed, failure)
+    entries_fts(description, output)        -- FTS5 over entries
+
+Ingestion is incremental. Each log remembers the byte offset where its
+last (possibly still growing) entry starts; the next pass re-reads only
+from there, so following hundreds of growing logs costs one short read
+per changed file. An entry is marked failed when its output contains a
+traceback, an `Error:` line, a cargo/npm error, a panic or a failed test
+marker; `failure` holds the first such line.
+
+Usage:
+    python -m harness.logindex                       # index runs/ once
+    python -m harness.logindex --follow              # keep indexing
+    python -m harness.logindex --failed --tool Bash  # failed Bash calls
+    python -m harness.logindex --search "parse error" --item UCL-001
+"""
+
+import argparse
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from harness.paths import PROCESSOR_DIR, RUNS_DIR
+
+DB_PATH = PROCESSOR_DIR / "logs.sqlite"
+LOG_GLOB = "*/*/results/agent-*.log"
+FOLLOW_INTERVAL = 2.0
+
+ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+# After stripping: "|  Bash     Check current directory"
+TOOL_RE = re.compile(r"^\| +([A-Za-z][\w-]*) +(.*)$")
+HEADER_RE = re.compile(r"^(Started|Runtime|Model|Attempt|Exit code): (.*)$")
+FOOTER_RULE = "=" * 50
+
+FAILURE_RE = re.compile(
+    r"^(?:Traceback \(most recent call last\)"
+    r"|[\w.]*(?:Error|Exception)(?:\[\w+\])?: "
+    r"|error(?:\[E\d+\])?: "
+    r"|npm (?:error|ERR!)"
+    r"|thread '.*' panicked at"
+    r"|.*command not found"
+    r"|.*(?:❌|\bFAILED\b))"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    path TEXT PRIMARY KEY,
+    item TEXT,
+    offset INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0,
+    next_seq INTEGER NOT NULL DEFAULT 0,
+    runtime TEXT,
+    model TEXT,
+    attempt INTEGER,
+    started TEXT,
+    exit_code INTEGER
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    item TEXT,
+    seq INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    tool TEXT,
+    description TEXT,
+    output TEXT,
+    failed INTEGER NOT NULL,
+    failure TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_path ON entries (path, offset);
+CREATE INDEX IF NOT EXISTS entries_tool ON entries (tool, failed);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    description, output, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts (rowid, description, output)
+    VALUES (new.id, new.description, new.output);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts (entries_fts, rowid, description, output)
+    VALUES ('delete', old.id, old.description, old.output);
+END;
+"""
+
+
+def strip_ansi(text):
+    return ANSI_RE.sub("", text)
+
+
+def item_from_path(path):
+    """agent-SET-002-1770140949714.log -> SET-002"""
+    stem = Path(path).stem
+    parts = stem.split("-")
+    return "-".join(parts[1:-1]) if len(parts) > 2 else None
+
+
+def first_failure(output):
+    """Return the first line of output that signals a failure, or None."""
+    for line in output.splitlines():
+        if FAILURE_RE.match(line.strip()):
+            return line.strip()[:300]
+    return None
+
+
+def parse_chunk(data, start_offset):
+    """
+    Split raw log bytes into entries and header fields.
+
+    Only complete lines are consumed. Returns (entries, header, consumed)
+    where each entry is a dict with offset, tool, description and output,
+    and consumed is the number of bytes of data that were parsed.
+    """
+    consumed = data.rfind(b"\n") + 1
+    entries = []
+    header = {}
+    current = None
+    # header -> body -> footer, split by the "=====" rules agent.py writes
+    section = "header" if start_offset == 0 else "body"
+    offset = start_offset
+    for raw in data[:consumed].splitlines(keepends=True):
+        line = strip_ansi(raw.decode("utf-8", errors="replace")).rstrip("\r\n")
+        line_offset, offset = offset, offset + len(raw)
+        if line == FOOTER_RULE:
+            section = "body" if section == "header" else "footer"
+            continue
+        if section != "body":
+            field = HEADER_RE.match(line)
+            if field:
+                header[field.group(1)] = field.group(2).strip()
+            continue
+        tool = TOOL_RE.match(line) if raw.startswith(b"\x1b") else None
+        if tool or current is None:
+            current = {
+                "offset": line_offset,
+                "tool": tool.group(1) if tool else None,
+                "description": tool.group(2).strip() if tool else "",
+                "lines": [],
+            }
+            entries.append(current)
+            if tool:
+                continue
+        current["lines"].append(line)
+    for entry in entries:
+        entry["output"] = "\n".join(entry.pop("lines")).strip("\n")
+    return entries, header, consumed
+
+
+def connect(db_path=DB_PATH):
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _header_values(header):
+    def as_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    return {
+        "runtime": header.get("Runtime"),
+        "model": header.get("Model"),
+        "attempt": as_int(header.get("Attempt")),
+        "started": header.get("Started"),
+        "exit_code": as_int(header.get("Exit code")),
+    }
+
+
+def ingest(conn, path):
+    """
+    Index whatever was appended to one log since the last pass.
+
+    Returns the number of entries (re)written. A log that shrank, e.g. a
+    rewritten file, is indexed again from the start.
+    """
+    path = Path(path)
+    key = str(path)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return 0
+    row = conn.execute(
+        "SELECT offset, size, next_seq FROM logs WHERE path = ?", (key,)
+    ).fetchone()
+    offset, known_size, seq = row if row else (0, 0, 0)
+    if size == known_size and row:
+        return 0
+    if size < known_size:
+        offset, seq = 0, 0
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    entries, header, consumed = parse_chunk(data, offset)
+    if not consumed:
+        return 0
+
+    item = item_from_path(path)
+    with conn:
+        # The entry starting at `offset` may have grown; replace it and
+        # everything after it.
+        conn.execute(
+            "DELETE FROM entries WHERE path = ? AND offset >= ?", (key, offset)
+        )
+        for entry in entries:
+            failure = first_failure(entry["output"])
+            conn.execute(
+                "INSERT INTO entries (path, item, seq, offset, tool, description,"
+                " output, failed, failure) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    item,
+                    seq,
+                    entry["offset"],
+                    entry["tool"],
+                    entry["description"],
+                    entry["output"],
+                    int(failure is not None),
+                    failure,
+                ),
+            )
+            seq += 1
+        # Resume at the last entry next time, since it can still grow
+        next_offset = entries[-1]["offset"] if entries else offset + consumed
+        next_seq = seq - 1 if entries else seq
+        values = _header_values(header)
+        conn.execute(
+            "INSERT INTO logs (path, item, offset, size, next_seq) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET "
+            "offset = excluded.offset, size = excluded.size, "
+            "next_seq = excluded.next_seq",
+            (key, item, next_offset, offset + consumed, next_seq),
+        )
+        for column, value in values.items():
+            if value is not None:
+                conn.execute(
+                    f"UPDATE logs SET {column} = ? WHERE path = ?", (value, key)
+                )
+    return len(entries)
+
+
+def ingest_all(conn, runs_dir=RUNS_DIR):
+    """Index every agent log under runs/; return entries written."""
+    return sum(ingest(conn, path) for path in sorted(Path(runs_dir).glob(LOG_GLOB)))
+
+
+def follow(conn, runs_dir=RUNS_DIR, interval=FOLLOW_INTERVAL):
+    """Keep indexing new and growing logs until interrupted."""
+    while True:
+        written = ingest_all(conn, runs_dir)
+        if written:
+            print(f"indexed {written} entries", flush=True)
+        time.sleep(interval)
+
+
+def search(conn, text=None, tool=None, item=None, failed=None, limit=50):
+    """
+    Return matching entries, newest log first.
+
+    `text` is an FTS5 query over descriptions and output.
+    """
+    query = (
+        "SELECT e.item, e.tool, e.description, e.failure, e.path, e.seq "
+        "FROM entries e"
+    )
+    where, params = [], []
+    if text:
+        query += " JOIN entries_fts f ON f.rowid = e.id"
+        where.append("entries_fts MATCH ?")
+        params.append(text)
+    if tool:
+        where.append("e.tool = ?")
+        params.append(tool)
+    if item:
+        where.append("e.item = ?")
+        params.append(item)
+    if failed is not None:
+        where.append("e.failed = ?")
+        params.append(int(failed))
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    query += " ORDER BY e.path DESC, e.seq LIMIT ?"
+    params.append(limit)
+    columns = ("item", "tool", "description", "failure", "path", "seq")
+    return [dict(zip(columns, row)) for row in conn.execute(query, params)]
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Index and query agent logs")
+    parser.add_argument("--db", default=str(DB_PATH), help="SQLite index path")
+    parser.add_argument("--follow", action="store_true", help="Keep indexing")
+    parser.add_argument("--search", help="FTS5 query over descriptions and output")
+    parser.add_argument("--tool", help="Only entries of this tool (e.g. Bash)")
+    parser.add_argument("--item", help="Only entries of this checklist item")
+    parser.add_argument("--failed", action="store_true", help="Only failed entries")
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    if args.follow:
+        try:
+            follow(conn)
+        except KeyboardInterrupt:
+            return 0
+
+    start = time.perf_counter()
+    written = ingest_all(conn)
+    elapsed = (time.perf_counter() - start) * 1000
+    if not (args.search or args.tool or args.item or args.failed):
+        logs, entries, failed = conn.execute(
+            "SELECT (SELECT COUNT(*) FROM logs), COUNT(*), SUM(failed) FROM entries"
+        ).fetchone()
+        print(
+            f"{logs} logs, {entries} entries ({failed or 0} failed); "
+            f"{written} written in {elapsed:.0f}ms"
+        )
+        return 0
+
+    try:
+        rows = search(
+            conn,
+            text=args.search,
+            tool=args.tool,
+            item=args.item,
+            failed=True if args.failed else None,
+            limit=args.limit,
+        )
+    except sqlite3.OperationalError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    for row in rows:
+        detail = f" -> {row['failure']}" if row["failure"] else ""
+        print(f"{row['item']:10} {row['tool'] or '-':6} {row['description']}{detail}")
+    print(f"{len(rows)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""
+Cross-platform latency matrix built from every item's results/ folder.
+
+Agents write results in many shapes: test_results.json with
+`platform_results`, <platform>_test_results.json with a `tests` list,
+free-form python_test_output.txt / rust_test_output.txt /
+cli_test_results.log, and (for newer items) harness.timing's
+timings.jsonl. This module normalizes all of them into one SQLite table
+
+    measurements(item, tier, platform, operation, sdk_version,
+                 status, duration_ms, source)
+
+and renders an operation x platform latency matrix of median durations,
+with the Python/Rust ratio as a measure of binding (FFI) overhead.
+
+Free-form test names from console output and test lists are mapped to a
+shared vocabulary (document_create, add_block, execute_ucl, to_json, ...)
+by whole-word keywords, keeping any size suffix, so the same UCP
+operation lines up across platforms; unrecognized names are kept as a
+slug. timings.jsonl names are already canonical and are used as written
+(document_create_10k and document_create_1k stay separate). Whole test-script
+runs (replay results, "=== Rust Test ===" sections) are stored as
+`script_run` and left out of the matrix, since they time many operations.
+
+In console output each platform's rows take that platform's version: a
+labelled line ("Python SDK Version: 0.1.9") first, else the first version
+printed in the platform's own section.
+
+Usage:
+    python -m harness.matrix                    # rebuild DB, print matrix
+    python -m harness.matrix --markdown runs/LATENCY-MATRIX.md
+    python -m harness.matrix --operation execute_ucl
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+
+from harness.paths import PROCESSOR_DIR, RUNS_DIR
+
+DB_PATH = PROCESSOR_DIR / "results.sqlite"
+PLATFORMS = ("python", "javascript", "rust", "cli")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    item TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    sdk_version TEXT,
+    status TEXT,
+    duration_ms REAL,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS measurements_key
+    ON measurements (item, platform, operation, sdk_version);
+"""
+
+# Keyword -> canonical operation for free-form test names; keywords match
+# whole words in order ("to json" matches "Export to JSON", not "json_to_md").
+# First match wins, so specific phrases come before general ones.
+OPERATION_KEYWORDS = (
+    ("from json", "from_json"),
+    ("deserialize", "from_json"),
+    ("deserializing", "from_json"),
+    ("deserialization", "from_json"),
+    ("to json", "to_json"),
+    ("serialize", "to_json"),
+    ("serializing", "to_json"),
+    ("serialization", "to_json"),
+    ("ucl", "execute_ucl"),
+    ("validate", "validate"),
+    ("validating", "validate"),
+    ("validation", "validate"),
+    ("by type", "find_by_type"),
+    ("by tag", "find_by_tag"),
+    ("search", "find"),
+    ("find", "find"),
+    ("finding", "find"),
+    ("add code", "add_code"),
+    ("adding code", "add_code"),
+    ("code block", "add_code"),
+    ("add text", "add_block"),
+    ("adding text", "add_block"),
+    ("add block", "add_block"),
+    ("adding block", "add_block"),
+    ("import", "import"),
+    ("version", "version"),
+    ("create document", "document_create"),
+    ("create empty document", "document_create"),
+    ("creating document", "document_create"),
+    ("document create", "document_create"),
+)
+
+PLATFORM_ALIASES = {
+    "python": "python",
+    "py": "python",
+    "javascript": "javascript",
+    "js": "javascript",
+    "node": "javascript",
+    "rust": "rust",
+    "cli": "cli",
+}
+
+SCRIPT_OPERATION = "script_run"
+
+# "ucp 0.1.10", "ucp-api v0.1.11", "Package version: 0.1.9" (not "ucp-api-test v0.1.0")
+_VERSION_RE = re.compile(
+    r"(?:\bucp(?:-content|-api|-cli)?\s+v?|version\W{0,3}\s*v?)(\d+\.\d+\.\d+)",
+    re.IGNORECASE,
+)
+# "Python SDK Version: 0.1.9", "CLI Version: ucp 0.1.10"
+_LABELLED_VERSION_RE = re.compile(
+    r"^\W*(?P<label>[a-z][\w ]*?)\s+(?:sdk\s+)?version\W{0,3}\s*(?:ucp\S*\s+)?v?"
+    r"(?P<version>\d+\.\d+\.\d+)",
+    re.IGNORECASE,
+)
+_DURATION_RE = re.compile(
+    r"(?:time|duration|took)[^:\n]*:\s*([\d.]+)\s*(ms|µs|us|s)\b", re.IGNORECASE
+)
+_SECTION_RES = (
+    re.compile(r"^\[TEST \d+\]\s*(?P<name>.+?)\.*$"),
+    re.compile(r"^-*\s*Test \d+:\s*(?P<name>.+?)\s*-*$"),
+    re.compile(r"^===\s*(?P<name>.+?)\s*===$"),
+)
+_INLINE_RE = re.compile(
+    r"^(?P<name>[\w ]+?):\s*(?:✅\s*|❌\s*)?(?P<status>PASS|FAIL)\b"
+)
+
+
+# Document size in a test name: "1k", "10k", "1m"
+_SIZE_RE = re.compile(r"^\d+[km]$")
+
+_STATUSES = ("PASS", "FAIL", "TIMEOUT", "PARTIAL", "NOT_TESTED", "NOT_IMPLEMENTED")
+
+# Report footers that look like test sections in console output
+IGNORED_OPERATIONS = {"summary", "result", "results", "status", "overall_result"}
+
+
+def normalize_operation(name):
+    """
+    Map a free-form test name onto the shared operation vocabulary.
+
+    camelCase and snake_case names are split into words first, and a size
+    such as "10k" is kept as a suffix ("to JSON 10k" -> to_json_10k), so
+    different document sizes stay in different cells.
+    """
+    spaced = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", name)
+    words = re.findall(r"[a-z0-9]+", spaced.lower())
+    padded = f" {' '.join(words)} "
+    for keyword, operation in OPERATION_KEYWORDS:
+        if f" {keyword} " in padded:
+            sizes = [word for word in words if _SIZE_RE.match(word)]
+            return "_".join([operation, *sizes[:1]])
+    lowered = name.lower().replace("-", " ")
+    slug = re.sub(r"[^a-z0-9]+", "_", lowered).strip("_")
+    return re.sub(r"^(test_?\d*_?)", "", slug) or "unknown"
+
+
+def platform_from_name(name):
+    """Return the platform a file or heading name refers to, or None."""
+    for token in re.split(r"[^a-z]+", name.lower()):
+        if token in PLATFORM_ALIASES:
+            return PLATFORM_ALIASES[token]
+    return None
+
+
+def _to_ms(value, unit):
+    factor = {"ms": 1.0, "s": 1000.0, "µs": 0.001, "us": 0.001}[unit]
+    return float(value) * factor
+
+
+def _status(value):
+    if isinstance(value, bool):
+        return "PASS" if value else "FAIL"
+    text = str(value).upper()
+    for status in _STATUSES:
+        if status in text:
+            return status
+    return None
+
+
+# -- extractors: each yields dicts with platform/operation/status/duration_ms
+
+
+def _from_platform_results(data):
+    """test_results.json / replay_results.json: {"platform_results": {...}}."""
+    for platform, result in data.get("platform_results", {}).items():
+        platform = PLATFORM_ALIASES.get(platform.lower(), platform.lower())
+        if not isinstance(result, dict):
+            continue
+        version = result.get("version")
+        # Per-script runs time whole test files, not one operation
+        for run in result.get("runs", []):
+            yield {
+                "platform": platform,
+                "operation": SCRIPT_OPERATION,
+                "status": "PASS" if run.get("returncode") == 0 else "FAIL",
+                "duration_ms": run.get("duration_ms"),
+                "sdk_version": version,
+            }
+        for key, value in result.items():
+            if key.endswith("_test") or key.endswith("_check"):
+                yield {
+                    "platform": platform,
+                    "operation": normalize_operation(key.rsplit("_", 1)[0]),
+                    "status": _status(value),
+                    "duration_ms": None,
+                    "sdk_version": version,
+                }
+
+
+def _from_test_list(data, platform):
+    """<platform>_test_results.json: {"tests": [{name, status, duration_ms}]}."""
+    for test in data.get("tests", []):
+        yield {
+            "platform": platform,
+            "operation": normalize_operation(test.get("name", "")),
+            "status": _status(test.get("status", "")),
+            "duration_ms": test.get("duration_ms"),
+            "sdk_version": test.get("version"),
+        }
+    for finding in data.get("findings", []):
+        if isinstance(finding, dict) and "check" in finding:
+            yield {
+                "platform": platform,
+                "operation": normalize_operation(finding["check"]),
+                "status": _status(finding.get("passed", "")),
+                "duration_ms": None,
+                "sdk_version": None,
+            }
+
+
+def _from_timings(lines):
+    """timings.jsonl written by harness.timing; names are kept as written."""
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        yield {
+            "platform": record.get("platform", "python"),
+            "operation": record["operation"],
+            "status": "PASS",
+            "duration_ms": record["p50_ns"] / 1e6,
+            "sdk_version": record.get("sdk_version"),
+        }
+
+
+def _from_text(text, platform):
+    """Free-form console output split into per-test sections."""
+    # Versions labelled with a platform, then the first one in each
+    # platform's own section
+    labelled, sectioned = {}, {}
+    rows = []
+    section = None
+
+    def flush():
+        if section is None or section["operation"] in IGNORED_OPERATIONS:
+            return
+        if section["status"] or section["duration_ms"] is not None:
+            rows.append(dict(section))
+
+    for raw in text.splitlines():
+        line = re.sub(r"^\[[\d.]+s\]\s*", "", raw.strip())
+        label = _LABELLED_VERSION_RE.match(line)
+        labelled_platform = label and platform_from_name(label.group("label"))
+        if labelled_platform:
+            labelled.setdefault(labelled_platform, label.group("version"))
+        else:
+            match = _VERSION_RE.search(line)
+            if match:
+                sectioned.setdefault(platform, match.group(1))
+        header = next((r.match(line) for r in _SECTION_RES if r.match(line)), None)
+        inline = _INLINE_RE.match(line)
+        if header or inline:
+            flush()
+            name = (header or inline).group("name")
+            switched = platform_from_name(name) if header else None
+            if switched and len(name.split()) <= 2:
+                # "=== Rust Test ===" starts another platform's whole-script run
+                platform = switched
+                name = SCRIPT_OPERATION
+            section = {
+                "platform": platform,
+                "operation": normalize_operation(name),
+                "status": inline.group("status") if inline else None,
+                "duration_ms": None,
+                "sdk_version": None,
+            }
+            continue
+        if section is None:
+            continue
+        duration = _DURATION_RE.search(line)
+        if duration and section["duration_ms"] is None:
+            section["duration_ms"] = _to_ms(*duration.groups())
+        if section["status"] is None:
+            if "✓" in line or re.search(r"\bPASS\b", line):
+                section["status"] = "PASS"
+            elif "✗" in line or re.search(r"\bFAIL", line):
+                section["status"] = "FAIL"
+    flush()
+    for row in rows:
+        row["sdk_version"] = labelled.get(row["platform"]) or sectioned.get(
+            row["platform"]
+        )
+    return rows
+
+
+def extract(path):
+    """Return normalized rows from one results file."""
+    rows = list(_extract(path))
+    # A version printed once applies to every row of the same platform
+    versions = {r["platform"]: r["sdk_version"] for r in rows if r["sdk_version"]}
+    for row in rows:
+        row["sdk_version"] = row["sdk_version"] or versions.get(row["platform"])
+    return rows
+
+
+def _extract(path):
+    name = path.name
+    if name.startswith("agent-") or name.endswith("_help.txt"):
+        return
+    platform = platform_from_name(path.stem)
+    if name == "timings.jsonl":
+        yield from _from_timings(path.read_text().splitlines())
+    elif path.suffix == ".json":
+        try:
+            data = json.loads(path.read_text())
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+        if "platform_results" in data:
+            yield from _from_platform_results(data)
+        elif platform is not None:
+            yield from _from_test_list(data, platform)
+    elif path.suffix in (".txt", ".log"):
+        yield from _from_text(path.read_text(errors="replace"), platform or "cli")
+
+
+def build_database(runs_dir=RUNS_DIR, db_path=DB_PATH):
+    """Rebuild the measurements table from every item's results/."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    with conn:
+        conn.execute("DELETE FROM measurements")
+        for results_dir in sorted(runs_dir.glob("*/*/results")):
+            item = results_dir.parent.name
+            tier = results_dir.parent.parent.name
+            for path in sorted(results_dir.iterdir()):
+                if not path.is_file():
+                    continue
+                rows = [
+                    (
+                        item,
+                        tier,
+                        row["platform"],
+                        row["operation"],
+                        row["sdk_version"],
+                        row["status"],
+                        row["duration_ms"],
+                        path.name,
+                    )
+                    for row in extract(path)
+                ]
+                conn.executemany(
+                    "INSERT INTO measurements VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+    return conn
+
+
+def latency_matrix(conn, operation=None):
+    """Return {operation: {platform: median duration_ms}} over timed rows."""
+    query = (
+        "SELECT operation, platform, duration_ms FROM measurements "
+        "WHERE duration_ms IS NOT NULL AND operation != ?"
+    )
+    params = (SCRIPT_OPERATION,)
+    if operation:
+        query += " AND operation = ?"
+        params += (operation,)
+    samples = {}
+    for op, platform, duration in conn.execute(query, params):
+        samples.setdefault(op, {}).setdefault(platform, []).append(duration)
+    return {
+        op: {platform: statistics.median(values) for platform, values in cells.items()}
+        for op, cells in sorted(samples.items())
+    }
+
+
+def format_matrix(matrix):
+    """Render the latency matrix as a Markdown table."""
+    lines = [
+        "# Cross-Platform Latency Matrix",
+        "",
+        "Median duration (ms) per UCP operation across all items.",
+        "",
+        "| Operation | " + " | ".join(PLATFORMS) + " | python/rust |",
+        "|-----------|" + "|".join("---" for _ in PLATFORMS) + "|-------------|",
+    ]
+    for operation, cells in matrix.items():
+        values = [f"{cells[p]:.3f}" if p in cells else "-" for p in PLATFORMS]
+        ratio = "-"
+        if cells.get("rust") and "python" in cells:
+            ratio = f"{cells['python'] / cells['rust']:.2f}x"
+        lines.append(f"| {operation} | " + " | ".join(values) + f" | {ratio} |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build the latency matrix")
+    parser.add_argument("--db", default=str(DB_PATH), help="SQLite output path")
+    parser.add_argument("--operation", help="Only show one operation")
+    parser.add_argument("--markdown", help="Also write the matrix to this file")
+    args = parser.parse_args(argv)
+
+    conn = build_database(db_path=Path(args.db))
+    total, timed = conn.execute(
+        "SELECT COUNT(*), COUNT(duration_ms) FROM measurements"
+    ).fetchone()
+    report = format_matrix(latency_matrix(conn, args.operation))
+    conn.close()
+    print(report)
+    print(f"{total} measurements ({timed} timed) in {args.db}")
+    if args.markdown:
+        Path(args.markdown).write_text(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
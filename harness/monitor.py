@@ -0,0 +1,391 @@
+"""
+Incremental reader and aggregates over .processor/ session state.
+
+The Streamlit dashboard reruns its script on every interaction and every
+refresh tick, and re-parsing every `session-*.json` each time gets slow
+once the history holds thousands of runs. `SessionStore` keeps parsed
+state between refreshes instead:
+
+- a snapshot (`session-*.json`) is re-read only when its size or mtime
+  changes, which happens at checkpoints and never for finished sessions
+- a journal (`session-*.jsonl`, see harness.journal) is tailed from the
+  byte offset reached last time; only complete lines are applied
+- `version` increases whenever any run changed, so callers can key
+  caches on it
+- one store is shared by every dashboard session (st.cache_resource), so
+  refreshes and reads are serialized by a lock; two refreshes tailing
+  the same journal would otherwise both advance its offset
+- a session with running runs whose files have not changed for longer
+  than the longest of those runs' timeouts (plus STALE_GRACE_S) was left
+  behind by a crashed runner: its running runs are reported as "stale",
+  with durations up to the last write, and `version` increases when that
+  happens so cached aggregates pick it up
+
+The aggregate functions work on the flat run rows from `SessionStore.rows()`
+and have no Streamlit dependency.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+
+from harness.journal import list_sessions
+from harness.paths import PROCESSOR_DIR
+
+# Slot count for sessions that did not record their --batch-size
+DEFAULT_SLOTS = 5
+# Latest-run statuses counted as failed items
+FAILED_STATUSES = ("failed", "timeout", "perf_failed")
+# Status shown for runs left "running" by a runner that stopped writing
+STALE_STATUS = "stale"
+# Timeout assumed for runs that did not record theirs (the processor default)
+DEFAULT_RUN_TIMEOUT_MS = 600_000
+# Slack after a run's timeout for the runner to record the outcome
+STALE_GRACE_S = 60
+
+
+def _signature(path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _parse_time(value):
+    try:
+        return datetime.fromisoformat(value).timestamp() if value else None
+    except ValueError:
+        return None
+
+
+class _Session:
+    """Parsed state of one session plus how far its files were read."""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.state = {"sessionId": session_id, "status": "unknown", "runs": []}
+        self.runs = {}
+        self.snapshot_signature = None
+        self.journal_offset = 0
+        # Wall-clock time of the last write to the snapshot or journal
+        self.last_write = None
+        self.stale = False
+
+    def load_snapshot(self, path):
+        state = json.loads(path.read_text())
+        state.pop("summary", None)
+        self.state = state
+        self.runs = {run["id"]: run for run in state.get("runs", [])}
+        self.journal_offset = 0
+
+    def apply(self, event):
+        if event.get("op") == "session":
+            self.state.update(event["fields"])
+        elif event.get("op") == "run":
+            run = self.runs.get(event["id"])
+            if run is None:
+                run = {"id": event["id"]}
+                self.runs[event["id"]] = run
+                self.state["runs"].append(run)
+            run.update(event["fields"])
+
+    def tail_journal(self, path):
+        """Apply complete journal lines past the last offset; return count."""
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return 0
+        if size < self.journal_offset:
+            # Truncated by a checkpoint; the new snapshot covers it
+            self.journal_offset = 0
+        if size == self.journal_offset:
+            return 0
+        with open(path, "rb") as f:
+            f.seek(self.journal_offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        applied = 0
+        for line in data[:complete].splitlines():
+            try:
+                self.apply(json.loads(line))
+            except (ValueError, KeyError):
+                continue
+            applied += 1
+        self.journal_offset += complete
+        return applied
+
+    def is_stale(self, now):
+        """True when running runs outlived their timeout without a write."""
+        timeouts = [
+            run.get("timeout_ms") or DEFAULT_RUN_TIMEOUT_MS
+            for run in self.runs.values()
+            if run.get("status") == "running"
+        ]
+        if not timeouts or self.last_write is None:
+            return False
+        return now - self.last_write > max(timeouts) / 1000 + STALE_GRACE_S
+
+
+def run_rows(session_id, runs, now=None, stale=False):
+    """
+    Flatten a session's run dicts into the rows the aggregates work on.
+
+    Running runs get their duration so far at `now`; with `stale` they are
+    reported as STALE_STATUS instead (pass the session's last write as now).
+    """
+    now = now or datetime.now().timestamp()
+    rows = []
+    for run in runs:
+        item = run.get("item") or {}
+        started = _parse_time(run.get("started_at"))
+        completed = _parse_time(run.get("completed_at"))
+        duration = run.get("duration_ms")
+        status = run.get("status", "unknown")
+        if status == "running":
+            if duration is None and started:
+                # Journal-backed sessions only record a duration at the end
+                duration = max(now - started, 0) * 1000
+            if stale:
+                status = STALE_STATUS
+        rows.append(
+            {
+                "session": session_id,
+                "run": run["id"],
+                "item": run.get("item_id") or item.get("id"),
+                "tier": item.get("tier", "unknown"),
+                "status": status,
+                "attempt": run.get("attempt") or 0,
+                "max_attempts": run.get("max_attempts"),
+                "started": started,
+                "completed": completed,
+                "duration_ms": duration,
+                "error": run.get("error"),
+                "input_tokens": run.get("input_tokens"),
+                "output_tokens": run.get("output_tokens"),
+                "cost_usd": run.get("cost_usd"),
+                "tool_calls": run.get("tool_calls"),
+            }
+        )
+    return rows
+
+
+class SessionStore:
+    """Session state kept in memory and refreshed from file changes only."""
+
+    def __init__(self, directory=PROCESSOR_DIR):
+        self.directory = directory
+        self.sessions = {}
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Pick up new sessions, checkpoints and journal lines; return version."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self):
+        changed = False
+        now = time.time()
+        for session_id in list_sessions(self.directory):
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = self.sessions[session_id] = _Session(session_id)
+            snapshot = self.directory / f"{session_id}.json"
+            signature = _signature(snapshot)
+            if signature is not None and signature != session.snapshot_signature:
+                try:
+                    session.load_snapshot(snapshot)
+                except (OSError, ValueError):
+                    # Mid-replace; the next refresh sees the finished file
+                    continue
+                session.snapshot_signature = signature
+                changed = True
+            journal = self.directory / f"{session_id}.jsonl"
+            changed = session.tail_journal(journal) > 0 or changed
+            writes = [
+                signature[1] / 1e9
+                for signature in (signature, _signature(journal))
+                if signature is not None
+            ]
+            session.last_write = max(writes, default=None)
+            stale = session.is_stale(now)
+            if stale != session.stale:
+                session.stale = stale
+                changed = True
+        if changed:
+            self.version += 1
+        return self.version
+
+    def rows(self):
+        """Return one flat dict per run across all sessions."""
+        now = datetime.now().timestamp()
+        rows = []
+        with self._lock:
+            for session_id, session in self.sessions.items():
+                if session.stale:
+                    runs = run_rows(
+                        session_id, session.runs.values(), session.last_write, True
+                    )
+                else:
+                    runs = run_rows(session_id, session.runs.values(), now)
+                rows += runs
+        return rows
+
+    def session_status(self):
+        with self._lock:
+            return {
+                session_id: STALE_STATUS
+                if session.stale
+                else session.state.get("status", "unknown")
+                for session_id, session in self.sessions.items()
+            }
+
+    def batch_sizes(self):
+        """Return the --batch-size each session recorded (None if it did not)."""
+        with self._lock:
+            return {
+                session_id: session.state.get("batch_size")
+                for session_id, session in self.sessions.items()
+            }
+
+
+# -- aggregates -------------------------------------------------------------
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list, or None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latest_runs(rows):
+    """Return the most recent run per item."""
+    latest = {}
+    for row in sorted(rows, key=lambda row: row["started"] or 0):
+        latest[row["item"]] = row
+    return list(latest.values())
+
+
+def status_counts(rows):
+    counts = {}
+    for row in latest_runs(rows):
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def duration_stats(rows):
+    """p50/p95/max item duration over finished runs, in seconds."""
+    durations = [
+        row["duration_ms"] / 1000
+        for row in rows
+        if row["completed"] and row["duration_ms"] is not None
+    ]
+    return {
+        "runs": len(durations),
+        "p50_s": percentile(durations, 0.50),
+        "p95_s": percentile(durations, 0.95),
+        "max_s": max(durations) if durations else None,
+    }
+
+
+def tier_throughput(rows):
+    """Per tier: item statuses, completed runs per hour and median duration."""
+    tiers = {}
+    for row in rows:
+        tiers.setdefault(row["tier"], []).append(row)
+    result = []
+    for tier, tier_rows in sorted(tiers.items()):
+        latest = latest_runs(tier_rows)
+        done = [row for row in tier_rows if row["status"] == "completed"]
+        starts = [row["started"] for row in tier_rows if row["started"]]
+        ends = [row["completed"] for row in done if row["completed"]]
+        hours = (max(ends) - min(starts)) / 3600 if starts and ends else 0
+        durations = [row["duration_ms"] / 1000 for row in done if row["duration_ms"]]
+        result.append(
+            {
+                "tier": tier,
+                "items": len(latest),
+                "completed": sum(row["status"] == "completed" for row in latest),
+                "failed": sum(
+                    row["status"] in FAILED_STATUSES for row in latest
+                ),
+                "runs": len(tier_rows),
+                "items_per_hour": round(len(done) / hours, 2) if hours else None,
+                "p50_s": percentile(durations, 0.50),
+            }
+        )
+    return result
+
+
+def slot_utilization(rows, slots=DEFAULT_SLOTS, batch_sizes=None):
+    """
+    Busy-slot statistics per session from run start/end times.
+
+    Utilization is run-seconds over slot-seconds for the session's span,
+    with the session's own batch size from `batch_sizes` ({session: size},
+    see SessionStore.batch_sizes) and `slots` for sessions without one;
+    peak is the largest number of runs in flight at once.
+    """
+    batch_sizes = batch_sizes or {}
+    sessions = {}
+    for row in rows:
+        if row["started"]:
+            end = row["completed"] or row["started"] + (row["duration_ms"] or 0) / 1000
+            sessions.setdefault(row["session"], []).append((row["started"], end))
+    result = []
+    for session, spans in sorted(sessions.items()):
+        first = min(start for start, _ in spans)
+        last = max(end for _, end in spans)
+        busy = sum(end - start for start, end in spans)
+        events = sorted(
+            [(start, 1) for start, _ in spans] + [(end, -1) for _, end in spans]
+        )
+        level = peak = 0
+        for _, delta in events:
+            level += delta
+            peak = max(peak, level)
+        wall = last - first
+        size = batch_sizes.get(session) or slots
+        result.append(
+            {
+                "session": session,
+                "runs": len(spans),
+                "slots": size,
+                "wall_s": round(wall, 1),
+                "avg_busy_slots": round(busy / wall, 2) if wall else None,
+                "peak_slots": peak,
+                "utilization": round(busy / (wall * size), 3) if wall else None,
+            }
+        )
+    return result
+
+
+def retry_stats(rows):
+    """Attempts per item and items that used up their attempts."""
+    by_item = {}
+    for row in rows:
+        by_item.setdefault(row["item"], []).append(row)
+    histogram = {}
+    exhausted = []
+    for item, item_rows in sorted(by_item.items()):
+        latest = latest_runs(item_rows)[0]
+        # `attempt` is 0-based in the processor's state
+        attempts = max(len(item_rows), latest["attempt"] + 1)
+        histogram[attempts] = histogram.get(attempts, 0) + 1
+        limit = latest["max_attempts"]
+        if latest["status"] != "completed" and limit and attempts >= limit:
+            exhausted.append(
+                {"item": item, "attempts": attempts, "error": latest["error"]}
+            )
+    return {
+        "attempts_histogram": dict(sorted(histogram.items())),
+        "retried_items": sum(
+            count for attempts, count in histogram.items() if attempts > 1
+        ),
+        "exhausted": exhausted,
+    }
@@ -0,0 +1,35 @@
+"""
+Path helpers for the runs/<tier>/<ITEM>/ layout.
+
+See agent-resources/templates/FOLDER_STRUCTURE.md for the layout itself.
+"""
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RUNS_DIR = REPO_ROOT / "runs"
+PROCESSOR_DIR = REPO_ROOT / ".processor"
+
+
+def item_dir_for(path):
+    """
+    Return the item directory owning a file under its tests/ folder.
+
+    runs/<tier>/<ITEM>/tests/rust/src/main.rs -> runs/<tier>/<ITEM>
+    Returns None when the path is not inside an item's tests/ folder.
+    """
+    path = Path(path).resolve()
+    for parent in path.parents:
+        if parent.name == "tests":
+            return parent.parent
+    return None
+
+
+def results_dir_for(path):
+    """Return (and create) the results/ directory of the item owning path."""
+    item_dir = item_dir_for(path)
+    if item_dir is None:
+        return None
+    results_dir = item_dir / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    return results_dir
@@ -0,0 +1,292 @@
+"""
+Warm interpreter pool for running generated Python tests.
+
+Each worker imports `ucp`, `json` and the stageflow stack once at startup.
+Test scripts are then run in a child forked from a warm worker, so every
+script gets a fresh `__main__` namespace and private process state while
+`import ucp` inside the script is a `sys.modules` lookup. Timings measured
+by the script therefore cover UCP operations rather than interpreter
+startup.
+
+On platforms without `os.fork` scripts fall back to a fresh interpreter.
+
+Usage:
+    python -m harness.pool runs/tier_2_*/*/tests/python/*.py --workers 8
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import runpy
+import select
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from harness.paths import results_dir_for
+
+# Modules imported once per worker before any script runs
+WARM_MODULES = (
+    "json",
+    "ucp",
+    "stageflow",
+    "stageflow.helpers",
+    "stageflow.context",
+)
+
+DEFAULT_TIMEOUT_S = 300
+
+# pid of the script a worker is running, killed when the worker is
+_running_pid = None
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of running one test script."""
+
+    path: str
+    returncode: int
+    output: str
+    duration_ms: float
+    timed_out: bool = False
+
+    @property
+    def passed(self):
+        return self.returncode == 0 and not self.timed_out
+
+
+def _terminate_worker(signum, frame):
+    """SIGTERM in a worker: kill the script it is running, then exit."""
+    if _running_pid is not None:
+        try:
+            os.kill(_running_pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    os._exit(1)
+
+
+def _warm_up(modules):
+    """Worker initializer: import the heavy modules once."""
+    signal.signal(signal.SIGTERM, _terminate_worker)
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Missing SDKs surface in the script itself, not the pool
+            pass
+
+
+def _exec_script(path, cwd, argv):
+    """Run a script as __main__ in the current (forked) process and exit."""
+    code = 0
+    try:
+        os.chdir(cwd)
+        sys.argv = [str(path), *argv]
+        sys.path.insert(0, str(Path(path).parent))
+        runpy.run_path(str(path), run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        code = 1
+    finally:
+        # os._exit() skips atexit hooks, so flush recorded timings here
+        timing = sys.modules.get("harness.timing")
+        if timing is not None:
+            timing.flush()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _run_forked(path, cwd, argv, timeout):
+    """Fork a child from this warm worker and run the script in it."""
+    global _running_pid
+    read_fd, write_fd = os.pipe()
+    start = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.close(read_fd)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        _exec_script(path, cwd, argv)
+
+    _running_pid = pid
+    os.close(write_fd)
+    chunks = []
+    timed_out = False
+    deadline = start + timeout
+    with os.fdopen(read_fd, "rb") as pipe:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                break
+            ready, _, _ = select.select([pipe], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(pipe.fileno(), 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    _, status = os.waitpid(pid, 0)
+    _running_pid = None
+    duration_ms = (time.perf_counter() - start) * 1000
+    return ScriptResult(
+        path=str(path),
+        returncode=os.waitstatus_to_exitcode(status),
+        output=b"".join(chunks).decode(errors="replace"),
+        duration_ms=round(duration_ms, 1),
+        timed_out=timed_out,
+    )
+
+
+def _run_subprocess(path, cwd, argv, timeout):
+    """Fallback for platforms without fork: run in a fresh interpreter."""
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(path), *argv],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        returncode, output, timed_out = proc.returncode, proc.stdout + proc.stderr, False
+    except subprocess.TimeoutExpired as exc:
+        returncode, timed_out = -signal.SIGKILL, True
+        output = exc.stdout or ""
+        if isinstance(output, bytes):
+            output = output.decode(errors="replace")
+    return ScriptResult(
+        path=str(path),
+        returncode=returncode,
+        output=output,
+        duration_ms=round((time.perf_counter() - start) * 1000, 1),
+        timed_out=timed_out,
+    )
+
+
+def run_script(path, cwd=None, argv=(), timeout=DEFAULT_TIMEOUT_S):
+    """Run one test script in an isolated child of the current process."""
+    path = Path(path).resolve()
+    cwd = str(cwd or path.parent)
+    if hasattr(os, "fork"):
+        return _run_forked(path, cwd, list(argv), timeout)
+    return _run_subprocess(path, cwd, list(argv), timeout)
+
+
+class WarmPool:
+    """
+    Long-lived pool of pre-warmed interpreters.
+
+    Use as a context manager; submit() returns a Future resolving to a
+    ScriptResult, and map() runs many scripts preserving input order.
+    """
+
+    def __init__(self, workers=None, modules=WARM_MODULES, timeout=DEFAULT_TIMEOUT_S):
+        self.timeout = timeout
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=context,
+            initializer=_warm_up,
+            initargs=(tuple(modules),),
+        )
+
+    def submit(self, path, cwd=None, argv=()):
+        """Queue a script for execution on a warm worker."""
+        return self._executor.submit(run_script, path, cwd, tuple(argv), self.timeout)
+
+    def map(self, paths):
+        """Run scripts concurrently and return their results in order."""
+        futures = [self.submit(path) for path in paths]
+        return [future.result() for future in futures]
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def terminate(self):
+        """Kill the workers and the scripts they are running; drop queued work."""
+        # ProcessPoolExecutor has no public handle on its workers
+        for process in list((self._executor._processes or {}).values()):
+            process.terminate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_output(result):
+    """Append a script's output to the owning item's results/python_output.log."""
+    results_dir = results_dir_for(result.path)
+    if results_dir is None:
+        return None
+    log_path = results_dir / "python_output.log"
+    with open(log_path, "a") as f:
+        f.write(
+            f"=== {Path(result.path).name} (exit {result.returncode}, "
+            f"{result.duration_ms:.1f}ms) ===\n"
+        )
+        f.write(result.output)
+        f.write("\n")
+    return log_path
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run generated Python tests on a warm interpreter pool"
+    )
+    parser.add_argument("scripts", nargs="+", type=Path, help="Test scripts to run")
+    parser.add_argument(
+        "--workers", "-j", type=int, default=None, help="Worker count (default: CPUs)"
+    )
+    parser.add_argument(
+        "--timeout", type=int, default=DEFAULT_TIMEOUT_S, help="Per-script timeout (s)"
+    )
+    parser.add_argument(
+        "--write-results",
+        action="store_true",
+        help="Append output to each item's results/python_output.log",
+    )
+    args = parser.parse_args(argv)
+
+    with WarmPool(workers=args.workers, timeout=args.timeout) as pool:
+        results = pool.map(args.scripts)
+
+    failed = 0
+    for result in results:
+        status = "PASS" if result.passed else ("TIMEOUT" if result.timed_out else "FAIL")
+        failed += not result.passed
+        print(f"{status:8} {result.duration_ms:9.1f}ms  {result.path}")
+        if args.write_results:
+            write_output(result)
+
+    print(f"\n{len(results) - failed}/{len(results)} scripts passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,597 @@
+"""
+Deterministic replay of already-generated tests, without the agent runtime.
+
+For every item that has a tests/ folder, the Python, JavaScript, Rust and
+CLI implementations are executed concurrently:
+
+- python:     tests/python/*.py on the warm interpreter pool
+- javascript: tests/javascript/*.js with node
+- rust:       every crate under tests/rust/ built via the shared Cargo
+              cache (test binaries for library crates), then its
+              executables run
+- cli:        tests/cli/*.sh with bash
+
+Within a platform, files run concurrently up to that platform's limit in
+PLATFORM_LIMITS. The limits are shared by every item in the session, so
+at most two Rust builds (the slow, memory-hungry part) run at once while
+Python/JS/CLI tests of other items keep going. Child processes also get
+an address-space cap and a CPU-time cap (RLIMIT_AS / RLIMIT_CPU) and Rust
+builds run at a lower priority. Python tests are bounded by the warm
+pool's worker count instead.
+
+Every child starts its own process group and is tracked until it exits,
+so `cancel_all()` (run.py's SIGINT/SIGTERM handler) can kill test
+scripts, Rust builds and their subprocesses, and the warm pool's workers.
+
+Each item gets results/<platform>_output.log, results/replay_results.json
+and results/comparison.md; the session gets runs/REPLAY-FINAL-REPORT.md.
+Items are scheduled with the same DAG scheduler as agent runs.
+
+Usage:
+    python run.py --replay
+    python -m harness.replay SET-002 SET-003
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from harness import budgets, rust_cache
+from harness.checklist import parse_checklist, parse_dependencies
+from harness.fingerprint import sdk_versions
+from harness.paths import RUNS_DIR, results_dir_for
+from harness.pool import WarmPool
+from harness.runner import RunResult
+from harness.scheduler import COMPLETED, FAILED, DagScheduler
+
+PLATFORMS = ("python", "javascript", "rust", "cli")
+DEFAULT_TIMEOUT_S = 600
+REPORT_PATH = RUNS_DIR / "REPLAY-FINAL-REPORT.md"
+# Lines of each failing platform's output quoted in comparison.md
+FAILURE_TAIL_LINES = 20
+
+# Child processes (asyncio or subprocess.Popen) started for running tests
+_children = set()
+
+
+@dataclass(frozen=True)
+class PlatformLimits:
+    """Resource limits for one platform's test processes."""
+
+    # Files of this platform running at once, across all items
+    concurrency: int
+    # Address-space cap per process in MB (None = unlimited)
+    memory_mb: int = None
+    # Added to the child's nice value
+    nice: int = 0
+
+
+# node and rustc reserve far more address space than they touch, so
+# their caps are generous; they exist to stop a runaway test, not to
+# meter normal use.
+PLATFORM_LIMITS = {
+    "python": PlatformLimits(concurrency=os.cpu_count() or 1),
+    "javascript": PlatformLimits(concurrency=4, memory_mb=8192),
+    "rust": PlatformLimits(concurrency=2, memory_mb=16384, nice=10),
+    "cli": PlatformLimits(concurrency=4, memory_mb=2048),
+}
+
+
+class PlatformGates:
+    """Per-platform semaphores shared by every item replayed in a session."""
+
+    def __init__(self, limits=None):
+        self.limits = dict(PLATFORM_LIMITS, **(limits or {}))
+        self._semaphores = {
+            platform: asyncio.Semaphore(limit.concurrency)
+            for platform, limit in self.limits.items()
+        }
+
+    def __getitem__(self, platform):
+        return self._semaphores[platform]
+
+
+def _kill(proc):
+    """Kill a child and everything it spawned (its process group)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+def terminate_children():
+    """Kill every test process started by this module that is still running."""
+    for proc in list(_children):
+        _kill(proc)
+
+
+def _apply_limits(pid, limits, cpu_seconds):
+    """
+    Apply `limits` to a child that has already started.
+
+    The limits are set from the parent after the spawn rather than in a
+    preexec_fn, which is unsafe when the child is spawned from a thread
+    (Rust builds run in asyncio.to_thread). Processes the child forks
+    before this runs keep the parent's limits.
+    """
+    try:
+        if limits.nice:
+            niceness = os.getpriority(os.PRIO_PROCESS, pid) + limits.nice
+            os.setpriority(os.PRIO_PROCESS, pid, niceness)
+        if not hasattr(resource, "prlimit"):
+            return
+        if limits.memory_mb:
+            cap = limits.memory_mb * 1024 * 1024
+            resource.prlimit(pid, resource.RLIMIT_AS, (cap, cap))
+        if cpu_seconds:
+            cpu = int(cpu_seconds)
+            resource.prlimit(pid, resource.RLIMIT_CPU, (cpu, cpu + 5))
+    except OSError:
+        # The child already exited
+        pass
+
+
+@dataclass
+class ScriptRun:
+    """One executed test file or crate."""
+
+    name: str
+    returncode: int
+    duration_ms: float
+    timed_out: bool = False
+
+
+@dataclass
+class PlatformResult:
+    """Outcome of one platform's tests for an item."""
+
+    platform: str
+    status: str
+    duration_ms: float = 0.0
+    runs: list = field(default_factory=list)
+    output: str = ""
+    # Wall clock from the platform's first start to its last finish
+    wall_ms: float = 0.0
+
+
+def discover_tests(item_dir):
+    """Return platform -> list of test paths found under an item's tests/."""
+    tests_dir = item_dir / "tests"
+    found = {
+        "python": sorted((tests_dir / "python").glob("*.py")),
+        "javascript": sorted((tests_dir / "javascript").glob("*.js")),
+        "rust": sorted(
+            manifest.parent
+            for manifest in (tests_dir / "rust").rglob("Cargo.toml")
+            if "target" not in manifest.relative_to(tests_dir).parts
+        ),
+        "cli": sorted((tests_dir / "cli").glob("*.sh")),
+    }
+    return {platform: paths for platform, paths in found.items() if paths}
+
+
+async def _run_command(cmd, cwd, timeout, env=None, limits=None):
+    """
+    Run a command and return (returncode, output, duration_ms, timed_out).
+
+    The child starts a new session, so _kill() can reach the cargo, rustc
+    or shell processes below it, and gets `limits` with a CPU-time cap of
+    `timeout` seconds.
+    """
+    start = time.perf_counter()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        env=env,
+        start_new_session=True,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+    )
+    _children.add(proc)
+    if limits is not None:
+        _apply_limits(proc.pid, limits, timeout)
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        timed_out = False
+    except asyncio.TimeoutError:
+        _kill(proc)
+        stdout, _ = await proc.communicate()
+        timed_out = True
+    finally:
+        _children.discard(proc)
+    duration_ms = round((time.perf_counter() - start) * 1000, 1)
+    return proc.returncode, stdout.decode(errors="replace"), duration_ms, timed_out
+
+
+def _summarize(platform, runs, outputs, started):
+    """Fold individual runs into a PlatformResult."""
+    if any(run.timed_out for run in runs):
+        status = "TIMEOUT"
+    elif all(run.returncode == 0 for run in runs):
+        status = "PASS"
+    else:
+        status = "FAIL"
+    return PlatformResult(
+        platform=platform,
+        status=status,
+        duration_ms=round(sum(run.duration_ms for run in runs), 1),
+        runs=runs,
+        output="".join(outputs),
+        wall_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+
+
+async def _replay_python(paths, pool, gates):
+    started = time.perf_counter()
+
+    async def run(path):
+        async with gates["python"]:
+            return await asyncio.wrap_future(pool.submit(path))
+
+    runs, outputs = [], []
+    for path, result in zip(paths, await asyncio.gather(*map(run, paths))):
+        runs.append(
+            ScriptRun(path.name, result.returncode, result.duration_ms, result.timed_out)
+        )
+        outputs.append(
+            f"=== {path.name} (exit {result.returncode}) ===\n{result.output}\n"
+        )
+    return _summarize("python", runs, outputs, started)
+
+
+async def _replay_scripts(platform, interpreter, paths, timeout, gates):
+    started = time.perf_counter()
+    limits = gates.limits[platform]
+
+    async def run(path):
+        async with gates[platform]:
+            return await _run_command(
+                [interpreter, str(path)], path.parent, timeout, limits=limits
+            )
+
+    runs, outputs = [], []
+    for path, outcome in zip(paths, await asyncio.gather(*map(run, paths))):
+        code, output, duration_ms, timed_out = outcome
+        runs.append(ScriptRun(path.name, code, duration_ms, timed_out))
+        outputs.append(f"=== {path.name} (exit {code}) ===\n{output}\n")
+    return _summarize(platform, runs, outputs, started)
+
+
+async def _replay_crate(crate_dir, timeout, gates):
+    """Build and run one crate; returns (ScriptRun, output)."""
+    # Builds, test binaries included, are limited by the gate; running the
+    # built executables is cheap
+    started = []
+    limits = gates.limits["rust"]
+
+    def on_start(proc):
+        started.append(proc)
+        _children.add(proc)
+        _apply_limits(proc.pid, limits, None)
+
+    tests = not (crate_dir / "src" / "main.rs").exists()
+    async with gates["rust"]:
+        try:
+            stats = await asyncio.to_thread(
+                rust_cache.build_crate,
+                crate_dir,
+                tests=tests,
+                results_dir=results_dir_for(crate_dir),
+                start_new_session=True,
+                on_start=on_start,
+            )
+        finally:
+            _children.difference_update(started)
+    output = f"=== {crate_dir.name}: build ===\n{rust_cache.format_stats(stats)}\n"
+    if not stats.success:
+        name = f"{crate_dir.name} (build)"
+        return ScriptRun(name, stats.returncode, stats.duration_ms), output
+
+    returncode, duration_ms, timed_out = 0, 0.0, False
+    for executable in stats.executables:
+        code, run_output, elapsed_ms, expired = await _run_command(
+            [executable], crate_dir, timeout, limits=limits
+        )
+        returncode = returncode or code
+        duration_ms += elapsed_ms
+        timed_out = timed_out or expired
+        name = os.path.basename(executable)
+        output += f"=== {crate_dir.name}: {name} (exit {code}) ===\n{run_output}\n"
+    run = ScriptRun(crate_dir.name, returncode, round(duration_ms, 1), timed_out)
+    return run, output
+
+
+async def _replay_rust(crates, timeout, gates):
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(_replay_crate(crate_dir, timeout, gates) for crate_dir in crates)
+    )
+    runs = [run for run, _ in outcomes]
+    outputs = [output for _, output in outcomes]
+    return _summarize("rust", runs, outputs, started)
+
+
+async def replay_item(item, pool, timeout=DEFAULT_TIMEOUT_S, gates=None):
+    """
+    Run every platform's tests for an item concurrently.
+
+    Pass the same `gates` for every item of a session so the per-platform
+    limits hold across items; without it the item gets its own.
+    """
+    gates = gates or PlatformGates()
+    tests = discover_tests(item.run_dir)
+    jobs = {}
+    if "python" in tests:
+        jobs["python"] = _replay_python(tests["python"], pool, gates)
+    if "javascript" in tests:
+        jobs["javascript"] = _replay_scripts(
+            "javascript", "node", tests["javascript"], timeout, gates
+        )
+    if "rust" in tests:
+        jobs["rust"] = _replay_rust(tests["rust"], timeout, gates)
+    if "cli" in tests:
+        jobs["cli"] = _replay_scripts("cli", "bash", tests["cli"], timeout, gates)
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*jobs.values(), return_exceptions=True)
+    wall_ms = round((time.perf_counter() - started) * 1000, 1)
+    results = {}
+    for platform, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, Exception):
+            outcome = PlatformResult(
+                platform, "ERROR", output=f"{type(outcome).__name__}: {outcome}\n"
+            )
+        results[platform] = outcome
+    for platform in PLATFORMS:
+        results.setdefault(platform, PlatformResult(platform, "NOT_IMPLEMENTED"))
+    write_item_results(item, results, wall_ms)
+    return results
+
+
+def _failure_tail(output, lines=FAILURE_TAIL_LINES):
+    """Return the last `lines` non-empty lines of a platform's output."""
+    kept = [line for line in output.splitlines() if line.strip()]
+    return "\n".join(kept[-lines:])
+
+
+def write_item_results(item, results, wall_ms=None):
+    """Write per-platform logs, replay_results.json and comparison.md."""
+    results_dir = item.run_dir / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    for platform, result in results.items():
+        if result.status != "NOT_IMPLEMENTED":
+            (results_dir / f"{platform}_output.log").write_text(result.output)
+
+    payload = {
+        "test_name": item.id,
+        "description": item.target,
+        "mode": "replay",
+        "replayed_at": datetime.now().isoformat(),
+        "sdk_versions": sdk_versions(),
+        "wall_ms": wall_ms,
+        "platform_results": {
+            platform: {
+                "status": result.status,
+                "duration_ms": result.duration_ms,
+                "wall_ms": result.wall_ms,
+                "runs": [asdict(run) for run in result.runs],
+            }
+            for platform, result in results.items()
+        },
+    }
+    (results_dir / "replay_results.json").write_text(json.dumps(payload, indent=2))
+
+    lines = [
+        f"# {item.id} Cross-Platform Comparison (replay)",
+        "",
+        f"**Target**: {item.target}",
+        "",
+        "| Platform | Status | Duration (ms) | Wall (ms) | Tests |",
+        "|----------|--------|---------------|-----------|-------|",
+    ]
+    for platform in PLATFORMS:
+        result = results[platform]
+        lines.append(
+            f"| {platform} | {result.status} | {result.duration_ms:.1f} "
+            f"| {result.wall_ms:.1f} | {len(result.runs)} |"
+        )
+    if wall_ms is not None:
+        # Per-file durations exclude Rust builds; walls overlap within a platform
+        serial_ms = sum(
+            max(result.duration_ms, result.wall_ms) for result in results.values()
+        )
+        lines += [
+            "",
+            f"Platforms ran concurrently: {wall_ms:.1f} ms wall clock "
+            f"({serial_ms:.1f} ms if run one after another).",
+        ]
+    for platform in PLATFORMS:
+        result = results[platform]
+        if result.status in ("PASS", "NOT_IMPLEMENTED"):
+            continue
+        lines += [
+            "",
+            f"## {platform}: {result.status}",
+            "",
+            f"Full output: `results/{platform}_output.log`",
+            "",
+            "```",
+            _failure_tail(result.output),
+            "```",
+        ]
+    (results_dir / "comparison.md").write_text("\n".join(lines) + "\n")
+
+
+def item_passed(results):
+    """An item passes replay if no implemented platform failed."""
+    return all(r.status in ("PASS", "NOT_IMPLEMENTED") for r in results.values())
+
+
+def write_session_report(item_results, path=REPORT_PATH, budget_results=None):
+    """
+    Write the session-level replay report.
+
+    `budget_results` maps item IDs to their latency budget violations.
+    """
+    budget_results = budget_results or {}
+    versions = ", ".join(
+        f"{name} {version or 'not installed'}" for name, version in sdk_versions().items()
+    )
+    lines = [
+        "# Replay Final Report",
+        "",
+        f"**Generated**: {datetime.now().isoformat()}",
+        f"**SDK versions**: {versions}",
+        "",
+        "| ID | " + " | ".join(PLATFORMS) + " | Budgets | Result |",
+        "|----|" + "|".join("---" for _ in PLATFORMS) + "|---------|--------|",
+    ]
+    for item_id, results in item_results.items():
+        cells = [results[platform].status for platform in PLATFORMS]
+        violations = budget_results.get(item_id, [])
+        over = f"{len(violations)} over" if violations else "ok"
+        verdict = "PASS" if item_passed(results) and not violations else "FAIL"
+        lines.append(
+            f"| {item_id} | " + " | ".join(cells) + f" | {over} | {verdict} |"
+        )
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class ReplayRunner:
+    """Replay generated tests for every item that has them."""
+
+    def __init__(
+        self, config, item_ids=None, timeout=DEFAULT_TIMEOUT_S, budget_policy=None
+    ):
+        self.config = config
+        self.item_ids = set(item_ids) if item_ids else None
+        self.timeout = timeout
+        self.budget_policy = budget_policy
+        self.item_results = {}
+        self.budget_results = {}
+        self.pool = None
+
+    def build_scheduler(self):
+        items = parse_checklist(self.config.checklist_path)
+        dependencies = parse_dependencies(self.config.checklist_path, items)
+        replayable = [item for item in items if (item.run_dir / "tests").is_dir()]
+        if self.item_ids is not None:
+            replayable = [item for item in replayable if item.id in self.item_ids]
+        # Ordering only matters for agent runs; replay treats everything as satisfied
+        return DagScheduler(
+            replayable,
+            dependencies,
+            slots=self.config.batch_size,
+            satisfied={item.id for item in items},
+        )
+
+    async def process(self):
+        """Replay all items and return a RunResult."""
+        scheduler = self.build_scheduler()
+        if self.config.dry_run:
+            for item_id in scheduler.plan():
+                tests = discover_tests(scheduler.items[item_id].run_dir)
+                summary = ", ".join(f"{p}: {len(paths)}" for p, paths in tests.items())
+                print(f"  {item_id:8} {summary or 'no tests'}")
+            return RunResult(processed=len(scheduler.items), dry_run=True)
+
+        gates = PlatformGates()
+        with WarmPool(timeout=self.timeout) as pool:
+            self.pool = pool
+
+            async def worker(item):
+                started_at = datetime.now().isoformat()
+                results = await replay_item(item, pool, self.timeout, gates)
+                self.item_results[item.id] = results
+                statuses = " ".join(f"{p}={results[p].status}" for p in PLATFORMS)
+                print(f"  {item.id:8} {statuses}", flush=True)
+                violations = []
+                if self.budget_policy is not None:
+                    violations = budgets.enforce(item, self.budget_policy, started_at)
+                    self.budget_results[item.id] = violations
+                for violation in violations:
+                    print(f"  {'':8} BUDGET {violation.describe()}", flush=True)
+                return item_passed(results) and not violations
+
+            outcomes = await scheduler.run(worker)
+        self.pool = None
+
+        report = write_session_report(
+            {i: self.item_results[i] for i in scheduler.plan() if i in self.item_results},
+            budget_results=self.budget_results,
+        )
+        print(f"\nReplay report: {report}")
+        values = list(outcomes.values())
+        return RunResult(
+            processed=len(values),
+            completed=values.count(COMPLETED),
+            failed=values.count(FAILED),
+        )
+
+    def cancel_all(self):
+        """Kill running tests and builds, and the warm pool's workers."""
+        terminate_children()
+        if self.pool is not None:
+            self.pool.terminate()
+
+
+async def _replay_items(items, timeout):
+    gates = PlatformGates()
+    with WarmPool(timeout=timeout) as pool:
+        return await asyncio.gather(
+            *(replay_item(item, pool, timeout, gates) for item in items)
+        )
+
+
+def main(argv=None):
+    """Replay the given items' tests, all platforms at once."""
+    parser = argparse.ArgumentParser(
+        description="Run an item's Python, JavaScript, Rust and CLI tests concurrently"
+    )
+    parser.add_argument("items", nargs="+", help="Item IDs, e.g. SET-002")
+    parser.add_argument(
+        "--timeout",
+        type=int,
+        default=DEFAULT_TIMEOUT_S,
+        help=f"Per-file timeout in seconds (default: {DEFAULT_TIMEOUT_S})",
+    )
+    args = parser.parse_args(argv)
+
+    by_id = {item.id: item for item in parse_checklist()}
+    unknown = [item_id for item_id in args.items if item_id not in by_id]
+    if unknown:
+        parser.error(f"unknown item(s): {', '.join(unknown)}")
+    items = [by_id[item_id] for item_id in args.items]
+
+    try:
+        outcomes = asyncio.run(_replay_items(items, args.timeout))
+    except KeyboardInterrupt:
+        # Children run in their own sessions and miss the terminal's SIGINT
+        terminate_children()
+        raise
+    for item, results in zip(items, outcomes):
+        statuses = " ".join(f"{p}={results[p].status}" for p in PLATFORMS)
+        print(f"{item.id:8} {statuses}")
+        print(f"  {item.run_dir / 'results' / 'comparison.md'}")
+    return 0 if all(item_passed(results) for results in outcomes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Checklist runner driven by the dependency-aware scheduler.
+
+DagRunner is a drop-in alternative to ChecklistProcessor for run.py: it
+takes the same ProcessorConfig, exposes process() and cancel_all(), and
+returns a result with the same processed/completed/failed/dry_run fields.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from harness import agent, budgets, fingerprint, monitor, usage
+from harness.adaptive import ConcurrencyController, TimeoutPolicy
+from harness.checklist import mark_status, parse_checklist, parse_dependencies
+from harness.journal import SessionJournal
+from harness.scheduler import COMPLETED, FAILED, DagScheduler
+
+DEFAULT_MAX_ATTEMPTS = 4
+
+
+@dataclass
+class RunResult:
+    """Summary of a runner session, mirroring the processor's result."""
+
+    processed: int = 0
+    completed: int = 0
+    failed: int = 0
+    blocked: int = 0
+    dry_run: bool = False
+
+
+class DagRunner:
+    """Run pending checklist items on N continuously-busy agent slots."""
+
+    def __init__(
+        self,
+        config,
+        max_attempts=DEFAULT_MAX_ATTEMPTS,
+        item_ids=None,
+        incremental=False,
+        resume=False,
+        adaptive=False,
+        json_events=False,
+        budget_policy=None,
+    ):
+        self.config = config
+        self.max_attempts = max_attempts
+        self.item_ids = set(item_ids) if item_ids else None
+        self.incremental = incremental
+        self.resume = resume
+        self.adaptive = adaptive
+        self.json_events = json_events
+        self.budget_policy = budget_policy
+        self.journal = None
+        self.controller = None
+        self.timeouts = None
+
+    def open_journal(self):
+        """Start a session journal, or continue the last crashed one."""
+        if self.resume:
+            journal = SessionJournal.latest_running(repair=True)
+            if journal is not None:
+                stale = journal.recover()
+                print(
+                    f"Resuming {journal.session_id} "
+                    f"({len(stale)} interrupted run(s) marked)"
+                )
+                return journal
+        return SessionJournal.create()
+
+    def _log(self, message):
+        if self.config.verbose:
+            print(message, flush=True)
+
+    def build_scheduler(self):
+        """Create a scheduler over the pending checklist items."""
+        items = parse_checklist(self.config.checklist_path)
+        dependencies = parse_dependencies(self.config.checklist_path, items)
+        if self.incremental:
+            # Re-run exactly the items whose inputs changed, whatever their status
+            pending = fingerprint.changed_items(items)
+            pending_ids = {item.id for item in pending}
+            done = {item.id for item in items if item.id not in pending_ids}
+        else:
+            done = {item.id for item in items if item.completed}
+            pending = [item for item in items if not item.completed]
+        if self.item_ids is not None:
+            pending = [item for item in pending if item.id in self.item_ids]
+        return DagScheduler(
+            pending, dependencies, slots=self.config.batch_size, satisfied=done
+        )
+
+    def _on_slots(self, old, new, reason):
+        print(f"[    slots] {old} -> {new} ({reason})", flush=True)
+        self.journal.update_session(slots=new)
+
+    async def run_item(self, item):
+        """Run an item's agent, retrying up to max_attempts."""
+        timeouts = 0
+        for attempt in range(1, self.max_attempts + 1):
+            timeout_ms = self.config.timeout_ms
+            if self.timeouts is not None:
+                timeout_ms = self.timeouts.timeout_for(item, timeouts)
+            run_id = f"{item.id}-{int(time.time() * 1000)}-{attempt}"
+            started_at = datetime.now().isoformat()
+            self.journal.update_run(
+                run_id,
+                item_id=item.id,
+                item={
+                    "id": item.id,
+                    "target": item.target,
+                    "priority": item.priority,
+                    "risk": item.risk,
+                    "status": item.status,
+                    "tier": item.tier,
+                },
+                status="running",
+                stage="processing",
+                attempt=attempt - 1,
+                max_attempts=self.max_attempts,
+                started_at=started_at,
+                run_dir=str(item.run_dir),
+                timeout_ms=timeout_ms,
+            )
+            result = await agent.run_agent(
+                item,
+                self.config.agent_resources_dir,
+                runtime=self.config.runtime.value,
+                model=self.config.get_model(),
+                timeout_ms=timeout_ms,
+                attempt=attempt,
+                on_start=lambda pid, log_path, run_id=run_id: self.journal.update_run(
+                    run_id, pid=pid, log_path=log_path
+                ),
+                json_events=self.json_events,
+            )
+            if result.rate_limited and self.controller is not None:
+                self.controller.record_rate_limit()
+            violations = []
+            if result.completed and self.budget_policy is not None:
+                violations = budgets.enforce(item, self.budget_policy, since=started_at)
+            if violations:
+                # A slow SDK stays slow on retry; record it and stop
+                status = "perf_failed"
+                error = f"{len(violations)} latency budget(s) exceeded: " + "; ".join(
+                    violation.describe() for violation in violations[:3]
+                )
+            elif result.completed:
+                status, error = "completed", None
+            elif result.timed_out:
+                status, error = "timeout", f"timed out after {timeout_ms}ms"
+                timeouts += 1
+            else:
+                status, error = "failed", f"exit code {result.returncode}"
+            self.journal.update_run(
+                run_id,
+                status=status,
+                completed_at=datetime.now().isoformat(),
+                duration_ms=int(result.duration_ms),
+                error=error,
+                **result.usage.as_fields(),
+            )
+            self._log(
+                f"  {item.id} attempt {attempt}/{self.max_attempts}: "
+                f"{status} in {result.duration_ms / 1000:.0f}s"
+            )
+            if violations:
+                for violation in violations:
+                    print(f"[   budget] {violation.describe()}", flush=True)
+                return False
+            if result.completed:
+                mark_status(item.id, path=self.config.checklist_path)
+                fingerprint.record_fingerprint(item)
+                return True
+        return False
+
+    def record_usage(self):
+        """Store this session's token totals and throughput on the session."""
+        rows = monitor.run_rows(self.journal.session_id, self.journal.state["runs"])
+        for totals in usage.summarize(rows):
+            del totals["session"]
+            self.journal.update_session(usage=totals)
+            print(
+                f"Usage: {totals['tool_calls']} tool calls, "
+                f"{totals['input_tokens']} in / {totals['output_tokens']} out tokens, "
+                f"{totals['items_per_hour'] or '-'} items/h, "
+                f"{totals['tokens_per_item'] or '-'} tokens/item"
+            )
+
+    def _on_event(self, kind, item_id):
+        print(f"[{kind:>9}] {item_id}", flush=True)
+
+    async def process(self):
+        """Run all pending items and return a RunResult."""
+        scheduler = self.build_scheduler()
+
+        if self.config.dry_run:
+            plan = scheduler.plan()
+            for item_id in plan:
+                item = scheduler.items[item_id]
+                prereqs = sorted(scheduler.dependencies[item_id])
+                prereqs = ", ".join(prereqs) if len(prereqs) <= 3 else f"{len(prereqs)} items"
+                print(f"  {item_id:8} {item.tier_dir}  after: {prereqs or '-'}")
+            return RunResult(processed=len(plan), dry_run=True)
+
+        self.journal = self.open_journal()
+        # The dashboard measures slot utilization against this
+        self.journal.update_session(batch_size=self.config.batch_size)
+        if self.adaptive:
+            self.controller = ConcurrencyController(
+                initial=self.config.batch_size, on_change=self._on_slots
+            )
+            self.timeouts = TimeoutPolicy.from_history(self.config.timeout_ms)
+        try:
+            outcomes = await scheduler.run(
+                self.run_item, on_event=self._on_event, controller=self.controller
+            )
+        except BaseException:
+            self.journal.finish(status="cancelled")
+            raise
+        self.record_usage()
+        self.journal.finish()
+        values = list(outcomes.values())
+        return RunResult(
+            processed=values.count(COMPLETED) + values.count(FAILED),
+            completed=values.count(COMPLETED),
+            failed=values.count(FAILED),
+            blocked=len(values) - values.count(COMPLETED) - values.count(FAILED),
+        )
+
+    def cancel_all(self):
+        """Stop every running agent."""
+        agent.terminate_all()
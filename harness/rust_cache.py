@@ -0,0 +1,367 @@
+"""
+Shared, content-addressed Cargo build cache for per-item Rust test crates.
+
+Every checklist item that writes a Rust test used to get its own `target/`
+directory, so each item recompiled the whole `ucp-api` dependency tree.
+Instead, all items build into one target directory per cache key, where the
+key is the hash of the active toolchain (`rustc -vV`) plus the external
+dependency set recorded in the crate's Cargo.lock. Items that resolve the
+same dependencies share compiled artifacts and only build their own crate.
+
+Cargo writes a crate's final binaries to `target/<profile>/<name>`, so
+items whose crates share a package name would overwrite each other's
+there. Each build therefore holds a lock on the shared directory and
+copies the crate's executables into its own artifact directory before
+releasing it; callers run those copies. Library crates are built with
+`tests=True` (`cargo test --no-run`) so their test binaries are compiled
+by the build too, not by a later `cargo test`.
+
+Usage:
+    python -m harness.rust_cache runs/<tier>/<ITEM>/tests/rust
+    python -m harness.rust_cache --tests runs/<tier>/<ITEM>/tests/rust
+    python -m harness.rust_cache --summary
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from harness.paths import PROCESSOR_DIR, results_dir_for
+
+# Environment variable run.py uses to hand the cache location to agents
+CACHE_ENV_VAR = "UCP_RUST_CACHE"
+DEFAULT_CACHE_ROOT = PROCESSOR_DIR / "cargo-cache"
+# Per-crate copies of built executables, below the cache root
+ARTIFACTS_DIR = "artifacts"
+LOCK_FILE = ".ucp-build.lock"
+
+_PACKAGE_NAME_RE = re.compile(r'^\s*name\s*=\s*"([^"]+)"', re.MULTILINE)
+_CARGO_UNIT_RE = re.compile(r"^\s*(Fresh|Compiling)\s+(\S+)", re.MULTILINE)
+
+
+@dataclass
+class BuildStats:
+    """Outcome of one item's build against the shared cache."""
+
+    crate_dir: str
+    cache_key: str
+    target_dir: str
+    success: bool
+    returncode: int
+    duration_ms: float
+    fresh_units: int
+    compiled_units: int
+    hit_rate: float
+    item_bytes: int
+    cache_bytes: int
+    artifact_dir: str = ""
+    # The crate's binaries (or test binaries), copied to artifact_dir
+    executables: list = field(default_factory=list)
+
+
+def cache_root():
+    """Return the root directory holding all shared target directories."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    return Path(override) if override else DEFAULT_CACHE_ROOT
+
+
+def toolchain_fingerprint():
+    """Return the verbose rustc version string identifying the toolchain."""
+    try:
+        output = subprocess.run(
+            ["rustc", "-vV"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "rustc-unavailable"
+    return output.strip()
+
+
+def _crate_name(crate_dir):
+    """Read the package name from a crate's Cargo.toml."""
+    manifest = crate_dir / "Cargo.toml"
+    match = _PACKAGE_NAME_RE.search(manifest.read_text())
+    return match.group(1) if match else crate_dir.name
+
+
+def dependency_fingerprint(crate_dir):
+    """
+    Hash the external dependency set recorded in a crate's Cargo.lock.
+
+    The entry for the crate itself is dropped so that two items with
+    different crate names but identical dependencies hash the same.
+    """
+    lockfile = crate_dir / "Cargo.lock"
+    if not lockfile.exists():
+        return ""
+
+    own_name = _crate_name(crate_dir)
+    packages = []
+    for block in lockfile.read_text().split("[[package]]")[1:]:
+        match = _PACKAGE_NAME_RE.search(block)
+        if match and match.group(1) == own_name:
+            continue
+        packages.append(block.strip())
+    return "\n".join(sorted(packages))
+
+
+def cache_key(crate_dir):
+    """Return the content-addressed cache key for a crate."""
+    digest = hashlib.sha256()
+    digest.update(toolchain_fingerprint().encode())
+    digest.update(b"\0")
+    digest.update(dependency_fingerprint(crate_dir).encode())
+    return digest.hexdigest()[:16]
+
+
+def artifact_dir_for(crate_dir):
+    """Return the directory holding a crate's own copies of its executables."""
+    crate_dir = Path(crate_dir).resolve()
+    digest = hashlib.sha256(str(crate_dir).encode()).hexdigest()[:12]
+    return cache_root() / ARTIFACTS_DIR / f"{_crate_name(crate_dir)}-{digest}"
+
+
+def _own_executables(messages, crate_dir, tests):
+    """
+    Return the executables cargo built for the crate itself.
+
+    `messages` is cargo's `--message-format json` output. With `tests`
+    these are the test binaries, otherwise the crate's bin targets.
+    """
+    manifest = str(crate_dir / "Cargo.toml")
+    executables = []
+    for line in messages.splitlines():
+        if not line.startswith("{"):
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if message.get("reason") != "compiler-artifact":
+            continue
+        if message.get("manifest_path") != manifest or not message.get("executable"):
+            continue
+        if tests:
+            wanted = message.get("profile", {}).get("test", False)
+        else:
+            wanted = "bin" in message.get("target", {}).get("kind", [])
+        if wanted:
+            executables.append(message["executable"])
+    return executables
+
+
+@contextmanager
+def _locked(target_dir):
+    """Hold an exclusive lock on a shared target directory."""
+    if fcntl is None:
+        yield
+        return
+    with open(target_dir / LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def directory_size(path):
+    """Return the total size in bytes of all files below path."""
+    if not path.exists():
+        return 0
+    total = 0
+    for entry in path.rglob("*"):
+        try:
+            if entry.is_file() and not entry.is_symlink():
+                total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def build_crate(
+    crate_dir,
+    release=False,
+    offline=False,
+    tests=False,
+    results_dir=None,
+    start_new_session=False,
+    on_start=None,
+):
+    """
+    Build an item's Rust crate into the shared target directory.
+
+    Cargo's `Fresh`/`Compiling` lines are counted to derive the cache hit
+    rate, and the growth of the shared target directory is attributed to
+    the item. With `tests` the crate's test binaries are built instead of
+    its bin targets. When results_dir is given, the stats are also written to
+    `rust_build_cache.json` there and the cargo output to `rust_build.log`.
+    With `start_new_session` cargo runs in its own session, and
+    `on_start(proc)` is called with its Popen once it has started, so a
+    caller can set limits on the build or kill its process group.
+    """
+    crate_dir = Path(crate_dir).resolve()
+    if not (crate_dir / "Cargo.toml").exists():
+        raise FileNotFoundError(f"No Cargo.toml in {crate_dir}")
+
+    if not (crate_dir / "Cargo.lock").exists():
+        subprocess.run(
+            ["cargo", "generate-lockfile"], cwd=crate_dir, capture_output=True
+        )
+
+    key = cache_key(crate_dir)
+    target_dir = cache_root() / key
+    target_dir.mkdir(parents=True, exist_ok=True)
+    artifact_dir = artifact_dir_for(crate_dir)
+
+    cmd = ["cargo", "test", "--no-run"] if tests else ["cargo", "build"]
+    cmd += ["--verbose", "--color", "never"]
+    cmd += ["--message-format", "json-render-diagnostics"]
+    if release:
+        cmd.append("--release")
+    if offline:
+        cmd.append("--offline")
+
+    env = dict(os.environ, CARGO_TARGET_DIR=str(target_dir))
+    # Held until the executables are copied, so another crate with the
+    # same package name can't overwrite them first
+    with _locked(target_dir):
+        size_before = directory_size(target_dir)
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd,
+            cwd=crate_dir,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=start_new_session,
+        )
+        if on_start is not None:
+            on_start(proc)
+        stdout, stderr = proc.communicate()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        executables = []
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+        if proc.returncode == 0:
+            artifact_dir.mkdir(parents=True)
+            for path in _own_executables(stdout, crate_dir, tests):
+                copy = artifact_dir / Path(path).name
+                shutil.copy2(path, copy)
+                executables.append(str(copy))
+        size_after = directory_size(target_dir)
+
+    units = _CARGO_UNIT_RE.findall(stderr)
+    fresh = sum(1 for kind, _ in units if kind == "Fresh")
+    compiled = sum(1 for kind, _ in units if kind == "Compiling")
+
+    stats = BuildStats(
+        crate_dir=str(crate_dir),
+        cache_key=key,
+        target_dir=str(target_dir),
+        success=proc.returncode == 0,
+        returncode=proc.returncode,
+        duration_ms=round(duration_ms, 1),
+        fresh_units=fresh,
+        compiled_units=compiled,
+        hit_rate=round(fresh / (fresh + compiled), 3) if units else 0.0,
+        item_bytes=max(size_after - size_before, 0) + directory_size(artifact_dir),
+        cache_bytes=size_after,
+        artifact_dir=str(artifact_dir),
+        executables=executables,
+    )
+
+    if results_dir is not None:
+        results_dir = Path(results_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+        (results_dir / "rust_build.log").write_text(stderr)
+        (results_dir / "rust_build_cache.json").write_text(
+            json.dumps(asdict(stats), indent=2)
+        )
+
+    return stats
+
+
+def cache_summary():
+    """Return the size in bytes of every shared target directory."""
+    root = cache_root()
+    if not root.exists():
+        return {}
+    return {
+        entry.name: directory_size(entry)
+        for entry in sorted(root.iterdir())
+        if entry.is_dir() and entry.name != ARTIFACTS_DIR
+    }
+
+
+def format_stats(stats):
+    """Render build stats as a short human-readable report."""
+    status = "OK" if stats.success else f"FAILED (exit {stats.returncode})"
+    return (
+        f"Rust build {status} in {stats.duration_ms / 1000:.1f}s\n"
+        f"  Cache key: {stats.cache_key}\n"
+        f"  Units: {stats.fresh_units} fresh, {stats.compiled_units} compiled "
+        f"(hit rate {stats.hit_rate:.0%})\n"
+        f"  Item added: {stats.item_bytes / 1e6:.1f} MB, "
+        f"cache total: {stats.cache_bytes / 1e6:.1f} MB\n"
+        f"  Executables: {len(stats.executables)} in {stats.artifact_dir}"
+    )
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Build an item's Rust test crate against the shared cache"
+    )
+    parser.add_argument("crate_dir", nargs="?", help="Directory with Cargo.toml")
+    parser.add_argument("--release", action="store_true", help="Build in release mode")
+    parser.add_argument("--offline", action="store_true", help="Pass --offline to cargo")
+    parser.add_argument(
+        "--tests",
+        action="store_true",
+        help="Build the test binaries (cargo test --no-run), for library crates",
+    )
+    parser.add_argument(
+        "--results-dir",
+        help="Where to write rust_build_cache.json (default: <item>/results)",
+    )
+    parser.add_argument(
+        "--summary", action="store_true", help="Print shared cache sizes and exit"
+    )
+    args = parser.parse_args(argv)
+
+    if args.summary or not args.crate_dir:
+        print(f"Shared Rust cache: {cache_root()}")
+        for key, size in cache_summary().items():
+            print(f"  {key}: {size / 1e6:.1f} MB")
+        return 0
+
+    crate_dir = Path(args.crate_dir).resolve()
+    results_dir = args.results_dir or results_dir_for(crate_dir)
+
+    stats = build_crate(
+        crate_dir,
+        release=args.release,
+        offline=args.offline,
+        tests=args.tests,
+        results_dir=results_dir,
+    )
+    print(format_stats(stats))
+    return 0 if stats.success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Dependency-aware scheduler for checklist items.
+
+Instead of running fixed batches (where each batch waits for its slowest
+item), the scheduler keeps a single ready queue ordered by tier, priority
+and checklist order. Whenever one of the N slots frees up it immediately
+takes the next item whose prerequisites have all completed. Items whose
+prerequisites failed are reported as blocked rather than run.
+"""
+
+import asyncio
+import heapq
+
+COMPLETED = "completed"
+FAILED = "failed"
+BLOCKED = "blocked"
+
+
+def check_acyclic(dependencies):
+    """Raise ValueError if the dependency graph contains a cycle."""
+    visiting, done = set(), set()
+
+    def visit(node, trail):
+        if node in done:
+            return
+        if node in visiting:
+            cycle = " -> ".join(trail[trail.index(node):] + [node])
+            raise ValueError(f"Dependency cycle in checklist: {cycle}")
+        visiting.add(node)
+        for prereq in dependencies.get(node, ()):
+            visit(prereq, trail + [node])
+        visiting.discard(node)
+        done.add(node)
+
+    for node in dependencies:
+        visit(node, [])
+
+
+class DagScheduler:
+    """
+    Run checklist items on N slots while respecting prerequisites.
+
+    `items` are the ChecklistItems to execute. `dependencies` maps item ID
+    to prerequisite IDs; prerequisites that are not in `items` are treated
+    as already satisfied when listed in `satisfied` (e.g. items marked
+    completed in the checklist) and as blocking otherwise.
+    """
+
+    def __init__(self, items, dependencies, slots=5, satisfied=()):
+        self.items = {item.id: item for item in items}
+        self.slots = max(1, slots)
+        self.satisfied = set(satisfied)
+        self.dependencies = {
+            item_id: {p for p in dependencies.get(item_id, ()) if p not in self.satisfied}
+            for item_id in self.items
+        }
+        check_acyclic(self.dependencies)
+        self.outcomes = {}
+
+    def _dependents(self):
+        dependents = {item_id: [] for item_id in self.items}
+        for item_id, prereqs in self.dependencies.items():
+            for prereq in prereqs:
+                if prereq in dependents:
+                    dependents[prereq].append(item_id)
+        return dependents
+
+    def plan(self):
+        """Return item IDs in the order a single slot would run them."""
+        order = []
+        remaining = {k: set(v) for k, v in self.dependencies.items()}
+        dependents = self._dependents()
+        ready = [
+            (self.items[i].sort_key, i) for i, prereqs in remaining.items() if not prereqs
+        ]
+        heapq.heapify(ready)
+        while ready:
+            _, item_id = heapq.heappop(ready)
+            order.append(item_id)
+            for dependent in dependents[item_id]:
+                remaining[dependent].discard(item_id)
+                if not remaining[dependent]:
+                    heapq.heappush(ready, (self.items[dependent].sort_key, dependent))
+        return order
+
+    async def run(self, worker, on_event=None, controller=None):
+        """
+        Execute every item with `await worker(item)` -> bool (success).
+
+        `on_event(kind, item_id)` is called with "started", "completed",
+        "failed" or "blocked". With a `controller` (see harness.adaptive)
+        the slot count is re-read from `controller.update(queue_depth)`
+        every `controller.interval` seconds. Returns a mapping of item
+        ID -> outcome.
+        """
+        remaining = {k: set(v) for k, v in self.dependencies.items()}
+        dependents = self._dependents()
+        ready = []
+        for item_id, prereqs in remaining.items():
+            missing = [p for p in prereqs if p not in self.items]
+            if missing:
+                self.outcomes[item_id] = BLOCKED
+            elif not prereqs:
+                heapq.heappush(ready, (self.items[item_id].sort_key, item_id))
+
+        def notify(kind, item_id):
+            if on_event is not None:
+                on_event(kind, item_id)
+
+        def block_dependents(item_id):
+            for dependent in dependents[item_id]:
+                if dependent not in self.outcomes:
+                    self.outcomes[dependent] = BLOCKED
+                    notify(BLOCKED, dependent)
+                    block_dependents(dependent)
+
+        for item_id, outcome in list(self.outcomes.items()):
+            notify(outcome, item_id)
+            block_dependents(item_id)
+
+        running = {}
+        while ready or running:
+            if controller is not None:
+                self.slots = controller.update(queue_depth=len(ready))
+            while ready and len(running) < self.slots:
+                _, item_id = heapq.heappop(ready)
+                if item_id in self.outcomes:
+                    continue
+                notify("started", item_id)
+                task = asyncio.ensure_future(worker(self.items[item_id]))
+                running[task] = item_id
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(
+                running,
+                timeout=controller.interval if controller is not None else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                item_id = running.pop(task)
+                try:
+                    success = bool(task.result())
+                except Exception:
+                    success = False
+                outcome = COMPLETED if success else FAILED
+                self.outcomes[item_id] = outcome
+                notify(outcome, item_id)
+
+                if success:
+                    for dependent in dependents[item_id]:
+                        remaining[dependent].discard(item_id)
+                        if not remaining[dependent] and dependent not in self.outcomes:
+                            heapq.heappush(
+                                ready, (self.items[dependent].sort_key, dependent)
+                            )
+                else:
+                    block_dependents(item_id)
+
+        return dict(self.outcomes)
@@ -0,0 +1,540 @@
+"""
+Snapshot and transaction cost profiler (UCL-030..UCL-039 at scale).
+
+The tier 8 items check SNAPSHOT and ATOMIC for correctness on small
+documents. This measures what they cost as the document and the number
+of retained snapshots grow, to show whether checkpointing every agent
+turn is affordable on 100K-block documents. Documents are the Tier 19
+benchmark document (harness.benchmarks.python_driver.build_document).
+
+Three sections, per document size:
+
+- checkpoints: one block appended and one snapshot taken per simulated
+  agent turn, up to the largest `--counts` value. Create latency and
+  retained RSS per snapshot are read at each count, then restore (oldest
+  and newest) and DIFF (oldest vs newest) are timed. Runs through the
+  SnapshotManager API and through UCL `SNAPSHOT ...` commands when the
+  SDK has them.
+- atomic: `ATOMIC { N x APPEND; <failing EDIT> }` for each `--partials`
+  N, against the same N commands committed. Records whether the block
+  count came back unchanged (the rollback happened) and the cost of the
+  rollback relative to the commit.
+- eviction: SnapshotManager(max_snapshots=EVICT_LIMIT) fed EVICT_CREATES
+  snapshots; create latency before and after the limit is reached, RSS
+  growth after it (should be ~0), and whether the oldest were evicted.
+
+A size is marked affordable when checkpoint create p99 is within
+`--budget-ms`.
+
+Usage:
+    python -m harness.snapshot_cost
+    python -m harness.snapshot_cost --sizes 100000 --counts 1,5 \\
+        --partials 1,100,1000 --budget-ms 50
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+from datetime import datetime
+
+from harness.benchmarks.python_driver import _rss_bytes, build_document
+from harness.capabilities import load, sdk
+from harness.checklist import tier_folder_name
+from harness.fingerprint import python_sdk_version
+from harness.histogram import LatencyHistogram
+from harness.paths import RUNS_DIR
+
+# Snapshots are full copies: 20 of a 100K-block document is several GB
+# on some builds, so 100K is opt-in (--sizes 100000 with modest --counts)
+DEFAULT_SIZES = (1000, 10000)
+DEFAULT_COUNTS = (1, 5, 20)
+DEFAULT_PARTIALS = (1, 10, 100, 1000)
+CHECKPOINT_BUDGET_MS = 100
+RESTORE_REPEATS = 3
+ATOMIC_REPEATS = 3
+EVICT_LIMIT = 5
+EVICT_CREATES = 20
+
+MISSING_BLOCK = "blk_000000000000000000000000"
+
+TIER_DIR = RUNS_DIR / tier_folder_name("Tier 8: UCL Advanced Commands")
+RESULTS_PATH = TIER_DIR / "snapshot-cost.json"
+REPORT_PATH = TIER_DIR / "SNAPSHOT-COST-REPORT.md"
+
+
+def _block_count(caps, doc):
+    count = caps.get(doc, "block_count")
+    return count() if callable(count) else count
+
+
+def _timed(function, *args):
+    start = time.perf_counter_ns()
+    result = function(*args)
+    return time.perf_counter_ns() - start, result
+
+
+def _turn(ucp, doc, index):
+    """Simulate one agent turn's edit."""
+    doc.add_block_with_content(doc.root_id, ucp.Content.text(f"Turn {index}"))
+
+
+# -- backends -----------------------------------------------------------------
+
+
+class ManagerBackend:
+    """Snapshots held by a SnapshotManager object."""
+
+    name = "manager"
+    has_diff = False
+
+    def __init__(self, ucp, max_snapshots=None):
+        if max_snapshots is None:
+            self.manager = ucp.SnapshotManager()
+        else:
+            self.manager = ucp.SnapshotManager(max_snapshots=max_snapshots)
+
+    def create(self, doc, name):
+        self.manager.create(name, doc)
+        return doc
+
+    def restore(self, doc, name):
+        return self.manager.restore(name)
+
+    def exists(self, name):
+        return self.manager.exists(name)
+
+    def count(self):
+        return len(self.manager)
+
+    def close(self, doc, names):
+        self.manager = None
+
+
+class UclBackend:
+    """Snapshots kept by the engine behind execute_ucl."""
+
+    name = "ucl"
+    has_diff = True
+
+    def __init__(self, ucp):
+        self.execute = ucp.execute_ucl
+
+    def create(self, doc, name):
+        self.execute(doc, f'SNAPSHOT CREATE "{name}"')
+        return doc
+
+    def restore(self, doc, name):
+        self.execute(doc, f'SNAPSHOT RESTORE "{name}"')
+        return doc
+
+    def diff(self, doc, first, second):
+        return self.execute(doc, f'SNAPSHOT DIFF "{first}" "{second}"')
+
+    def close(self, doc, names):
+        for name in names:
+            try:
+                self.execute(doc, f'SNAPSHOT DELETE "{name}"')
+            except Exception:
+                pass
+
+
+def backends(ucp):
+    """Return the backend classes this SDK supports."""
+    found = []
+    if hasattr(ucp, "SnapshotManager"):
+        found.append(ManagerBackend)
+    if hasattr(ucp, "execute_ucl"):
+        found.append(UclBackend)
+    return found
+
+
+# -- sections -----------------------------------------------------------------
+
+
+def profile_checkpoints(ucp, size, backend_class, counts):
+    """Take one snapshot per turn; read latency and RSS at each count."""
+    doc = build_document(ucp, size)
+    json_bytes = len(doc.to_json().encode())
+    backend = backend_class(ucp)
+    gc.collect()
+    rss_before = _rss_bytes()
+
+    create = LatencyHistogram()
+    names, levels = [], []
+    for index in range(max(counts)):
+        _turn(ucp, doc, index)
+        name = f"turn-{index}"
+        elapsed, doc = _timed(backend.create, doc, name)
+        create.record(elapsed)
+        names.append(name)
+        if index + 1 in counts:
+            gc.collect()
+            retained = _rss_bytes() - rss_before
+            levels.append(
+                {
+                    "snapshots": index + 1,
+                    "create": create.summary(),
+                    "retained_bytes": retained,
+                    "retained_per_snapshot_bytes": round(retained / (index + 1)),
+                }
+            )
+
+    restore = {}
+    for label, name in (("oldest", names[0]), ("newest", names[-1])):
+        histogram = LatencyHistogram()
+        for _ in range(RESTORE_REPEATS):
+            elapsed, doc = _timed(backend.restore, doc, name)
+            histogram.record(elapsed)
+        restore[label] = histogram.summary()
+
+    diff = None
+    if backend.has_diff and len(names) > 1:
+        histogram = LatencyHistogram()
+        for _ in range(RESTORE_REPEATS):
+            histogram.record(_timed(backend.diff, doc, names[0], names[-1])[0])
+        diff = histogram.summary()
+
+    backend.close(doc, names)
+    return {
+        "size": size,
+        "backend": backend.name,
+        "json_bytes": json_bytes,
+        "levels": levels,
+        "restore": restore,
+        "diff": diff,
+    }
+
+
+def atomic_script(root_id, partials, fail):
+    """UCL for N appends, optionally followed by a command that must fail."""
+    lines = [f'    APPEND {root_id} text :: "Partial {i}"' for i in range(partials)]
+    if fail:
+        lines.append(f'    EDIT {MISSING_BLOCK} SET text = "unreachable"')
+    return "ATOMIC {\n" + "\n".join(lines) + "\n}"
+
+
+def profile_atomic(ucp, caps, size, partials):
+    """Time committed and rolled-back ATOMIC groups of `partials` commands."""
+    doc = build_document(ucp, size)
+    results = []
+    for count in partials:
+        commit, rollback = LatencyHistogram(), LatencyHistogram()
+        commit_script = atomic_script(doc.root_id, count, fail=False)
+        fail_script = atomic_script(doc.root_id, count, fail=True)
+        rolled_back, raised, error = True, True, None
+        for _ in range(ATOMIC_REPEATS):
+            try:
+                commit.record(_timed(ucp.execute_ucl, doc, commit_script)[0])
+            except Exception as e:
+                error = f"commit: {type(e).__name__}: {e}"
+                break
+            before = _block_count(caps, doc)
+            start = time.perf_counter_ns()
+            try:
+                ucp.execute_ucl(doc, fail_script)
+                raised = False
+            except Exception:
+                pass
+            rollback.record(time.perf_counter_ns() - start)
+            rolled_back = rolled_back and _block_count(caps, doc) == before
+        commit_p50 = commit.summary()["p50_ns"]
+        results.append(
+            {
+                "partials": count,
+                "commit": commit.summary(),
+                "rollback": rollback.summary(),
+                "rollback_vs_commit": (
+                    round(rollback.summary()["p50_ns"] / commit_p50, 3)
+                    if commit_p50
+                    else None
+                ),
+                "raised": raised,
+                "rolled_back": rolled_back if rollback.count else None,
+                "error": error,
+            }
+        )
+    return {"size": size, "results": results}
+
+
+def profile_eviction(ucp, size, limit=EVICT_LIMIT, creates=EVICT_CREATES):
+    """Fill a bounded SnapshotManager past its limit."""
+    doc = build_document(ucp, size)
+    backend = ManagerBackend(ucp, max_snapshots=limit)
+    gc.collect()
+    rss_before = _rss_bytes()
+    filling, evicting = LatencyHistogram(), LatencyHistogram()
+    rss_at_limit = None
+    for index in range(creates):
+        _turn(ucp, doc, index)
+        elapsed, _ = _timed(backend.create, doc, f"turn-{index}")
+        (filling if index < limit else evicting).record(elapsed)
+        if index + 1 == limit:
+            gc.collect()
+            rss_at_limit = _rss_bytes() - rss_before
+    gc.collect()
+    rss_end = _rss_bytes() - rss_before
+    evicted = [not backend.exists(f"turn-{i}") for i in range(creates - limit)]
+    kept = [backend.exists(f"turn-{i}") for i in range(creates - limit, creates)]
+    result = {
+        "size": size,
+        "limit": limit,
+        "creates": creates,
+        "filling": filling.summary(),
+        "evicting": evicting.summary(),
+        "rss_at_limit_bytes": rss_at_limit,
+        "rss_end_bytes": rss_end,
+        # RSS that kept growing once eviction should have capped it
+        "growth_after_limit_bytes": (
+            rss_end - rss_at_limit if rss_at_limit is not None else None
+        ),
+        "count": backend.count(),
+        "oldest_evicted": all(evicted),
+        "newest_kept": all(kept),
+    }
+    backend.close(doc, [])
+    return result
+
+
+def run(ucp, sizes, counts, partials, budget_ms=CHECKPOINT_BUDGET_MS):
+    """Run every section at every size and return the report."""
+    caps = load()
+    available = backends(ucp)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "sdk_version": python_sdk_version(),
+        "sizes": sizes,
+        "counts": counts,
+        "budget_ms": budget_ms,
+        "backends": [backend.name for backend in available],
+        "checkpoints": [],
+        "atomic": [],
+        "eviction": [],
+    }
+    for size in sizes:
+        for backend_class in available:
+            label = f"checkpoints ({backend_class.name})"
+            print(f"  {size:7} blocks  {label}...", flush=True)
+            try:
+                result = profile_checkpoints(ucp, size, backend_class, counts)
+            except Exception as e:
+                result = {
+                    "size": size,
+                    "backend": backend_class.name,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+            report["checkpoints"].append(result)
+            gc.collect()
+        if hasattr(ucp, "execute_ucl"):
+            print(f"  {size:7} blocks  atomic...", flush=True)
+            try:
+                report["atomic"].append(profile_atomic(ucp, caps, size, partials))
+            except Exception as e:
+                report["atomic"].append(
+                    {"size": size, "error": f"{type(e).__name__}: {e}"}
+                )
+        if ManagerBackend in available:
+            print(f"  {size:7} blocks  eviction...", flush=True)
+            try:
+                report["eviction"].append(profile_eviction(ucp, size))
+            except Exception as e:
+                report["eviction"].append(
+                    {"size": size, "error": f"{type(e).__name__}: {e}"}
+                )
+        gc.collect()
+    report["verdicts"] = verdicts(report)
+    return report
+
+
+def verdicts(report):
+    """Per (size, backend): is a checkpoint per turn within budget?"""
+    result = []
+    for entry in report["checkpoints"]:
+        if "error" in entry or not entry["levels"]:
+            continue
+        last = entry["levels"][-1]
+        p99_ms = last["create"]["p99_ns"] / 1e6
+        result.append(
+            {
+                "size": entry["size"],
+                "backend": entry["backend"],
+                "create_p99_ms": round(p99_ms, 3),
+                "retained_per_snapshot_bytes": last["retained_per_snapshot_bytes"],
+                "affordable": p99_ms <= report["budget_ms"],
+            }
+        )
+    return result
+
+
+def _ms(ns):
+    return f"{ns / 1e6:.2f}"
+
+
+def _mb(value):
+    return "-" if value is None else f"{value / 1e6:.1f}"
+
+
+def format_report(report):
+    """Render the report as Markdown."""
+    lines = [
+        "# Snapshot and Transaction Cost Report",
+        "",
+        f"**Generated**: {report['generated_at']}",
+        f"**Python SDK**: {report['sdk_version'] or 'unknown'}",
+        f"**Snapshot APIs**: {', '.join(report['backends']) or 'none'}",
+        f"**Checkpoint budget**: {report['budget_ms']} ms create p99",
+        "",
+        "## Checkpoint Per Turn",
+        "",
+        "| Blocks | API | Create p99 ms | Retained MB/snapshot | Affordable |",
+        "|---:|---|---:|---:|---|",
+    ]
+    for verdict in report["verdicts"]:
+        lines.append(
+            f"| {verdict['size']} | {verdict['backend']} "
+            f"| {verdict['create_p99_ms']:.2f} "
+            f"| {_mb(verdict['retained_per_snapshot_bytes'])} "
+            f"| {'yes' if verdict['affordable'] else '**no**'} |"
+        )
+
+    lines += [
+        "",
+        "## Snapshots",
+        "",
+        "| Blocks | API | JSON MB | Snapshots | Create p50 ms | Create p99 ms "
+        "| Retained MB | Restore oldest ms | Restore newest ms | Diff ms |",
+        "|---:|---|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    errors = []
+    for entry in report["checkpoints"]:
+        if "error" in entry:
+            errors.append(
+                f"- snapshots, {entry['size']} blocks, {entry['backend']}: "
+                f"{entry['error']}"
+            )
+            continue
+        for level in entry["levels"]:
+            # Restore and diff are timed once, after the last count
+            final = level is entry["levels"][-1]
+            oldest = newest = diff = ""
+            if final:
+                oldest = _ms(entry["restore"]["oldest"]["p50_ns"])
+                newest = _ms(entry["restore"]["newest"]["p50_ns"])
+                diff = _ms(entry["diff"]["p50_ns"]) if entry["diff"] else "-"
+            lines.append(
+                f"| {entry['size']} | {entry['backend']} "
+                f"| {_mb(entry['json_bytes'])} | {level['snapshots']} "
+                f"| {_ms(level['create']['p50_ns'])} "
+                f"| {_ms(level['create']['p99_ns'])} "
+                f"| {_mb(level['retained_bytes'])} | {oldest} | {newest} | {diff} |"
+            )
+
+    if report["atomic"]:
+        lines += [
+            "",
+            "## ATOMIC Rollback",
+            "",
+            "| Blocks | Commands | Commit p50 ms | Rollback p50 ms | Rollback/commit "
+            "| Failure raised | Rolled back |",
+            "|---:|---:|---:|---:|---:|---|---|",
+        ]
+        for entry in report["atomic"]:
+            if "error" in entry:
+                errors.append(f"- atomic, {entry['size']} blocks: {entry['error']}")
+                continue
+            for result in entry["results"]:
+                if result["error"]:
+                    errors.append(
+                        f"- atomic, {entry['size']} blocks, {result['partials']} "
+                        f"commands: {result['error']}"
+                    )
+                    continue
+                ratio = result["rollback_vs_commit"]
+                lines.append(
+                    f"| {entry['size']} | {result['partials']} "
+                    f"| {_ms(result['commit']['p50_ns'])} "
+                    f"| {_ms(result['rollback']['p50_ns'])} "
+                    f"| {'-' if ratio is None else f'{ratio:.2f}x'} "
+                    f"| {'yes' if result['raised'] else '**no**'} "
+                    f"| {'yes' if result['rolled_back'] else '**no**'} |"
+                )
+
+    if report["eviction"]:
+        lines += [
+            "",
+            "## Eviction",
+            "",
+            "| Blocks | Limit | Created | Filling p50 ms | Evicting p50 ms "
+            "| RSS at limit MB | Growth after MB | Count | Oldest evicted |",
+            "|---:|---:|---:|---:|---:|---:|---:|---:|---|",
+        ]
+        for entry in report["eviction"]:
+            if "error" in entry:
+                errors.append(f"- eviction, {entry['size']} blocks: {entry['error']}")
+                continue
+            lines.append(
+                f"| {entry['size']} | {entry['limit']} | {entry['creates']} "
+                f"| {_ms(entry['filling']['p50_ns'])} "
+                f"| {_ms(entry['evicting']['p50_ns'])} "
+                f"| {_mb(entry['rss_at_limit_bytes'])} "
+                f"| {_mb(entry['growth_after_limit_bytes'])} | {entry['count']} "
+                f"| {'yes' if entry['oldest_evicted'] else '**no**'} |"
+            )
+
+    if errors:
+        lines += ["", "## Errors", "", *errors]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Snapshot, ATOMIC rollback and eviction cost by document size"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated document sizes in blocks (default: 1000,10000)",
+    )
+    parser.add_argument(
+        "--counts",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=list(DEFAULT_COUNTS),
+        help="Snapshot counts to read latency and memory at (default: 1,5,20)",
+    )
+    parser.add_argument(
+        "--partials",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=list(DEFAULT_PARTIALS),
+        help="Commands before the failing one in ATOMIC (default: 1,10,100,1000)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=CHECKPOINT_BUDGET_MS,
+        help=f"Create p99 budget per checkpoint (default: {CHECKPOINT_BUDGET_MS})",
+    )
+    args = parser.parse_args(argv)
+
+    ucp = sdk()
+    report = run(
+        ucp, sorted(args.sizes), sorted(args.counts), args.partials, args.budget_ms
+    )
+    TIER_DIR.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(report, indent=2))
+    REPORT_PATH.write_text(format_report(report))
+    for verdict in report["verdicts"]:
+        print(
+            f"{verdict['size']:7} blocks {verdict['backend']:8} create p99 "
+            f"{verdict['create_p99_ms']:.2f}ms, "
+            f"{_mb(verdict['retained_per_snapshot_bytes'])} MB/snapshot: "
+            f"{'affordable' if verdict['affordable'] else 'over budget'}"
+        )
+    print(f"Report: {REPORT_PATH}")
+    return 0 if all(v["affordable"] for v in report["verdicts"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Structured per-step timing for generated tests.
+
+Every generated Python test should time UCP operations through this module
+instead of ad-hoc `time.time()` offsets, so that latency is comparable
+across items and SDK releases:
+
+    from harness.timing import measure, timer
+
+    with timer("document_create"):
+        doc = ucp.Document.create()
+
+    @timer("add_block")
+    def add_block():
+        ...
+
+    stats = measure("to_json", doc.to_json, warmup=3, repeat=50)
+    print(stats.describe())
+
+Samples are taken with `time.perf_counter_ns`. When the process exits, one
+summary line per operation (count, min/max/mean/stdev, p50/p90/p95/p99 and
+the raw samples) is appended to the item's results/timings.jsonl.
+"""
+
+import atexit
+import json
+import math
+import statistics
+import sys
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from harness.fingerprint import python_sdk_version
+from harness.paths import item_dir_for, results_dir_for
+
+TIMINGS_FILENAME = "timings.jsonl"
+
+# Raw samples kept per operation in timings.jsonl
+MAX_STORED_SAMPLES = 10000
+
+
+def percentile(sorted_values, fraction):
+    """Linearly interpolated percentile of an already-sorted sequence."""
+    if not sorted_values:
+        return 0
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+@dataclass
+class TimingStats:
+    """Summary of the samples recorded for one operation."""
+
+    operation: str
+    count: int
+    min_ns: int
+    max_ns: int
+    mean_ns: float
+    stdev_ns: float
+    p50_ns: float
+    p90_ns: float
+    p95_ns: float
+    p99_ns: float
+
+    @classmethod
+    def from_samples(cls, operation, samples):
+        ordered = sorted(samples)
+        return cls(
+            operation=operation,
+            count=len(ordered),
+            min_ns=ordered[0] if ordered else 0,
+            max_ns=ordered[-1] if ordered else 0,
+            mean_ns=statistics.fmean(ordered) if ordered else 0.0,
+            stdev_ns=statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            p50_ns=percentile(ordered, 0.50),
+            p90_ns=percentile(ordered, 0.90),
+            p95_ns=percentile(ordered, 0.95),
+            p99_ns=percentile(ordered, 0.99),
+        )
+
+    def describe(self):
+        """One-line human-readable summary in milliseconds."""
+        return (
+            f"{self.operation}: n={self.count} "
+            f"p50={self.p50_ns / 1e6:.3f}ms p95={self.p95_ns / 1e6:.3f}ms "
+            f"p99={self.p99_ns / 1e6:.3f}ms max={self.max_ns / 1e6:.3f}ms"
+        )
+
+
+class TimingRecorder:
+    """Collects samples per operation and writes them to timings.jsonl."""
+
+    def __init__(self, script=None, platform="python"):
+        self.script = Path(script or sys.argv[0] or "<interactive>")
+        self.platform = platform
+        self.samples = {}
+        self.tags = {}
+
+    def add(self, operation, elapsed_ns, **tags):
+        """Record one sample for an operation."""
+        self.samples.setdefault(operation, []).append(elapsed_ns)
+        if tags:
+            self.tags.setdefault(operation, {}).update(tags)
+
+    def stats(self, operation):
+        return TimingStats.from_samples(operation, self.samples.get(operation, []))
+
+    def summaries(self):
+        return [self.stats(operation) for operation in self.samples]
+
+    def flush(self, path=None):
+        """Append one JSON line per operation and clear recorded samples."""
+        if not self.samples:
+            return None
+        if path is None:
+            results_dir = results_dir_for(self.script)
+            if results_dir is None:
+                return None
+            path = results_dir / TIMINGS_FILENAME
+
+        item_dir = item_dir_for(self.script)
+        item_id = item_dir.name if item_dir is not None else None
+        recorded_at = datetime.now().isoformat()
+        with open(path, "a") as f:
+            for stats in self.summaries():
+                record = {
+                    "item": item_id,
+                    "platform": self.platform,
+                    "script": self.script.name,
+                    "sdk_version": python_sdk_version(),
+                    "recorded_at": recorded_at,
+                    **asdict(stats),
+                    "tags": self.tags.get(stats.operation, {}),
+                    "samples_ns": self.samples[stats.operation][:MAX_STORED_SAMPLES],
+                }
+                f.write(json.dumps(record) + "\n")
+        self.samples.clear()
+        self.tags.clear()
+        return path
+
+
+_recorder = None
+
+
+def get_recorder():
+    """Return the process-wide recorder, created on first use."""
+    global _recorder
+    if _recorder is None:
+        _recorder = TimingRecorder()
+        atexit.register(flush)
+    return _recorder
+
+
+def flush():
+    """Write any pending samples of the process-wide recorder."""
+    if _recorder is not None:
+        return _recorder.flush()
+    return None
+
+
+# Start times of the timers open in the current thread or task, innermost
+# last; kept outside the instance so one timer can be nested or shared.
+_starts = ContextVar("timer_starts", default=())
+
+
+class timer(ContextDecorator):
+    """
+    Time a block or function call and record it under `operation`.
+
+    One instance may be nested, reused as a decorator on a recursive
+    function, or shared between threads and asyncio tasks: each `__enter__`
+    keeps its own start time. `elapsed_ns` holds the most recent sample.
+    """
+
+    def __init__(self, operation, recorder=None, **tags):
+        self.operation = operation
+        self.recorder = recorder
+        self.tags = tags
+        self.elapsed_ns = None
+
+    def __enter__(self):
+        _starts.set(_starts.get() + (time.perf_counter_ns(),))
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter_ns()
+        starts = _starts.get()
+        _starts.set(starts[:-1])
+        elapsed = end - starts[-1]
+        self.elapsed_ns = elapsed
+        recorder = self.recorder or get_recorder()
+        recorder.add(self.operation, elapsed, **self.tags)
+        return False
+
+
+def measure(operation, fn, *args, warmup=1, repeat=10, recorder=None, **kwargs):
+    """
+    Call fn(*args, **kwargs) `warmup` times untimed, then `repeat` times timed.
+
+    Returns the TimingStats of the timed calls.
+    """
+    recorder = recorder or get_recorder()
+    for _ in range(warmup):
+        fn(*args, **kwargs)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        fn(*args, **kwargs)
+        elapsed = time.perf_counter_ns() - start
+        samples.append(elapsed)
+        recorder.add(operation, elapsed, warmup=warmup, repeat=repeat)
+    return TimingStats.from_samples(operation, samples)
@@ -0,0 +1,372 @@
+"""
+Process-parallel Markdown/HTML ingestion throughput (tiers 14-15, PRF-009).
+
+Tier 14/15 tests translate one small file at a time. This pipeline takes a
+directory of .md/.html inputs, parses them on a process pool and streams
+each resulting UCM document to disk as it is produced:
+
+    inputs/*.md|*.html -> parse -> to_json -> out/<name>.ucm.json
+                                -> render (round trip, timed only)
+
+Workers import the SDK once and write their own output files; only a
+small timing record per file travels back to the parent, and at most
+IN_FLIGHT_PER_WORKER files per worker are queued at a time, so memory
+stays flat however large the input directory is.
+
+Each `--workers` count runs over the whole input set and reports MB/s and
+blocks/s (wall clock), the per-file parse/serialize/render split, and
+render cost relative to parse. Files are rendered back only in their own
+format (render_html for HTML); without that renderer they are parsed but
+not rendered, and Render/parse covers the rendered files only. `--seed`
+fills the input directory first:
+photosynthesis_test.md, copies of it repeated up to 100 KB (PRF-009) and
+1 MB, and harness.corpus documents rendered as Markdown and HTML.
+
+Usage:
+    python -m harness.translate --seed --workers 1,2,4,8
+    python -m harness.translate --inputs path/to/corpus --workers 8 --keep
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from harness import corpus
+from harness.capabilities import PYTHON_MODULES, load
+from harness.checklist import tier_folder_name
+from harness.fingerprint import python_sdk_version
+from harness.paths import PROCESSOR_DIR, REPO_ROOT, RUNS_DIR
+
+WORK_DIR = PROCESSOR_DIR / "translate"
+DEFAULT_INPUTS = WORK_DIR / "inputs"
+SEED_DOCUMENT = REPO_ROOT / "photosynthesis_test.md"
+# Repeated-seed variants, in bytes
+SEED_SIZES = (100_000, 1_000_000)
+SEED_SPECS = (
+    corpus.CorpusSpec(blocks=100, seed=1, title="Corpus 100"),
+    corpus.CorpusSpec(blocks=1000, seed=2, title="Corpus 1K"),
+    corpus.CorpusSpec(blocks=10000, depth=5, seed=3, title="Corpus 10K"),
+)
+FORMATS = {".md": "markdown", ".markdown": "markdown", ".html": "html", ".htm": "html"}
+
+DEFAULT_WORKERS = (1, 2, 4, os.cpu_count() or 1)
+IN_FLIGHT_PER_WORKER = 2
+
+# SDK function names by format, first found wins
+PARSERS = {"markdown": ("parse_markdown", "parse"), "html": ("parse_html",)}
+RENDERERS = {"markdown": ("render_markdown", "render"), "html": ("render_html",)}
+
+TIER_DIR = RUNS_DIR / tier_folder_name("Tier 14: Markdown Translation")
+RESULTS_PATH = TIER_DIR / "translation-throughput.json"
+REPORT_PATH = TIER_DIR / "TRANSLATION-THROUGHPUT.md"
+
+
+# -- inputs -------------------------------------------------------------------
+
+
+def seed_inputs(directory=DEFAULT_INPUTS, sizes=SEED_SIZES, specs=SEED_SPECS):
+    """Fill `directory` with the seed document, its variants and corpus files."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    seed = SEED_DOCUMENT.read_text(encoding="utf-8")
+    (directory / SEED_DOCUMENT.name).write_text(seed, encoding="utf-8")
+    for size in sizes:
+        parts, total, copy = [], 0, 0
+        while total < size:
+            copy += 1
+            # Distinct top-level headings keep the copies separate sections
+            part = seed.replace("# ", f"# Part {copy}: ", 1)
+            parts.append(part)
+            total += len(part.encode())
+        name = f"photosynthesis_{size // 1000}kb.md"
+        (directory / name).write_text("\n\n".join(parts), encoding="utf-8")
+    for spec in specs:
+        for fmt in ("md", "html"):
+            target = directory / f"corpus_{spec.blocks}.{fmt}"
+            shutil.copyfile(corpus.corpus_path(spec, fmt), target)
+    return sorted(discover(directory))
+
+
+def discover(directory):
+    """Return the Markdown and HTML files under directory."""
+    return [
+        path
+        for path in Path(directory).rglob("*")
+        if path.is_file() and path.suffix.lower() in FORMATS
+    ]
+
+
+# -- worker -------------------------------------------------------------------
+
+_functions = {}
+_caps = None
+
+
+def _resolve(names):
+    for module_name in PYTHON_MODULES:
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+        for name in names:
+            function = getattr(module, name, None)
+            if callable(function):
+                return function
+    return None
+
+
+def _init_worker():
+    """Worker initializer: import the SDK and look up its translators once."""
+    global _caps
+    _caps = load()
+    for fmt in PARSERS:
+        _functions[("parse", fmt)] = _resolve(PARSERS[fmt])
+        _functions[("render", fmt)] = _resolve(RENDERERS[fmt])
+
+
+def _block_count(doc, payload):
+    count = _caps.get(doc, "block_count")
+    if callable(count):
+        count = count()
+    if isinstance(count, int):
+        return count
+    return len(json.loads(payload).get("blocks", {}))
+
+
+def translate_file(path, out_dir, render=True):
+    """Parse one file, write its UCM JSON; return a small timing record."""
+    path = Path(path)
+    fmt = FORMATS[path.suffix.lower()]
+    record = {"path": str(path), "format": fmt, "bytes": path.stat().st_size}
+    parse = _functions.get(("parse", fmt))
+    if parse is None:
+        record["error"] = f"no {fmt} parser in {', '.join(PYTHON_MODULES)}"
+        return record
+    text = path.read_text(encoding="utf-8")
+    try:
+        start = time.perf_counter_ns()
+        doc = parse(text)
+        record["parse_ns"] = time.perf_counter_ns() - start
+
+        start = time.perf_counter_ns()
+        payload = doc.to_json()
+        record["serialize_ns"] = time.perf_counter_ns() - start
+        target = Path(out_dir) / f"{path.stem}.ucm.json"
+        start = time.perf_counter_ns()
+        target.write_text(payload, encoding="utf-8")
+        record["write_ns"] = time.perf_counter_ns() - start
+        record["blocks"] = _block_count(doc, payload)
+
+        renderer = _functions.get(("render", fmt))
+        if render and renderer is not None:
+            start = time.perf_counter_ns()
+            renderer(doc)
+            record["render_ns"] = time.perf_counter_ns() - start
+            record["renderer"] = renderer.__name__
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+# -- pipeline -----------------------------------------------------------------
+
+
+def run_pipeline(paths, workers, out_dir, render=True):
+    """
+    Translate every path on `workers` processes; return the timing records.
+
+    Submissions are capped at workers * IN_FLIGHT_PER_WORKER, so neither
+    pending futures nor finished documents accumulate in the parent.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Probe and cache the capability map here, so workers only read it
+    load()
+    records = []
+    pending = set()
+    remaining = iter(paths)
+    limit = workers * IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        while True:
+            for path in remaining:
+                pending.add(pool.submit(translate_file, path, out_dir, render))
+                if len(pending) >= limit:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            records.extend(future.result() for future in done)
+    return records
+
+
+def summarize(records, wall_s, workers):
+    """Throughput and per-stage totals for one worker count."""
+    ok = [record for record in records if "error" not in record]
+    total_bytes = sum(record["bytes"] for record in ok)
+    blocks = sum(record["blocks"] for record in ok)
+    parse_ns = sum(record["parse_ns"] for record in ok)
+    rendered = [record for record in ok if "render_ns" in record]
+    render_ns = sum(record["render_ns"] for record in rendered)
+    render_parse_ns = sum(record["parse_ns"] for record in rendered)
+    return {
+        "workers": workers,
+        "files": len(records),
+        "errors": len(records) - len(ok),
+        "bytes": total_bytes,
+        "blocks": blocks,
+        "wall_s": round(wall_s, 3),
+        "mb_per_s": round(total_bytes / 1e6 / wall_s, 2) if wall_s else None,
+        "blocks_per_s": round(blocks / wall_s) if wall_s else None,
+        "parse_s": round(parse_ns / 1e9, 3),
+        "serialize_s": round(sum(r["serialize_ns"] for r in ok) / 1e9, 3),
+        "write_s": round(sum(r["write_ns"] for r in ok) / 1e9, 3),
+        "render_s": round(render_ns / 1e9, 3),
+        "rendered": len(rendered),
+        # Per-worker parse rate, independent of parallelism
+        "parse_mb_per_s": (
+            round(total_bytes / 1e6 / (parse_ns / 1e9), 2) if parse_ns else None
+        ),
+        "render_vs_parse": (
+            round(render_ns / render_parse_ns, 3) if render_parse_ns else None
+        ),
+    }
+
+
+def run(paths, worker_counts, out_root=WORK_DIR, render=True, keep=False):
+    """Run the pipeline once per worker count and return the report."""
+    paths = sorted(paths, key=lambda path: -path.stat().st_size)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "sdk_version": python_sdk_version(),
+        "files": len(paths),
+        "bytes": sum(path.stat().st_size for path in paths),
+        "runs": [],
+        "errors": [],
+    }
+    for workers in worker_counts:
+        out_dir = Path(out_root) / f"out-{workers}"
+        shutil.rmtree(out_dir, ignore_errors=True)
+        print(f"  {workers:3} worker(s)...", flush=True)
+        start = time.perf_counter()
+        records = run_pipeline(paths, workers, out_dir, render)
+        summary = summarize(records, time.perf_counter() - start, workers)
+        report["runs"].append(summary)
+        if not report["errors"]:
+            report["errors"] = [
+                {"path": record["path"], "error": record["error"]}
+                for record in records
+                if "error" in record
+            ]
+        if not keep:
+            shutil.rmtree(out_dir, ignore_errors=True)
+    return report
+
+
+def format_report(report):
+    """Render the report as Markdown."""
+    lines = [
+        "# Translation Throughput",
+        "",
+        f"**Generated**: {report['generated_at']}",
+        f"**Python SDK**: {report['sdk_version'] or 'unknown'}",
+        f"**Inputs**: {report['files']} files, {report['bytes'] / 1e6:.2f} MB",
+        "",
+        "| Workers | MB/s | Blocks/s | Wall s | Parse MB/s per worker "
+        "| Parse s | Serialize s | Write s | Rendered | Render s | Render/parse "
+        "| Errors |",
+        "|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for summary in report["runs"]:
+        lines.append(
+            "| "
+            + " | ".join(
+                "-" if summary[key] is None else str(summary[key])
+                for key in (
+                    "workers",
+                    "mb_per_s",
+                    "blocks_per_s",
+                    "wall_s",
+                    "parse_mb_per_s",
+                    "parse_s",
+                    "serialize_s",
+                    "write_s",
+                    "rendered",
+                    "render_s",
+                    "render_vs_parse",
+                    "errors",
+                )
+            )
+            + " |"
+        )
+    if len(report["runs"]) > 1 and report["runs"][0]["mb_per_s"]:
+        base = report["runs"][0]
+        best = max(report["runs"], key=lambda summary: summary["mb_per_s"] or 0)
+        lines += [
+            "",
+            f"Best: {best['mb_per_s']} MB/s with {best['workers']} workers, "
+            f"{best['mb_per_s'] / base['mb_per_s']:.1f}x {base['workers']} "
+            "worker(s).",
+        ]
+    if report["errors"]:
+        lines += ["", "## Errors", ""]
+        lines += [f"- `{e['path']}`: {e['error']}" for e in report["errors"][:20]]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Parallel Markdown/HTML to UCM ingestion throughput"
+    )
+    parser.add_argument(
+        "--inputs",
+        type=Path,
+        default=DEFAULT_INPUTS,
+        help=f"Directory of .md/.html files (default: {DEFAULT_INPUTS})",
+    )
+    parser.add_argument(
+        "--seed",
+        action="store_true",
+        help="Write the seed document, its variants and corpus files to --inputs",
+    )
+    parser.add_argument(
+        "--workers",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=sorted(set(DEFAULT_WORKERS)),
+        help="Comma-separated worker counts (default: 1,2,4,<cpus>)",
+    )
+    parser.add_argument(
+        "--no-render", action="store_true", help="Skip the round-trip render"
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help=f"Keep the UCM JSON outputs under {WORK_DIR}/out-<workers>",
+    )
+    args = parser.parse_args(argv)
+
+    paths = seed_inputs(args.inputs) if args.seed else discover(args.inputs)
+    if not paths:
+        parser.error(f"no .md/.html files in {args.inputs} (use --seed)")
+
+    report = run(paths, args.workers, render=not args.no_render, keep=args.keep)
+    TIER_DIR.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(report, indent=2))
+    REPORT_PATH.write_text(format_report(report))
+    for summary in report["runs"]:
+        print(
+            f"{summary['workers']:3} worker(s): {summary['mb_per_s']} MB/s, "
+            f"{summary['blocks_per_s']} blocks/s, {summary['errors']} error(s)"
+        )
+    print(f"Report: {REPORT_PATH}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,569 @@
+"""
+Concurrent AgentTraversal load harness (tiers 10-12 at scale).
+
+AGT-002 and PRF-007 exercise one or two sessions. This drives many
+sessions against one shared document in one process, at increasing
+session counts (1, 10, 100, 1000 by default), to find where serving many
+agents from one process stops scaling.
+
+At each level all sessions are opened on one AgentTraversal and stay open
+while every session runs `--ops` operations drawn from a weighted mix:
+
+    navigate  navigate_to a random block
+    expand    expand down/up/both from a random block, depth 2
+    find      find by BENCH_TAG or by the heading2 role
+    path      find_path between two random blocks
+    context   context_add a random block (the oldest is removed once a
+              session holds CONTEXT_LIMIT blocks)
+
+AgentTraversal's default GlobalLimits cap sessions and operations per
+second, so each level raises them to fit its session count when the
+binding exposes GlobalLimits; otherwise the defaults stay in force.
+Levels are keyed on the sessions that actually opened, and a level that
+hit a limit (fewer sessions opened than requested, or rate-limit errors)
+is marked capped and left out of the knee search.
+
+Two drivers:
+
+- threads: `--workers` threads, each owning a slice of the sessions and
+  stepping through them round-robin, so every session is active at once
+- asyncio: one task per session; each call runs on a `--workers` thread
+  executor, so latency includes the wait for a free worker, as an async
+  server would see it
+
+Per level and driver it reports throughput, per-operation latency
+(log-linear histograms: p50/p99/p99.9/max), errors, and resident memory
+per open session. The knee is the first level where throughput falls
+below the previous level's or overall p99 exceeds P99_FACTOR times the
+single-session p99. A binding that holds the GIL during calls shows up as
+flat throughput from the first level onwards.
+
+Usage:
+    python -m harness.traversal_load
+    python -m harness.traversal_load --levels 1,10,100,1000 --blocks 10000 \\
+        --drivers threads,asyncio --workers 16
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from harness.benchmarks.python_driver import _rss_bytes
+from harness.benchmarks.suite import BENCH_TAG, block_kind
+from harness.checklist import tier_folder_name
+from harness.fingerprint import python_sdk_version
+from harness.histogram import LatencyHistogram
+from harness.paths import RUNS_DIR
+
+OPERATIONS = ("navigate", "expand", "find", "path", "context")
+DEFAULT_MIX = {"navigate": 35, "expand": 25, "find": 15, "path": 10, "context": 15}
+DEFAULT_LEVELS = (1, 10, 100, 1000)
+DEFAULT_BLOCKS = 1000
+DEFAULT_OPS = 50
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+DRIVERS = ("threads", "asyncio")
+
+EXPAND_DEPTH = 2
+PATH_MAX_LENGTH = 10
+CONTEXT_LIMIT = 20
+
+# Global limits per level, scaled with the session count
+OPS_PER_SECOND_LIMIT = 1e9
+CONTEXT_BLOCKS_PER_SESSION = 2 * CONTEXT_LIMIT
+
+# The knee: p99 this many times the single-session p99
+P99_FACTOR = 10
+
+TIER_DIR = RUNS_DIR / tier_folder_name(
+    "Tier 10: Agent Traversal - Session Management"
+)
+RESULTS_PATH = TIER_DIR / "traversal-load.json"
+REPORT_PATH = TIER_DIR / "TRAVERSAL-LOAD-REPORT.md"
+
+
+def parse_mix(text):
+    """Parse "navigate=40,find=20" into {operation: weight}."""
+    mix = {}
+    for part in text.split(","):
+        if not part:
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}; use {OPERATIONS}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Operation mix needs at least one positive weight")
+    return mix
+
+
+def build_fixture(ucp, blocks):
+    """Return (doc, all block ids) shaped like the benchmark document."""
+    doc = ucp.Document.create()
+    root = doc.root_id
+    section = root
+    block_ids = []
+    for index in range(blocks):
+        kind = block_kind(index)
+        if kind == "section":
+            section = doc.add_block_with_content(
+                root, ucp.Content.text(f"Section {index}"), role="heading2"
+            )
+            block_ids.append(section)
+        elif kind == "code":
+            block_id = doc.add_block_with_content(
+                section, ucp.Content.code("python", f"value_{index} = {index}")
+            )
+            doc.add_tag(block_id, BENCH_TAG)
+            block_ids.append(block_id)
+        else:
+            block_ids.append(
+                doc.add_block_with_content(
+                    section, ucp.Content.text(f"Paragraph {index}"), role="paragraph"
+                )
+            )
+    return doc, block_ids
+
+
+def plan_session(block_ids, ops, mix, seed):
+    """Return a session's operation list: (operation, rng-chosen arguments)."""
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    plan = []
+    for _ in range(ops):
+        name = rng.choices(names, weights)[0]
+        if name == "expand":
+            args = (rng.choice(block_ids), rng.choice(("down", "up", "both")))
+        elif name == "find":
+            args = (rng.random() < 0.5,)
+        elif name == "path":
+            args = tuple(rng.sample(block_ids, 2))
+        elif name == "context":
+            args = (rng.choice(block_ids), round(rng.uniform(0.1, 1.0), 2))
+        else:
+            args = (rng.choice(block_ids),)
+        plan.append((name, args))
+    return plan
+
+
+class _Session:
+    """One open traversal session plus the blocks in its context."""
+
+    def __init__(self, session_id, plan):
+        self.id = session_id
+        self.plan = plan
+        self.context = []
+
+
+def call(traversal, session, name, args):
+    """Execute one planned operation against the shared traversal."""
+    if name == "navigate":
+        traversal.navigate_to(session.id, args[0])
+    elif name == "expand":
+        traversal.expand(session.id, args[0], direction=args[1], depth=EXPAND_DEPTH)
+    elif name == "find":
+        if args[0]:
+            traversal.find(session.id, tag=BENCH_TAG)
+        else:
+            traversal.find(session.id, role="heading2")
+    elif name == "path":
+        traversal.find_path(session.id, args[0], args[1], max_length=PATH_MAX_LENGTH)
+    elif name == "context":
+        block_id, relevance = args
+        traversal.context_add(session.id, block_id, relevance=relevance)
+        session.context.append(block_id)
+        if len(session.context) > CONTEXT_LIMIT:
+            traversal.context_remove(session.id, session.context.pop(0))
+
+
+class _Recorder:
+    """Thread-safe per-operation histograms and error counts."""
+
+    def __init__(self):
+        self.histograms = {name: LatencyHistogram() for name in OPERATIONS}
+        self.errors = {}
+        self.first_error = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, elapsed_ns, error=None):
+        with self._lock:
+            if error is None:
+                self.histograms[name].record(elapsed_ns)
+            else:
+                self.errors[name] = self.errors.get(name, 0) + 1
+                self.first_error.setdefault(name, f"{type(error).__name__}: {error}")
+
+
+def _timed(traversal, session, name, args, recorder, start=None):
+    start = start or time.perf_counter_ns()
+    try:
+        call(traversal, session, name, args)
+    except Exception as e:
+        recorder.record(name, 0, e)
+    else:
+        recorder.record(name, time.perf_counter_ns() - start)
+
+
+def drive_threads(traversal, sessions, workers, recorder):
+    """Round-robin every session's plan across `workers` threads."""
+    slices = [sessions[i::workers] for i in range(min(workers, len(sessions)))]
+
+    def worker(owned):
+        for step in range(max(len(s.plan) for s in owned)):
+            for session in owned:
+                if step < len(session.plan):
+                    name, args = session.plan[step]
+                    _timed(traversal, session, name, args, recorder)
+
+    threads = [threading.Thread(target=worker, args=(owned,)) for owned in slices]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def drive_asyncio(traversal, sessions, workers, recorder):
+    """One task per session; calls run on a `workers` thread executor."""
+
+    async def session_task(loop, executor, session):
+        for name, args in session.plan:
+            # Latency starts before the executor queue, as a caller sees it
+            start = time.perf_counter_ns()
+            await loop.run_in_executor(
+                executor, _timed, traversal, session, name, args, recorder, start
+            )
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            await asyncio.gather(
+                *(session_task(loop, executor, session) for session in sessions)
+            )
+
+    asyncio.run(main())
+
+
+DRIVER_FUNCTIONS = {"threads": drive_threads, "asyncio": drive_asyncio}
+
+
+def make_traversal(ucp, doc, sessions):
+    """
+    Return (traversal, limits_raised) for a level of `sessions` sessions.
+
+    The limits are raised through GlobalLimits / with_global_limits when
+    the binding has them; the Python binding may not, in which case the
+    defaults apply and capped levels are reported as such.
+    """
+    traversal = ucp.AgentTraversal(doc)
+    limits_class = getattr(ucp, "GlobalLimits", None)
+    configure = getattr(traversal, "with_global_limits", None)
+    if limits_class is None or configure is None:
+        return traversal, False
+    try:
+        limits = limits_class(
+            max_sessions=sessions,
+            max_total_context_blocks=sessions * CONTEXT_BLOCKS_PER_SESSION,
+            max_ops_per_second=OPS_PER_SECOND_LIMIT,
+        )
+        # Builder style (returns the traversal) or in place (returns None)
+        return configure(limits) or traversal, True
+    except Exception:
+        return traversal, False
+
+
+def _rate_limited(message):
+    lowered = message.lower()
+    return "rate" in lowered or "per second" in lowered
+
+
+def run_level(ucp, doc, block_ids, count, driver, ops, mix, workers, seed):
+    """Open `count` sessions, run their plans with `driver`, close them."""
+    traversal, limits_raised = make_traversal(ucp, doc, count)
+    gc.collect()
+    rss_before = _rss_bytes()
+
+    create = LatencyHistogram()
+    sessions, create_error = [], None
+    for index in range(count):
+        start = time.perf_counter_ns()
+        try:
+            session_id = traversal.create_session()
+        except Exception as e:
+            # e.g. MaxSessionsReached: run with the sessions that did open
+            create_error = f"{type(e).__name__}: {e}"
+            break
+        create.record(time.perf_counter_ns() - start)
+        plan = plan_session(block_ids, ops, mix, seed * 1_000_003 + index)
+        sessions.append(_Session(session_id, plan))
+    rss_open = _rss_bytes()
+
+    recorder = _Recorder()
+    start = time.perf_counter()
+    if sessions:
+        DRIVER_FUNCTIONS[driver](traversal, sessions, workers, recorder)
+    elapsed = time.perf_counter() - start
+    rss_after = _rss_bytes()
+
+    for session in sessions:
+        try:
+            traversal.close_session(session.id)
+        except Exception:
+            pass
+
+    overall = LatencyHistogram()
+    for histogram in recorder.histograms.values():
+        overall.merge(histogram)
+    errors = sum(recorder.errors.values())
+    completed = overall.count
+    opened = len(sessions)
+    capped = []
+    if opened < count:
+        capped.append(f"{opened}/{count} sessions opened")
+    if any(_rate_limited(error) for error in recorder.first_error.values()):
+        capped.append("operations rate-limited")
+    return {
+        # Results describe the sessions that opened, not the requested count
+        "sessions": opened,
+        "requested": count,
+        "limits_raised": limits_raised,
+        "capped": "; ".join(capped) or None,
+        "create_error": create_error,
+        "ops": completed + errors,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "ops_per_s": round(completed / elapsed, 1) if elapsed else None,
+        "overall": overall.summary(),
+        "create_session": create.summary(),
+        "by_operation": {
+            name: histogram.summary()
+            for name, histogram in recorder.histograms.items()
+            if histogram.count
+        },
+        "errors_by_operation": recorder.errors,
+        "first_errors": recorder.first_error,
+        "rss_per_session_open_bytes": (
+            round((rss_open - rss_before) / opened) if opened else None
+        ),
+        "rss_per_session_after_bytes": (
+            round((rss_after - rss_before) / opened) if opened else None
+        ),
+    }
+
+
+def find_knee(levels):
+    """
+    Return (session count, reason) where scaling stops, or (None, None).
+
+    Capped levels measure the limiter rather than the binding and are
+    skipped.
+    """
+    levels = [level for level in levels if not level["capped"] and level["sessions"]]
+    if not levels:
+        return None, None
+    base_p99 = levels[0]["overall"]["p99_ns"]
+    for previous, level in zip(levels, levels[1:]):
+        if level["ops_per_s"] is not None and previous["ops_per_s"]:
+            if level["ops_per_s"] < previous["ops_per_s"]:
+                return level["sessions"], (
+                    f"throughput fell from {previous['ops_per_s']:.0f} to "
+                    f"{level['ops_per_s']:.0f} ops/s"
+                )
+        p99 = level["overall"]["p99_ns"]
+        if base_p99 and p99 > base_p99 * P99_FACTOR:
+            return level["sessions"], (
+                f"p99 {p99 / 1e6:.2f}ms > {P99_FACTOR}x single-session "
+                f"{base_p99 / 1e6:.2f}ms"
+            )
+    return None, None
+
+
+def run(ucp, levels, drivers, blocks, ops, mix, workers, seed=0):
+    """Run every (driver, level) combination and return the report."""
+    doc, block_ids = build_fixture(ucp, blocks)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "sdk_version": python_sdk_version(),
+        "blocks": blocks,
+        "ops_per_session": ops,
+        "mix": mix,
+        "workers": workers,
+        "seed": seed,
+        "drivers": {},
+    }
+    for driver in drivers:
+        results = []
+        for count in levels:
+            print(f"  {driver:8} {count:6} sessions...", flush=True)
+            results.append(
+                run_level(ucp, doc, block_ids, count, driver, ops, mix, workers, seed)
+            )
+        knee, reason = find_knee(results)
+        report["drivers"][driver] = {
+            "levels": results,
+            "knee_sessions": knee,
+            "knee_reason": reason,
+        }
+    return report
+
+
+def _ms(ns):
+    return f"{ns / 1e6:.2f}"
+
+
+def format_report(report):
+    """Render the report as Markdown."""
+    lines = [
+        "# Agent Traversal Load Report",
+        "",
+        f"**Generated**: {report['generated_at']}",
+        f"**Python SDK**: {report['sdk_version'] or 'unknown'}",
+        f"**Document**: {report['blocks']} blocks, shared by every session",
+        f"**Per session**: {report['ops_per_session']} operations, mix "
+        + ", ".join(f"{k}={v:g}" for k, v in report["mix"].items()),
+        f"**Workers**: {report['workers']}",
+    ]
+    for driver, data in report["drivers"].items():
+        lines += [
+            "",
+            f"## {driver}",
+            "",
+            "| Sessions | Requested | Ops/s | p50 ms | p99 ms | p99.9 ms | Max ms "
+            "| Errors | RSS/session KB | Capped |",
+            "|---:|---:|---:|---:|---:|---:|---:|---:|---:|---|",
+        ]
+        for level in data["levels"]:
+            overall = level["overall"]
+            rss = level["rss_per_session_after_bytes"]
+            lines.append(
+                f"| {level['sessions']} | {level['requested']} "
+                f"| {level['ops_per_s'] or '-'} | {_ms(overall['p50_ns'])} "
+                f"| {_ms(overall['p99_ns'])} | {_ms(overall['p999_ns'])} "
+                f"| {_ms(overall['max_ns'])} | {level['errors']} "
+                f"| {'-' if rss is None else f'{rss / 1024:.1f}'} "
+                f"| {level['capped'] or '-'} |"
+            )
+        if not all(level["limits_raised"] for level in data["levels"]):
+            lines += [
+                "",
+                "GlobalLimits could not be raised through this binding; the "
+                "default session and rate caps were in force.",
+            ]
+        if data["knee_sessions"] is not None:
+            lines += [
+                "",
+                f"Stops scaling at **{data['knee_sessions']} sessions**: "
+                f"{data['knee_reason']}.",
+            ]
+        else:
+            lines += ["", "Scaled across every uncapped level tested."]
+
+        last = data["levels"][-1]
+        lines += [
+            "",
+            f"Per operation at {last['sessions']} sessions:",
+            "",
+            "| Operation | Count | p50 ms | p99 ms | Max ms | Errors |",
+            "|---|---:|---:|---:|---:|---:|",
+        ]
+        for name in OPERATIONS:
+            summary = last["by_operation"].get(name)
+            errors = last["errors_by_operation"].get(name, 0)
+            if summary is None and not errors:
+                continue
+            summary = summary or {"count": 0, "p50_ns": 0, "p99_ns": 0, "max_ns": 0}
+            lines.append(
+                f"| {name} | {summary['count']} | {_ms(summary['p50_ns'])} "
+                f"| {_ms(summary['p99_ns'])} | {_ms(summary['max_ns'])} | {errors} |"
+            )
+        notes = []
+        for level in data["levels"]:
+            if level["create_error"]:
+                notes.append(
+                    f"- {level['requested']} sessions requested: only "
+                    f"{level['sessions']} opened ({level['create_error']})"
+                )
+            for name, error in level["first_errors"].items():
+                notes.append(f"- {level['sessions']} sessions, {name}: {error}")
+        if notes:
+            lines += ["", "Errors (first per operation and level):", "", *notes]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Concurrent AgentTraversal sessions against one document"
+    )
+    parser.add_argument(
+        "--levels",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=list(DEFAULT_LEVELS),
+        help="Comma-separated session counts (default: 1,10,100,1000)",
+    )
+    parser.add_argument(
+        "--drivers",
+        type=lambda v: [d for d in v.split(",") if d],
+        default=list(DRIVERS),
+        help=f"Comma-separated subset of {', '.join(DRIVERS)}",
+    )
+    parser.add_argument("--blocks", type=int, default=DEFAULT_BLOCKS)
+    parser.add_argument(
+        "--ops", type=int, default=DEFAULT_OPS, help="Operations per session"
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Operation weights, e.g. navigate=35,expand=25,find=15,path=10,"
+        "context=15",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Threads issuing calls (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    unknown = [d for d in args.drivers if d not in DRIVERS]
+    if unknown:
+        parser.error(f"unknown driver(s): {', '.join(unknown)}")
+
+    import ucp
+
+    report = run(
+        ucp,
+        sorted(args.levels),
+        args.drivers,
+        args.blocks,
+        args.ops,
+        args.mix,
+        args.workers,
+        args.seed,
+    )
+    TIER_DIR.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(report, indent=2))
+    REPORT_PATH.write_text(format_report(report))
+    for driver, data in report["drivers"].items():
+        if data["knee_sessions"] is None:
+            print(f"{driver}: scaled across every uncapped level")
+        else:
+            print(
+                f"{driver}: stops scaling at {data['knee_sessions']} sessions "
+                f"({data['knee_reason']})"
+            )
+    print(f"Report: {REPORT_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Bulk UCL execution harness (UCL-040 chaining, PRF-006 at scale).
+
+Generates a deterministic stream of EDIT / APPEND / MOVE / DELETE / LINK
+commands against a fixture document and applies the same stream four ways:
+
+- individual: one `execute_ucl` call per command; latency per command is
+  recorded in a histogram per command type
+- batch:      the whole script in one `execute_ucl` call
+- atomic:     the whole script wrapped in `ATOMIC { ... }`
+- parse:      `ucp ucl parse --file` on the script, minus the cost of
+              spawning `ucp` (only when the CLI is installed), which
+              estimates how much of the batch time is parsing
+
+Every mode starts from a freshly built fixture and a script generated
+with the same seed, so the command mix and targets are identical.
+
+Usage:
+    python -m harness.ucl_batch --commands 10000
+    python -m harness.ucl_batch --commands 10000 --mix edit=50,append=50 \\
+        --results-dir runs/tier_8_ucl_advanced/UCL-040/results
+"""
+
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness.histogram import LatencyHistogram
+
+COMMAND_TYPES = ("edit", "append", "move", "delete", "link")
+DEFAULT_MIX = {"edit": 40, "append": 30, "move": 10, "delete": 10, "link": 10}
+DEFAULT_COMMANDS = 1000
+DEFAULT_POOL = 2000
+DEFAULT_SECTIONS = 20
+MODES = ("individual", "batch", "atomic", "parse")
+
+
+def parse_mix(text):
+    """Parse "edit=40,append=30" into {type: weight}."""
+    mix = {}
+    for part in text.split(","):
+        if not part:
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in COMMAND_TYPES:
+            raise ValueError(f"Unknown command type {name!r}; use {COMMAND_TYPES}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Command mix needs at least one positive weight")
+    return mix
+
+
+def build_fixture(ucp, sections=DEFAULT_SECTIONS, pool=DEFAULT_POOL):
+    """Return (doc, section ids, pool block ids) for a fresh fixture."""
+    doc = ucp.Document.create()
+    section_ids = [
+        str(doc.add_block(doc.root_id, f"Section {i}", role="heading2"))
+        for i in range(sections)
+    ]
+    pool_ids = [
+        str(doc.add_block(section_ids[i % sections], f"Block {i}", role="paragraph"))
+        for i in range(pool)
+    ]
+    return doc, section_ids, pool_ids
+
+
+def generate_script(section_ids, pool_ids, count, mix, seed=0):
+    """
+    Return [(type, command)] for `count` commands.
+
+    Commands only target fixture blocks that are still alive (DELETE
+    removes its target from the pool), so every command is valid when
+    the stream is applied in order. When the pool runs dry, commands that
+    need a target fall back to APPEND.
+    """
+    rng = random.Random(seed)
+    alive = list(pool_ids)
+    types = list(mix)
+    weights = [mix[t] for t in types]
+    script = []
+    for index in range(count):
+        kind = rng.choices(types, weights)[0]
+        needs = {"edit": 1, "move": 1, "delete": 1, "link": 2}.get(kind, 0)
+        if len(alive) < needs:
+            kind = "append"
+        if kind == "append":
+            command = f'APPEND {rng.choice(section_ids)} text :: "Batch block {index}"'
+        elif kind == "edit":
+            command = f'EDIT {rng.choice(alive)} SET content.text = "Edit {index}"'
+        elif kind == "move":
+            command = f"MOVE {rng.choice(alive)} TO {rng.choice(section_ids)}"
+        elif kind == "link":
+            source, target = rng.sample(alive, 2)
+            command = f"LINK {source} references {target}"
+        else:
+            target = alive.pop(rng.randrange(len(alive)))
+            command = f"DELETE {target}"
+        script.append((kind, command))
+    return script
+
+
+def run_individual(ucp, doc, script):
+    """Execute commands one call at a time; return (histograms, errors)."""
+    histograms = {kind: LatencyHistogram() for kind in COMMAND_TYPES}
+    errors = 0
+    for kind, command in script:
+        start = time.perf_counter_ns()
+        try:
+            ucp.execute_ucl(doc, command)
+        except Exception:
+            errors += 1
+            continue
+        histograms[kind].record(time.perf_counter_ns() - start)
+    return {k: h for k, h in histograms.items() if h.count}, errors
+
+
+def run_batch(ucp, doc, script, atomic=False):
+    """Execute the whole script in one call; return (elapsed_ns, error)."""
+    body = "\n".join(command for _, command in script)
+    if atomic:
+        body = "ATOMIC {\n" + body + "\n}"
+    start = time.perf_counter_ns()
+    try:
+        ucp.execute_ucl(doc, body)
+    except Exception as e:
+        return time.perf_counter_ns() - start, f"{type(e).__name__}: {e}"
+    return time.perf_counter_ns() - start, None
+
+
+def _timed_cli(args):
+    start = time.perf_counter_ns()
+    proc = subprocess.run(["ucp", *args], capture_output=True, text=True)
+    return time.perf_counter_ns() - start, proc
+
+
+def run_cli_parse(script, repeat=3):
+    """
+    Estimate parse-only time with `ucp ucl parse`, or None without the CLI.
+
+    The median `ucp --version` time is subtracted to remove process spawn.
+    """
+    if shutil.which("ucp") is None:
+        return None
+    with tempfile.NamedTemporaryFile("w", suffix=".ucl", delete=False) as f:
+        f.write("\n".join(command for _, command in script) + "\n")
+        path = f.name
+    try:
+        spawn = sorted(_timed_cli(["--version"])[0] for _ in range(repeat))
+        parses = []
+        for _ in range(repeat):
+            elapsed, proc = _timed_cli(["ucl", "parse", "--file", path])
+            if proc.returncode != 0:
+                return {"error": proc.stderr.strip()[-300:]}
+            parses.append(elapsed)
+    finally:
+        Path(path).unlink(missing_ok=True)
+    parse_ns = sorted(parses)[repeat // 2] - spawn[repeat // 2]
+    return {"elapsed_ns": max(parse_ns, 0), "spawn_ns": spawn[repeat // 2]}
+
+
+def run(ucp, commands, mix, seed=0, pool=DEFAULT_POOL, modes=MODES):
+    """Run every requested mode and return the JSON-ready report."""
+    report = {
+        "commands": commands,
+        "mix": mix,
+        "seed": seed,
+        "pool": pool,
+        "modes": {},
+    }
+
+    def fresh_script():
+        doc, sections, pool_ids = build_fixture(ucp, pool=pool)
+        return doc, generate_script(sections, pool_ids, commands, mix, seed)
+
+    if "individual" in modes:
+        doc, script = fresh_script()
+        histograms, errors = run_individual(ucp, doc, script)
+        combined = LatencyHistogram()
+        for histogram in histograms.values():
+            combined.merge(histogram)
+        report["command_counts"] = {
+            kind: sum(1 for k, _ in script if k == kind) for kind in COMMAND_TYPES
+        }
+        report["modes"]["individual"] = {
+            "elapsed_ns": combined.total,
+            "errors": errors,
+            "overall": combined.summary(),
+            "by_type": {kind: h.summary() for kind, h in histograms.items()},
+            "histograms": {kind: h.to_dict() for kind, h in histograms.items()},
+        }
+    for mode in ("batch", "atomic"):
+        if mode in modes:
+            doc, script = fresh_script()
+            elapsed, error = run_batch(ucp, doc, script, atomic=mode == "atomic")
+            report["modes"][mode] = {
+                "elapsed_ns": elapsed,
+                "per_command_ns": round(elapsed / max(commands, 1), 1),
+                "error": error,
+            }
+    if "parse" in modes:
+        _, script = fresh_script()
+        report["modes"]["parse"] = run_cli_parse(script)
+
+    batch = report["modes"].get("batch") or {}
+    parse = report["modes"].get("parse") or {}
+    if batch.get("elapsed_ns") and parse.get("elapsed_ns") is not None:
+        report["parse_share_of_batch"] = round(
+            parse["elapsed_ns"] / batch["elapsed_ns"], 3
+        )
+    return report
+
+
+def format_report(report):
+    """Render a report as a short text summary."""
+    lines = [
+        f"{report['commands']} commands, mix "
+        + ", ".join(f"{k}={v:g}" for k, v in report["mix"].items())
+    ]
+    individual = report["modes"].get("individual")
+    if individual:
+        lines.append(
+            f"individual: {individual['elapsed_ns'] / 1e6:.1f}ms total, "
+            f"{individual['errors']} errors"
+        )
+        for kind, summary in individual["by_type"].items():
+            lines.append(
+                f"  {kind:7} n={summary['count']:6} "
+                f"p50={summary['p50_ns'] / 1e3:.1f}us "
+                f"p99={summary['p99_ns'] / 1e3:.1f}us "
+                f"max={summary['max_ns'] / 1e3:.1f}us"
+            )
+    for mode in ("batch", "atomic"):
+        result = report["modes"].get(mode)
+        if result:
+            status = f" ({result['error']})" if result["error"] else ""
+            lines.append(
+                f"{mode}: {result['elapsed_ns'] / 1e6:.1f}ms total, "
+                f"{result['per_command_ns'] / 1e3:.1f}us/command{status}"
+            )
+    if "parse" in report["modes"]:
+        parse = report["modes"]["parse"]
+        if parse is None:
+            lines.append("parse: skipped (ucp CLI not installed)")
+        elif "error" in parse:
+            lines.append(f"parse: failed ({parse['error']})")
+        else:
+            lines.append(f"parse: {parse['elapsed_ns'] / 1e6:.1f}ms (spawn removed)")
+    if "parse_share_of_batch" in report:
+        share = report["parse_share_of_batch"]
+        verdict = "parsing" if share >= 0.5 else "applying changes"
+        lines.append(f"parse share of batch: {share:.0%} -> {verdict} dominates")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Bulk UCL execution harness")
+    parser.add_argument("--commands", type=int, default=DEFAULT_COMMANDS)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="Command weights, e.g. edit=40,append=30,move=10,delete=10,link=10",
+    )
+    parser.add_argument("--pool", type=int, default=DEFAULT_POOL)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--modes",
+        default=",".join(MODES),
+        help=f"Comma-separated subset of {', '.join(MODES)}",
+    )
+    parser.add_argument(
+        "--results-dir", help="Write ucl_batch_results.json to this directory"
+    )
+    args = parser.parse_args(argv)
+
+    import ucp
+
+    modes = [mode for mode in args.modes.split(",") if mode]
+    report = run(ucp, args.commands, args.mix, args.seed, args.pool, modes)
+    print(format_report(report))
+    if args.results_dir:
+        results_dir = Path(args.results_dir)
+        results_dir.mkdir(parents=True, exist_ok=True)
+        path = results_dir / "ucl_batch_results.json"
+        path.write_text(json.dumps(report, indent=2))
+        print(f"Results: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1072 @@
+"""
+Grammar-based UCL fuzzer (Tier 9 at scale).
+
+SYN-001..SYN-012 check a dozen hand-written inputs. This generates UCL
+from the grammar in ucp-docs/ucl-parser/syntax.md and commands.md (every
+command, WHERE conditions, paths, literals, ATOMIC nesting) and feeds it
+to two targets on a pool of worker processes:
+
+    python  execute_ucl(doc, text) on a small benchmark-shaped document
+    cli     `ucp ucl parse --commands <text>` (a sample; subprocesses are slow)
+
+A `--valid` fraction of inputs is left as generated; the rest get one
+mutation (dropped/duplicated spans, swapped tokens, stray punctuation,
+truncation, flipped keyword case, malformed block IDs). Errors raised by
+the SDK are the expected "rejected" outcome. Findings are:
+
+    panic   a Rust panic surfaced as a BaseException, or CLI exit 101
+    crash   the worker process or CLI died from a signal
+    hang    no result within --hang-timeout (the worker is killed)
+
+Hangs are detected from the parent, since a call that holds the GIL
+cannot be interrupted in-process. Each new finding is minimized (ddmin
+over characters, re-run in a fresh worker) and saved under FIXTURES_DIR;
+`--replay` re-runs the saved fixtures and fails while any still
+reproduce.
+
+Separately, SCALING templates (long string literals, escapes, Unicode,
+arrays, nested WHERE parentheses, ATOMIC bodies, unterminated strings,
+comments) are timed at --lengths bytes, 10 KB+ per SYN-007. A template
+whose log-log slope of time against length exceeds SUPERLINEAR_SLOPE is
+reported and saved as a fixture that records its generator.
+
+Usage:
+    python -m harness.ucl_fuzz
+    python -m harness.ucl_fuzz --commands 100000 --workers 16 --cli 500
+    python -m harness.ucl_fuzz --replay
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+from harness.capabilities import sdk
+from harness.checklist import tier_folder_name
+from harness.fingerprint import python_sdk_version
+from harness.histogram import LatencyHistogram
+from harness.paths import RUNS_DIR
+from harness.traversal_load import build_fixture
+
+TARGETS = ("python", "cli")
+FINDINGS = ("panic", "crash", "hang")
+COVERAGE_FIELDS = (
+    "generated",
+    "accepted",
+    "rejected",
+    "findings",
+    # Unmutated input the SDK refused, or mutated input it took
+    "valid_rejected",
+    "mutated_accepted",
+)
+
+DEFAULT_COMMANDS = 20000
+DEFAULT_CLI = 200
+DEFAULT_WORKERS = os.cpu_count() or 1
+DEFAULT_VALID = 0.7
+DEFAULT_HANG_TIMEOUT_S = 5.0
+DEFAULT_LENGTHS = (1_000, 4_000, 16_000, 64_000, 256_000)
+FIXTURE_BLOCKS = 200
+# The document is rebuilt after this many commands so edits do not pile up
+RESET_EVERY = 100
+# Linux caps a single argv string at 128 KiB
+CLI_MAX_BYTES = 100_000
+# Rust's exit status for a panic in main
+RUST_PANIC_EXIT = 101
+
+SCALE_REPEATS = 3
+SUPERLINEAR_SLOPE = 1.5
+# Below this the slope is timer noise
+SUPERLINEAR_MIN_NS = 1_000_000
+MINIMIZE_TESTS = 300
+MAX_MINIMIZED = 10
+
+COMMAND_KINDS = (
+    "EDIT",
+    "MOVE",
+    "APPEND",
+    "DELETE",
+    "PRUNE",
+    "FOLD",
+    "LINK",
+    "UNLINK",
+    "SNAPSHOT",
+    "TRANSACTION",
+    "ATOMIC",
+)
+CONTENT_TYPES = (
+    "text",
+    "table",
+    "code",
+    "math",
+    "media",
+    "json",
+    "binary",
+    "composite",
+)
+EDGE_TYPES = ("references", "supports", "implements", "contradicts", "elaborates")
+PATHS = (
+    "content.text",
+    "metadata.label",
+    "metadata.tags",
+    "metadata.priority",
+    "metadata.summary",
+    "label",
+    "status",
+    "priority",
+)
+ASSIGN_OPS = ("=", "+=", "-=", "++", "--")
+COMPARE_OPS = ("=", "!=", ">", ">=", "<", "<=")
+STRING_OPS = ("CONTAINS", "STARTS_WITH", "ENDS_WITH", "MATCHES")
+EXIST_OPS = ("EXISTS", "IS_NULL", "IS_NOT_NULL", "IS_EMPTY")
+WORDS = ("alpha", "chapter", "draft", "important", "summary", "photosynthesis")
+STRANGE_TEXT = (
+    'Quote: \\"quoted\\"',
+    "Line 1\\nLine 2",
+    "Tab:\\tvalue",
+    "naïve café ✓ 日本語 🙂",
+    "back\\\\slash",
+    "<b>html</b> & {braces} [brackets]",
+    "",
+)
+PUNCTUATION = "\"'{}[]():=@#\\,.+-*/!<>\n\t"
+
+TIER_DIR = RUNS_DIR / tier_folder_name("Tier 9: UCL Syntax Edge Cases")
+FIXTURES_DIR = TIER_DIR / "ucl-fuzz-fixtures"
+RESULTS_PATH = TIER_DIR / "ucl-fuzz.json"
+REPORT_PATH = TIER_DIR / "UCL-FUZZ-REPORT.md"
+
+
+# -- generation ---------------------------------------------------------------
+
+
+class UclGenerator:
+    """Random UCL commands following the documented grammar."""
+
+    def __init__(self, rng, block_ids, root_id):
+        self.rng = rng
+        self.block_ids = block_ids
+        self.root_id = root_id
+
+    def block(self):
+        if self.rng.random() < 0.9:
+            return self.rng.choice(self.block_ids)
+        # Well-formed but unknown
+        return "blk_" + "".join(self.rng.choice("0123456789abcdef") for _ in range(24))
+
+    def string(self):
+        rng = self.rng
+        text = rng.choice(
+            (
+                " ".join(rng.choices(WORDS, k=rng.randint(1, 6))),
+                rng.choice(STRANGE_TEXT),
+            )
+        )
+        if rng.random() < 0.15:
+            return "'" + text.replace("'", "\\'") + "'"
+        return f'"{text}"'
+
+    def value(self, depth=0):
+        rng = self.rng
+        kind = rng.choice(("string", "int", "float", "bool", "null", "array", "ref"))
+        if kind == "array" and depth < 2:
+            items = [self.value(depth + 1) for _ in range(rng.randint(0, 4))]
+            return "[" + ", ".join(items) + "]"
+        if kind == "int":
+            return str(rng.randint(-1000, 1000))
+        if kind == "float":
+            return repr(round(rng.uniform(-100, 100), rng.randint(0, 4)))
+        if kind == "bool":
+            return rng.choice(("true", "false"))
+        if kind == "null":
+            return "null"
+        if kind == "ref":
+            return "@" + self.block()
+        return self.string()
+
+    def path(self):
+        path = self.rng.choice(PATHS)
+        roll = self.rng.random()
+        if roll < 0.1:
+            path += f"[{self.rng.randint(0, 5)}]"
+        elif roll < 0.15:
+            path += f"[{self.rng.randint(0, 2)}:{self.rng.randint(2, 6)}]"
+        return path
+
+    def condition(self, depth=0):
+        rng = self.rng
+        roll = rng.random()
+        if depth < 3 and roll < 0.2:
+            operator = rng.choice(("AND", "OR"))
+            return (
+                f"{self.condition(depth + 1)} {operator} {self.condition(depth + 1)}"
+            )
+        if depth < 3 and roll < 0.3:
+            return f"NOT {self.condition(depth + 1)}"
+        if depth < 3 and roll < 0.4:
+            return f"({self.condition(depth + 1)})"
+        kind = rng.choice(("compare", "string", "exist"))
+        if kind == "compare":
+            return f"{self.path()} {rng.choice(COMPARE_OPS)} {self.value(1)}"
+        if kind == "string":
+            return f"{self.path()} {rng.choice(STRING_OPS)} {self.string()}"
+        return f"{self.path()} {rng.choice(EXIST_OPS)}"
+
+    def properties(self):
+        rng = self.rng
+        options = {
+            "label": lambda: self.string(),
+            "role": lambda: f'"{rng.choice(("paragraph", "heading1", "heading2"))}"',
+            "tags": lambda: "[" + ", ".join(self.string() for _ in range(2)) + "]",
+            "lang": lambda: f'"{rng.choice(("python", "rust", "bash"))}"',
+            "description": lambda: self.string(),
+            "confidence": lambda: str(round(rng.random(), 2)),
+        }
+        names = rng.sample(list(options), rng.randint(1, 3))
+        return " ".join(f"{name}={options[name]()}" for name in names)
+
+    def edit(self):
+        rng = self.rng
+        operator = rng.choice(ASSIGN_OPS)
+        text = f"EDIT {self.block()} SET {self.path()} {operator}"
+        if operator not in ("++", "--"):
+            text += f" {self.value()}"
+        if rng.random() < 0.2:
+            text += f" WHERE {self.condition()}"
+        return text
+
+    def move(self):
+        rng = self.rng
+        target = rng.choice(
+            (
+                f"TO {self.block()}",
+                f"TO {self.block()} AT {rng.randint(0, 10)}",
+                f"BEFORE {self.block()}",
+                f"AFTER {self.block()}",
+            )
+        )
+        return f"MOVE {self.block()} {target}"
+
+    def append(self):
+        rng = self.rng
+        text = f"APPEND {self.block()} {rng.choice(CONTENT_TYPES)}"
+        if rng.random() < 0.2:
+            text += f" AT {rng.randint(0, 10)}"
+        if rng.random() < 0.4:
+            text += f" WITH {self.properties()}"
+        return f"{text} :: {self.string()}"
+
+    def delete(self):
+        rng = self.rng
+        if rng.random() < 0.2:
+            return f"DELETE WHERE {self.condition()}"
+        option = rng.choice(("", " CASCADE", " PRESERVE_CHILDREN"))
+        return f"DELETE {self.block()}{option}"
+
+    def prune(self):
+        target = self.rng.choice(("UNREACHABLE", f"WHERE {self.condition()}"))
+        return f"PRUNE {target}" + (" DRY_RUN" if self.rng.random() < 0.5 else "")
+
+    def fold(self):
+        rng = self.rng
+        options = []
+        if rng.random() < 0.7:
+            options.append(f"DEPTH {rng.randint(0, 5)}")
+        if rng.random() < 0.5:
+            options.append(f"MAX_TOKENS {rng.randint(0, 5000)}")
+        if rng.random() < 0.3:
+            options.append(f"PRESERVE_TAGS [{self.string()}, {self.string()}]")
+        return f"FOLD {self.block()} " + " ".join(options)
+
+    def link(self):
+        text = f"LINK {self.block()} {self.rng.choice(EDGE_TYPES)} {self.block()}"
+        if self.rng.random() < 0.3:
+            text += f" WITH {self.properties()}"
+        return text
+
+    def unlink(self):
+        return f"UNLINK {self.block()} {self.rng.choice(EDGE_TYPES)} {self.block()}"
+
+    def snapshot(self):
+        rng = self.rng
+        name = f'"{rng.choice(WORDS)}-{rng.randint(0, 5)}"'
+        return rng.choice(
+            (
+                f"SNAPSHOT CREATE {name}",
+                f"SNAPSHOT CREATE {name} WITH description={self.string()}",
+                f"SNAPSHOT RESTORE {name}",
+                "SNAPSHOT LIST",
+                f"SNAPSHOT DELETE {name}",
+                f'SNAPSHOT DIFF {name} "{rng.choice(WORDS)}-0"',
+            )
+        )
+
+    def transaction(self):
+        name = self.rng.choice(("", f' "{self.rng.choice(WORDS)}"'))
+        body = "\n".join(self.command(nested=True)[1] for _ in range(3))
+        end = self.rng.choice(("COMMIT", "ROLLBACK"))
+        return f"BEGIN TRANSACTION{name}\n{body}\n{end}{name}"
+
+    def atomic(self, depth=0):
+        lines = []
+        for _ in range(self.rng.randint(0, 5)):
+            if depth < 2 and self.rng.random() < 0.1:
+                lines.append(self.atomic(depth + 1))
+            else:
+                lines.append(self.command(nested=True)[1])
+        body = "".join(f"    {line}\n" for line in lines)
+        return "ATOMIC {\n" + body + "}"
+
+    def command(self, kind=None, nested=False):
+        """Return (kind, UCL text) for one command."""
+        kinds = COMMAND_KINDS[:-2] if nested else COMMAND_KINDS
+        kind = kind or self.rng.choice(kinds)
+        text = getattr(self, kind.lower())()
+        if not nested and self.rng.random() < 0.05:
+            text = f"// {self.rng.choice(WORDS)}\n{text}  // trailing"
+        return kind, text
+
+
+def mutate(rng, text, generator):
+    """Apply one random syntax-breaking mutation."""
+    if not text:
+        return rng.choice(PUNCTUATION)
+    i, j = sorted(rng.randrange(len(text) + 1) for _ in range(2))
+    kind = rng.randrange(8)
+    if kind == 0:
+        return text[:i] + text[j:]
+    if kind == 1:
+        return text[:j] + text[i:j] + text[j:]
+    if kind == 2:
+        tokens = text.split(" ")
+        a, b = rng.randrange(len(tokens)), rng.randrange(len(tokens))
+        tokens[a], tokens[b] = tokens[b], tokens[a]
+        return " ".join(tokens)
+    if kind == 3:
+        return text[:i] + rng.choice(PUNCTUATION) * rng.randint(1, 3) + text[i:]
+    if kind == 4:
+        return text[:i]
+    if kind == 5:
+        # SYN-010: keyword case
+        head, _, rest = text.partition(" ")
+        return rng.choice((head.lower(), head.title(), head.swapcase())) + " " + rest
+    if kind == 6:
+        # SYN-002: malformed block ID
+        bad = rng.choice(("blk_", "blk_xyz", "blk_" + "0" * 30, "block_1", "blk-1"))
+        return text.replace(rng.choice(generator.block_ids), bad, 1)
+    # SYN-008: two arguments swapped
+    tokens = text.split(" ")
+    if len(tokens) > 2:
+        tokens[1], tokens[2] = tokens[2], tokens[1]
+    return " ".join(tokens)
+
+
+def generate_cases(count, block_ids, root_id, valid=DEFAULT_VALID, seed=0):
+    """Return [(kind, text, valid)] for the campaign."""
+    rng = random.Random(seed)
+    generator = UclGenerator(rng, block_ids, root_id)
+    cases = []
+    for _ in range(count):
+        kind, text = generator.command()
+        if rng.random() < valid:
+            cases.append((kind, text, True))
+        else:
+            cases.append((kind, mutate(rng, text, generator), False))
+    return cases
+
+
+ESCAPES = '\\\\\\"'
+TAG = '"t", '
+
+
+def _fill(unit, length):
+    return unit * max(1, length // len(unit))
+
+
+def scaling_input(template, length, root_id, block_id):
+    """The SCALING input for `template` at about `length` bytes."""
+    if template == "string":
+        return f'APPEND {root_id} text :: "{_fill("a", length)}"'
+    if template == "escapes":
+        return f'APPEND {root_id} text :: "{_fill(ESCAPES, length)}"'
+    if template == "unicode":
+        return f'APPEND {root_id} text :: "{_fill("日本語🙂", length // 3)}"'
+    if template == "array":
+        return f'EDIT {block_id} SET metadata.tags += [{_fill(TAG, length)}"t"]'
+    if template == "nesting":
+        depth = length // 2
+        return f"DELETE WHERE {'(' * depth}priority > 5{')' * depth} AND NOT archived"
+    if template == "atomic":
+        line = f'    APPEND {root_id} text :: "x"\n'
+        return "ATOMIC {\n" + _fill(line, length) + "}"
+    if template == "unterminated":
+        return f'APPEND {root_id} text :: "{_fill("a", length)}'
+    if template == "comment":
+        return f"// {_fill('x', length)}\nSNAPSHOT LIST"
+    raise ValueError(f"Unknown scaling template {template!r}")
+
+
+# Long-input shapes timed at increasing lengths (SYN-003..SYN-007)
+SCALING = (
+    "string",
+    "escapes",
+    "unicode",
+    "array",
+    "nesting",
+    "atomic",
+    "unterminated",
+    "comment",
+)
+
+
+# -- workers ------------------------------------------------------------------
+
+
+def _run_python(ucp, doc, text):
+    try:
+        ucp.execute_ucl(doc, text)
+    except Exception as e:
+        return "rejected", f"{type(e).__name__}: {e}"
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except BaseException as e:
+        # pyo3 maps Rust panics to PanicException, a BaseException
+        return "panic", f"{type(e).__name__}: {e}"
+    return "accepted", None
+
+
+def _run_cli(text, timeout):
+    if len(text.encode()) > CLI_MAX_BYTES:
+        return "skipped", f"longer than {CLI_MAX_BYTES} bytes"
+    try:
+        proc = subprocess.run(
+            ["ucp", "ucl", "parse", "--commands", text],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return "hang", f"no exit within {timeout}s"
+    except (OSError, ValueError) as e:
+        # ValueError: an embedded NUL cannot be passed as an argument
+        return "skipped", str(e)
+    detail = (proc.stderr or proc.stdout).strip()[-500:] or None
+    if proc.returncode == 0:
+        return "accepted", None
+    if proc.returncode < 0:
+        return "crash", f"signal {-proc.returncode}: {detail}"
+    if proc.returncode == RUST_PANIC_EXIT:
+        return "panic", detail
+    return "rejected", detail
+
+
+def _worker_main(conn, payload, timeout):
+    """Worker loop: receive (target, text), reply (outcome, ns, detail)."""
+    ucp = sdk()
+    doc = ucp.Document.from_json(payload)
+    executed = 0
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        target, text = message
+        if target == "python":
+            if executed >= RESET_EVERY:
+                doc, executed = ucp.Document.from_json(payload), 0
+            executed += 1
+            start = time.perf_counter_ns()
+            outcome, detail = _run_python(ucp, doc, text)
+        else:
+            start = time.perf_counter_ns()
+            outcome, detail = _run_cli(text, timeout)
+        conn.send((outcome, time.perf_counter_ns() - start, detail))
+
+
+class Worker:
+    """One fuzzing process, restarted when it hangs or dies."""
+
+    def __init__(self, payload, timeout):
+        self.payload = payload
+        self.timeout = timeout
+        self.context = multiprocessing.get_context(
+            "fork" if hasattr(os, "fork") else "spawn"
+        )
+        self._start()
+
+    def _start(self):
+        self.conn, child = self.context.Pipe()
+        self.process = self.context.Process(
+            target=_worker_main, args=(child, self.payload, self.timeout), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def _restart(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self._start()
+
+    def run(self, target, text):
+        """Return (outcome, elapsed ns, detail) for one input."""
+        # The CLI target enforces its own timeout; allow for process startup
+        limit = self.timeout * (2 if target == "cli" else 1) + 1
+        self.conn.send((target, text))
+        if not self.conn.poll(limit):
+            self._restart()
+            return "hang", int(limit * 1e9), f"no result within {limit:g}s"
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            self.process.join()
+            code = self.process.exitcode
+            self._start()
+            return "crash", 0, f"worker exited with {code}"
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+
+
+def run_cases(jobs, workers, payload, timeout):
+    """Run [(target, text)] on `workers` processes; return results in order."""
+    results = [None] * len(jobs)
+    pool = [Worker(payload, timeout) for _ in range(min(workers, len(jobs)) or 1)]
+
+    def drive(worker, indices):
+        for index in indices:
+            results[index] = worker.run(*jobs[index])
+
+    threads = [
+        threading.Thread(target=drive, args=(worker, range(i, len(jobs), len(pool))))
+        for i, worker in enumerate(pool)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for worker in pool:
+        worker.close()
+    return results
+
+
+# -- minimization and fixtures ------------------------------------------------
+
+
+def minimize(text, still_fails, budget=MINIMIZE_TESTS):
+    """ddmin over characters: the smallest text for which still_fails holds."""
+    chunks, tests = 2, 0
+    while len(text) > 1 and tests < budget:
+        size = math.ceil(len(text) / chunks)
+        reduced = False
+        for start in range(0, len(text), size):
+            candidate = text[:start] + text[start + size :]
+            tests += 1
+            if candidate and still_fails(candidate):
+                text, chunks, reduced = candidate, max(chunks - 1, 2), True
+                break
+            if tests >= budget:
+                break
+        if not reduced:
+            if chunks >= len(text):
+                break
+            chunks = min(chunks * 2, len(text))
+    return text
+
+
+def save_fixture(fixture):
+    """Write a finding under FIXTURES_DIR; return the path."""
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+    source = fixture.get("input") or fixture.get("template")
+    digest = hashlib.sha1(f"{fixture['target']}\0{source}".encode()).hexdigest()[:12]
+    path = FIXTURES_DIR / f"{fixture['target']}-{fixture['outcome']}-{digest}.json"
+    path.write_text(json.dumps(fixture, indent=2, ensure_ascii=False))
+    return path
+
+
+def load_fixtures():
+    return [
+        (path, json.loads(path.read_text()))
+        for path in sorted(FIXTURES_DIR.glob("*.json"))
+    ]
+
+
+def minimize_findings(findings, payload, timeout):
+    """Minimize each distinct finding on a dedicated worker; save fixtures."""
+    saved = []
+    seen = {path.name for path, _ in load_fixtures()}
+    worker = Worker(payload, timeout)
+    try:
+        for finding in findings[:MAX_MINIMIZED]:
+            target, outcome = finding["target"], finding["outcome"]
+
+            def still_fails(candidate):
+                return worker.run(target, candidate)[0] == outcome
+
+            # Every hang test waits out the timeout
+            budget = MINIMIZE_TESTS // 10 if outcome == "hang" else MINIMIZE_TESTS
+            minimized = minimize(finding["input"], still_fails, budget)
+            path = save_fixture(
+                {
+                    "target": target,
+                    "outcome": outcome,
+                    "kind": finding["kind"],
+                    "input": minimized,
+                    "original_bytes": len(finding["input"].encode()),
+                    "detail": finding["detail"],
+                    "found_at": datetime.now().isoformat(),
+                    "sdk_version": python_sdk_version(),
+                }
+            )
+            if path.name not in seen:
+                saved.append(str(path))
+    finally:
+        worker.close()
+    return saved
+
+
+# -- campaign -----------------------------------------------------------------
+
+
+def _summarize(cases, results, wall_s):
+    by_outcome, coverage = {}, {}
+    histogram = LatencyHistogram()
+    total_bytes = 0
+    for (kind, text, valid), (outcome, elapsed_ns, _) in zip(cases, results):
+        by_outcome[outcome] = by_outcome.get(outcome, 0) + 1
+        if outcome == "skipped":
+            continue
+        histogram.record(elapsed_ns)
+        total_bytes += len(text.encode())
+        row = coverage.setdefault(kind, dict.fromkeys(COVERAGE_FIELDS, 0))
+        row["generated"] += 1
+        if outcome in FINDINGS:
+            row["findings"] += 1
+        elif outcome in row:
+            row[outcome] += 1
+        if valid and outcome == "rejected":
+            row["valid_rejected"] += 1
+        if not valid and outcome == "accepted":
+            row["mutated_accepted"] += 1
+    count = histogram.count
+    return {
+        "commands": count,
+        "wall_s": round(wall_s, 3),
+        "commands_per_s": round(count / wall_s, 1) if count else None,
+        "mb_per_s": round(total_bytes / 1e6 / wall_s, 3) if count else None,
+        "latency": histogram.summary(),
+        "outcomes": by_outcome,
+        "coverage": coverage,
+    }
+
+
+def _slow_outliers(cases, results, limit=20):
+    """Inputs whose ns/byte is far above the campaign median."""
+    rates = [
+        (elapsed_ns / max(1, len(text)), index)
+        for index, ((_, text, _), (outcome, elapsed_ns, _)) in enumerate(
+            zip(cases, results)
+        )
+        if outcome in ("accepted", "rejected")
+    ]
+    if len(rates) < 10:
+        return []
+    median = statistics.median(rate for rate, _ in rates)
+    slow = sorted(
+        (
+            (rate, index)
+            for rate, index in rates
+            if rate > median * 50 and results[index][1] > SUPERLINEAR_MIN_NS
+        ),
+        reverse=True,
+    )
+    return [
+        {
+            "kind": cases[index][0],
+            "input": cases[index][1][:500],
+            "bytes": len(cases[index][1].encode()),
+            "elapsed_ms": round(results[index][1] / 1e6, 3),
+            "ns_per_byte": round(rate),
+        }
+        for rate, index in slow[:limit]
+    ]
+
+
+def slope(points):
+    """Least-squares slope of log(time) against log(length)."""
+    xs = [math.log(length) for length, _ in points]
+    ys = [math.log(max(ns, 1)) for _, ns in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    if not var:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var
+
+
+def run_scaling(payload, root_id, block_id, lengths, timeout):
+    """Time every SCALING template at every length on one worker."""
+    worker = Worker(payload, timeout)
+    results = []
+    try:
+        for template in SCALING:
+            points, outcome, detail = [], None, None
+            for length in lengths:
+                text = scaling_input(template, length, root_id, block_id)
+                best = None
+                for _ in range(SCALE_REPEATS):
+                    outcome, elapsed_ns, detail = worker.run("python", text)
+                    if outcome in FINDINGS:
+                        break
+                    best = elapsed_ns if best is None else min(best, elapsed_ns)
+                if outcome in FINDINGS:
+                    points.append((len(text.encode()), int(timeout * 1e9)))
+                    break
+                points.append((len(text.encode()), best))
+            fitted = slope(points) if len(points) > 1 else None
+            superlinear = (
+                fitted is not None
+                and fitted > SUPERLINEAR_SLOPE
+                and points[-1][1] > SUPERLINEAR_MIN_NS
+            )
+            results.append(
+                {
+                    "template": template,
+                    "points": [{"bytes": b, "ns": ns} for b, ns in points],
+                    "slope": None if fitted is None else round(fitted, 2),
+                    "superlinear": superlinear,
+                    "outcome": outcome,
+                    "detail": detail,
+                }
+            )
+    finally:
+        worker.close()
+    return results
+
+
+def _findings(cases, results, target):
+    distinct = {}
+    for (kind, text, _), (outcome, _, detail) in zip(cases, results):
+        if outcome in FINDINGS:
+            key = (outcome, kind, (detail or "")[:80])
+            if key not in distinct or len(text) < len(distinct[key]["input"]):
+                distinct[key] = {
+                    "target": target,
+                    "outcome": outcome,
+                    "kind": kind,
+                    "input": text,
+                    "detail": detail,
+                }
+    return sorted(distinct.values(), key=lambda finding: len(finding["input"]))
+
+
+def run(ucp, commands, cli, workers, valid, timeout, lengths, seed=0):
+    """Run the campaign, scaling probe and minimization; return the report."""
+    doc, block_ids = build_fixture(ucp, FIXTURE_BLOCKS)
+    payload = doc.to_json()
+    root_id = doc.root_id
+    cases = generate_cases(commands, block_ids, root_id, valid, seed)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "sdk_version": python_sdk_version(),
+        "seed": seed,
+        "workers": workers,
+        "valid_fraction": valid,
+        "hang_timeout_s": timeout,
+        "targets": {},
+        "findings": [],
+        "fixtures": [],
+    }
+    samples = {"python": cases}
+    if cli:
+        samples["cli"] = random.Random(seed + 1).sample(cases, min(cli, len(cases)))
+    all_findings = []
+    for target, target_cases in samples.items():
+        print(f"  {target}: {len(target_cases)} inputs...", flush=True)
+        start = time.perf_counter()
+        results = run_cases(
+            [(target, text) for _, text, _ in target_cases], workers, payload, timeout
+        )
+        if all(outcome == "skipped" for outcome, _, _ in results):
+            # e.g. no `ucp` on PATH
+            report["targets"][target] = {"skipped": results[0][2]}
+            continue
+        summary = _summarize(target_cases, results, time.perf_counter() - start)
+        if target == "python":
+            summary["slow_outliers"] = _slow_outliers(target_cases, results)
+        report["targets"][target] = summary
+        all_findings += _findings(target_cases, results, target)
+
+    print(f"  scaling: {len(SCALING)} templates...", flush=True)
+    report["scaling"] = run_scaling(payload, root_id, block_ids[-1], lengths, timeout)
+    for entry in report["scaling"]:
+        if entry["outcome"] in FINDINGS or entry["superlinear"]:
+            outcome = entry["outcome"]
+            if outcome not in FINDINGS:
+                outcome = "superlinear"
+            path = save_fixture(
+                {
+                    "target": "python",
+                    "outcome": outcome,
+                    "kind": "scaling",
+                    "template": entry["template"],
+                    "points": entry["points"],
+                    "slope": entry["slope"],
+                    "found_at": datetime.now().isoformat(),
+                    "sdk_version": python_sdk_version(),
+                }
+            )
+            report["fixtures"].append(str(path))
+
+    report["findings"] = [
+        {**finding, "input": finding["input"][:500]} for finding in all_findings
+    ]
+    if all_findings:
+        print(f"  minimizing {len(all_findings)} finding(s)...", flush=True)
+        report["fixtures"] += minimize_findings(all_findings, payload, timeout)
+    return report
+
+
+def replay(ucp, workers, timeout):
+    """Re-run saved fixtures; return [(path, fixture, outcome, detail)]."""
+    doc, block_ids = build_fixture(ucp, FIXTURE_BLOCKS)
+    payload = doc.to_json()
+    fixtures = load_fixtures()
+    jobs = []
+    for _, fixture in fixtures:
+        if fixture.get("kind") == "scaling":
+            length = fixture["points"][-1]["bytes"]
+            text = scaling_input(
+                fixture["template"], length, doc.root_id, block_ids[-1]
+            )
+        else:
+            text = fixture["input"]
+        jobs.append((fixture["target"], text))
+    results = run_cases(jobs, workers, payload, timeout)
+    replayed = []
+    for (path, fixture), (outcome, elapsed_ns, detail) in zip(fixtures, results):
+        if fixture["outcome"] == "superlinear":
+            # Reproduces while the largest input is still over the old time/2
+            outcome = (
+                "superlinear"
+                if elapsed_ns > fixture["points"][-1]["ns"] / 2
+                else outcome
+            )
+        replayed.append((path, fixture, outcome, detail))
+    return replayed
+
+
+# -- report -------------------------------------------------------------------
+
+
+def _ms(ns):
+    return f"{ns / 1e6:.3f}"
+
+
+def format_report(report):
+    """Render the report as Markdown."""
+    lines = [
+        "# UCL Fuzz Report",
+        "",
+        f"**Generated**: {report['generated_at']}",
+        f"**Python SDK**: {report['sdk_version'] or 'unknown'}",
+        f"**Seed**: {report['seed']}, {report['workers']} workers, "
+        f"{report['valid_fraction']:.0%} unmutated, hang timeout "
+        f"{report['hang_timeout_s']:g}s",
+        "",
+        "## Throughput",
+        "",
+        "| Target | Commands | Commands/s | MB/s | p50 ms | p99 ms | Max ms "
+        "| Accepted | Rejected | Panics | Crashes | Hangs |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    skipped = []
+    for target, summary in report["targets"].items():
+        if "skipped" in summary:
+            skipped.append(f"{target} skipped: {summary['skipped']}")
+            continue
+        latency, outcomes = summary["latency"], summary["outcomes"]
+        lines.append(
+            f"| {target} | {summary['commands']} | {summary['commands_per_s']} "
+            f"| {summary['mb_per_s']} | {_ms(latency['p50_ns'])} "
+            f"| {_ms(latency['p99_ns'])} | {_ms(latency['max_ns'])} "
+            + " ".join(
+                f"| {outcomes.get(name, 0)}"
+                for name in ("accepted", "rejected", *FINDINGS)
+            )
+            + " |"
+        )
+    if skipped:
+        lines += ["", *skipped]
+
+    for target, summary in report["targets"].items():
+        if "skipped" in summary:
+            continue
+        lines += [
+            "",
+            f"## Coverage ({target})",
+            "",
+            "| Command | Generated | Accepted | Rejected | Findings "
+            "| Valid but rejected | Mutated but accepted |",
+            "|---|---:|---:|---:|---:|---:|---:|",
+        ]
+        for kind in COMMAND_KINDS:
+            row = summary["coverage"].get(kind)
+            if row is None:
+                continue
+            lines.append(
+                f"| {kind} | {row['generated']} | {row['accepted']} "
+                f"| {row['rejected']} | {row['findings']} "
+                f"| {row['valid_rejected']} | {row['mutated_accepted']} |"
+            )
+
+    lines += [
+        "",
+        "## Parse Time vs Length",
+        "",
+        f"Slope of log(time) against log(bytes); above {SUPERLINEAR_SLOPE} is "
+        "superlinear.",
+        "",
+        "| Template | Largest bytes | Time ms | Slope | Superlinear |",
+        "|---|---:|---:|---:|---|",
+    ]
+    for entry in report["scaling"]:
+        last = entry["points"][-1] if entry["points"] else {"bytes": 0, "ns": 0}
+        flag = "**yes**" if entry["superlinear"] else "no"
+        if entry["outcome"] in FINDINGS:
+            flag = f"**{entry['outcome']}**"
+        lines.append(
+            f"| {entry['template']} | {last['bytes']} | {_ms(last['ns'])} "
+            f"| {'-' if entry['slope'] is None else entry['slope']} | {flag} |"
+        )
+
+    slow = report["targets"].get("python", {}).get("slow_outliers") or []
+    if slow:
+        lines += [
+            "",
+            "## Slow Inputs",
+            "",
+            "| Command | Bytes | ms | ns/byte | Input |",
+            "|---|---:|---:|---:|---|",
+        ]
+        for entry in slow:
+            preview = entry["input"][:60].replace("|", "\\|").replace("\n", " ")
+            lines.append(
+                f"| {entry['kind']} | {entry['bytes']} | {entry['elapsed_ms']} "
+                f"| {entry['ns_per_byte']} | `{preview}` |"
+            )
+
+    if report["findings"]:
+        lines += ["", "## Findings", ""]
+        for finding in report["findings"]:
+            preview = finding["input"][:80].replace("`", "'").replace("\n", "\\n")
+            lines.append(
+                f"- {finding['target']} {finding['outcome']} ({finding['kind']}): "
+                f"`{preview}` {finding['detail'] or ''}".rstrip()
+            )
+    if report["fixtures"]:
+        lines += ["", "New fixtures:", ""]
+        lines += [f"- `{path}`" for path in report["fixtures"]]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Grammar-based UCL fuzzing of execute_ucl and the ucp CLI"
+    )
+    parser.add_argument(
+        "--commands",
+        type=int,
+        default=DEFAULT_COMMANDS,
+        help=f"Inputs for execute_ucl (default: {DEFAULT_COMMANDS})",
+    )
+    parser.add_argument(
+        "--cli",
+        type=int,
+        default=DEFAULT_CLI,
+        help=f"Of those, how many to also run through `ucp ucl parse` "
+        f"(default: {DEFAULT_CLI}, 0 to skip)",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--valid",
+        type=float,
+        default=DEFAULT_VALID,
+        help=f"Fraction of inputs left unmutated (default: {DEFAULT_VALID})",
+    )
+    parser.add_argument(
+        "--hang-timeout",
+        type=float,
+        default=DEFAULT_HANG_TIMEOUT_S,
+        help=f"Seconds before an input counts as a hang "
+        f"(default: {DEFAULT_HANG_TIMEOUT_S:g})",
+    )
+    parser.add_argument(
+        "--lengths",
+        type=lambda v: [int(n) for n in v.split(",") if n],
+        default=list(DEFAULT_LENGTHS),
+        help="Input sizes in bytes for the scaling probe",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--replay", action="store_true", help=f"Re-run the fixtures in {FIXTURES_DIR}"
+    )
+    args = parser.parse_args(argv)
+
+    ucp = sdk()
+    if args.replay:
+        replayed = replay(ucp, args.workers, args.hang_timeout)
+        failing = 0
+        for path, fixture, outcome, detail in replayed:
+            reproduces = outcome == fixture["outcome"]
+            failing += reproduces
+            status = "FAIL" if reproduces else "ok  "
+            print(f"{status} {path.name}: {outcome} {detail or ''}".rstrip())
+        print(f"{len(replayed)} fixture(s), {failing} still failing")
+        return 1 if failing else 0
+
+    report = run(
+        ucp,
+        args.commands,
+        args.cli,
+        args.workers,
+        args.valid,
+        args.hang_timeout,
+        sorted(args.lengths),
+        args.seed,
+    )
+    TIER_DIR.mkdir(parents=True, exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    REPORT_PATH.write_text(format_report(report))
+    for target, summary in report["targets"].items():
+        if "skipped" in summary:
+            print(f"{target}: skipped ({summary['skipped']})")
+            continue
+        findings = sum(summary["outcomes"].get(name, 0) for name in FINDINGS)
+        print(
+            f"{target}: {summary['commands_per_s']} commands/s, "
+            f"{findings} finding(s)"
+        )
+    superlinear = [e["template"] for e in report["scaling"] if e["superlinear"]]
+    if superlinear:
+        print(f"Superlinear: {', '.join(superlinear)}")
+    print(f"Report: {REPORT_PATH}")
+    return 1 if report["findings"] or superlinear else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
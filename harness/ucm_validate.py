@@ -0,0 +1,639 @@
+"""
+Streaming validation of UCM JSON exports (DOC-005/006, PRF-004/005).
+
+`json.loads(doc.to_json())` materializes the whole export as Python
+objects, so checks built on it measure Python's JSON parser and run out
+of memory long before UCP does. This validator reads the export as a
+stream instead:
+
+- `JsonStream` is an incremental reader in the style of ijson: it walks
+  the top-level object and the `structure` and `blocks` maps key by key,
+  and decodes only one member value (one block, one child list) at a
+  time with the C JSON decoder.
+- Every block is checked against the schema of the repo-root `json`
+  sample: `blk_<id>` keys; `id`, `content.type`, `metadata` and
+  `version` on each block; `edges` when present; and `id`, `root`,
+  `structure`, `blocks`, `metadata` and `version` at the top level.
+- Referential integrity is checked on 64-bit digests of the block keys,
+  kept in open-addressing `DigestSet` tables of blocks and children
+  (16-32 bytes each per block, however large the blocks are). It covers
+  the root, structure parents, children and edge targets. References read
+  before the `blocks` member are queued as 8-byte digests and resolved at
+  the end, so member order does not matter. Orphans (blocks that are
+  neither the root nor anyone's child) are reported as warnings.
+
+When a file fails a reference check, a second pass recovers the key
+names of the first MAX_ERRORS offenders from their digests.
+
+Usage:
+    python -m harness.ucm_validate export.json
+    python -m harness.ucm_validate --synthetic 5000000   # ~2 GB export
+    python -m harness.ucm_validate export.json --json
+
+From a test:
+    from harness.ucm_validate import validate
+    result = validate(doc.to_json())
+    assert result["valid"], result["errors"]
+"""
+
+import argparse
+import codecs
+import hashlib
+import io
+import json
+import re
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from harness.benchmarks.python_driver import _rss_bytes
+from harness.corpus import ROOT_ID, TIMESTAMP
+from harness.paths import PROCESSOR_DIR
+
+CHUNK_SIZE = 1 << 20
+# A single member value larger than this is treated as malformed
+MAX_VALUE_BYTES = 64 << 20
+MAX_ERRORS = 50
+SYNTHETIC_DIR = PROCESSOR_DIR / "ucm-validate"
+SECTION_SIZE = 50
+
+TOP_LEVEL = {
+    "id": str,
+    "root": str,
+    "structure": dict,
+    "blocks": dict,
+    "metadata": dict,
+    "version": int,
+}
+BLOCK_FIELDS = {"id": str, "content": dict, "metadata": dict, "version": dict}
+DOCUMENT_METADATA = {
+    "title": (str, type(None)),
+    "authors": list,
+    "created_at": str,
+    "modified_at": str,
+}
+BLOCK_METADATA = {
+    "content_hash": str,
+    "created_at": str,
+    "modified_at": str,
+    "tags": list,
+    "semantic_role": (str, type(None)),
+    "label": (str, type(None)),
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_MISSING = object()
+
+
+class JsonStreamError(ValueError):
+    """Malformed JSON, with the character offset where it was found."""
+
+
+# -- streaming reader ---------------------------------------------------------
+
+
+class JsonStream:
+    """Pull-based incremental JSON reader over a binary file object."""
+
+    def __init__(self, fileobj, chunk_size=CHUNK_SIZE):
+        self._file = fileobj
+        self._chunk_size = chunk_size
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # Characters dropped from the front of the buffer so far
+        self.offset = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def _fill(self, size=None):
+        """Read more input; return False at end of file."""
+        if self.pos:
+            self.offset += self.pos
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        data = self._file.read(size or self._chunk_size)
+        if not data:
+            self.eof = True
+            self.buffer += self._text.decode(b"", final=True)
+            return False
+        self.bytes_read += len(data)
+        self.buffer += self._text.decode(data)
+        return True
+
+    def error(self, message):
+        return JsonStreamError(f"{message} at offset {self.offset + self.pos}")
+
+    def peek(self):
+        """Skip whitespace; return the next character, or "" at the end."""
+        buffer, pos = self.buffer, self.pos
+        if pos < len(buffer) and buffer[pos] not in " \t\n\r":
+            return buffer[pos]
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the complete JSON value at the current position."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self.error(e.msg) from None
+                pending = len(self.buffer) - self.pos
+                if pending > MAX_VALUE_BYTES:
+                    raise self.error(f"value over {MAX_VALUE_BYTES} bytes") from None
+                # Grow geometrically so a large value is re-scanned O(log n) times
+                self._fill(max(self._chunk_size, pending))
+                continue
+            if end == len(self.buffer) and not self.eof and self._fill():
+                # A number may continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """Yield each key of an object; the caller must consume its value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self.error("object key is not a string")
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self.error("expected ',' or '}'")
+
+
+# -- digests ------------------------------------------------------------------
+
+
+def digest(key):
+    """64-bit digest of a block key (never 0, which marks an empty slot)."""
+    value = int.from_bytes(
+        hashlib.blake2b(key.encode(), digest_size=8).digest(), "little"
+    )
+    return value or 1
+
+
+class DigestSet:
+    """Open-addressing set of 64-bit digests, at most half full."""
+
+    def __init__(self, capacity=1024):
+        self._slots = array("Q", bytes(8 * capacity))
+        self._mask = capacity - 1
+        self.count = 0
+
+    def add(self, value):
+        """Insert a digest; return False if it was already present."""
+        slots, mask = self._slots, self._mask
+        index = value & mask
+        while True:
+            current = slots[index]
+            if current == value:
+                return False
+            if not current:
+                break
+            index = (index + 1) & mask
+        slots[index] = value
+        self.count += 1
+        if self.count * 2 > len(slots):
+            self._grow()
+        return True
+
+    def __contains__(self, value):
+        slots, mask = self._slots, self._mask
+        index = value & mask
+        while True:
+            current = slots[index]
+            if current == value:
+                return True
+            if not current:
+                return False
+            index = (index + 1) & mask
+
+    def __iter__(self):
+        return (value for value in self._slots if value)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def nbytes(self):
+        return self._slots.itemsize * len(self._slots)
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = 2 * len(old) - 1
+        self.count = 0
+        for value in old:
+            if value:
+                self.add(value)
+
+
+# -- validation ---------------------------------------------------------------
+
+
+def _type_name(types):
+    if isinstance(types, tuple):
+        return " or ".join(t.__name__ for t in types)
+    return types.__name__
+
+
+class _Validator:
+    def __init__(self, max_errors):
+        self.max_errors = max_errors
+        self.errors = []
+        self.error_counts = Counter()
+        self.warnings = []
+        self.warning_counts = Counter()
+        self.blocks = DigestSet()
+        self.children = DigestSet()
+        self.pending = {"parent": array("Q"), "child": array("Q"), "edge": array("Q")}
+        self.blocks_done = False
+        self.root = None
+        self.seen = set()
+        self.structure_entries = 0
+        self.edges = 0
+
+    # Messages are kept as (code, detail); a digest detail stands for a
+    # key that is named after the run (see _name_digests)
+
+    def error(self, code, detail):
+        self.error_counts[code] += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((code, detail))
+
+    def warning(self, code, detail):
+        self.warning_counts[code] += 1
+        if len(self.warnings) < self.max_errors:
+            self.warnings.append((code, detail))
+
+    def digests(self):
+        """Digests still waiting for a name."""
+        return {
+            detail
+            for _, detail in self.errors + self.warnings
+            if isinstance(detail, int)
+        }
+
+    def _fields(self, where, value, fields, required=True):
+        for name, types in fields.items():
+            item = value.get(name, _MISSING)
+            if item is _MISSING:
+                if required:
+                    self.error("schema", f"{where} has no {name!r}")
+            elif not isinstance(item, types) or item.__class__ is bool:
+                self.error("schema", f"{where}.{name} is not {_type_name(types)}")
+
+    def reference(self, kind, key):
+        value = digest(key)
+        if self.blocks_done:
+            if value not in self.blocks:
+                self.error(f"dangling_{kind}", key)
+        else:
+            self.pending[kind].append(value)
+
+    def check_block(self, key, block):
+        if not isinstance(block, dict):
+            self.error("schema", f"block {key} is not an object")
+            return
+        if not key.startswith("blk_"):
+            self.error("schema", f"block key {key!r} has no blk_ prefix")
+        self._fields(f"block {key}", block, BLOCK_FIELDS)
+        if isinstance(block.get("id"), str) and key != f"blk_{block['id']}":
+            self.error("id_mismatch", f"block {key} has id {block['id']!r}")
+        content = block.get("content")
+        if isinstance(content, dict) and not isinstance(content.get("type"), str):
+            self.error("schema", f"block {key}.content has no type")
+        metadata = block.get("metadata")
+        if isinstance(metadata, dict):
+            self._fields(f"block {key}.metadata", metadata, BLOCK_METADATA, False)
+        version = block.get("version")
+        if isinstance(version, dict):
+            self._fields(
+                f"block {key}.version",
+                version,
+                {"counter": int, "timestamp": str},
+            )
+        edges = block.get("edges", [])
+        if not isinstance(edges, list):
+            self.error("schema", f"block {key}.edges is not a list")
+            return
+        for edge in edges:
+            self.edges += 1
+            if not isinstance(edge, dict) or not isinstance(edge.get("target"), str):
+                self.error("schema", f"block {key} has an edge without a target")
+                continue
+            if not isinstance(edge.get("edge_type"), str):
+                self.error("schema", f"block {key} has an edge without edge_type")
+            self.reference("edge", edge["target"])
+
+    def read_blocks(self, stream):
+        for key in stream.members():
+            block = stream.value()
+            if not self.blocks.add(digest(key)):
+                self.error("duplicate_block", f"{key} appears twice in blocks")
+            self.check_block(key, block)
+        self.blocks_done = True
+
+    def read_structure(self, stream):
+        for parent in stream.members():
+            children = stream.value()
+            self.structure_entries += 1
+            self.reference("parent", parent)
+            if not isinstance(children, list):
+                self.error("schema", f"structure[{parent}] is not a list")
+                continue
+            for child in children:
+                if not isinstance(child, str):
+                    self.error("schema", f"structure[{parent}] has a non-string child")
+                    continue
+                if not self.children.add(digest(child)):
+                    self.error("duplicate_child", f"{child} has more than one parent")
+                self.reference("child", child)
+
+    def read(self, stream):
+        for key in stream.members():
+            self.seen.add(key)
+            if key == "blocks":
+                self.read_blocks(stream)
+            elif key == "structure":
+                self.read_structure(stream)
+            else:
+                value = stream.value()
+                expected = TOP_LEVEL.get(key)
+                if expected is None:
+                    self.warning("unknown_field", f"top-level {key!r}")
+                elif not isinstance(value, expected) or isinstance(value, bool):
+                    self.error("schema", f"{key} is not {_type_name(expected)}")
+                elif key == "root":
+                    self.root = value
+                elif key == "metadata":
+                    self._fields("metadata", value, DOCUMENT_METADATA, False)
+        if stream.peek():
+            raise stream.error("data after the document")
+        for key in TOP_LEVEL:
+            if key not in self.seen:
+                self.error("schema", f"document has no {key!r}")
+
+    def finish(self):
+        """Resolve queued references, the root and orphans."""
+        self.blocks_done = True
+        for kind, values in self.pending.items():
+            for value in values:
+                if value not in self.blocks:
+                    self.error(f"dangling_{kind}", value)
+        self.pending = None
+        root = digest(self.root) if self.root is not None else None
+        if self.root is not None:
+            if root not in self.blocks:
+                self.error("root_missing", f"root {self.root} is not a block")
+            if root in self.children:
+                self.error("root_is_child", f"root {self.root} has a parent")
+        for value in self.blocks:
+            if value != root and value not in self.children:
+                self.warning("orphan", value)
+
+
+def _name_digests(path, wanted):
+    """Second pass: map wanted digests back to the keys they came from."""
+    names = {}
+
+    def note(key):
+        value = digest(key)
+        if value in wanted:
+            names.setdefault(value, key)
+
+    with open(path, "rb") as f:
+        stream = JsonStream(f)
+        for key in stream.members():
+            if key == "structure":
+                for parent in stream.members():
+                    note(parent)
+                    children = stream.value()
+                    for child in children if isinstance(children, list) else []:
+                        if isinstance(child, str):
+                            note(child)
+            elif key == "blocks":
+                for block_key in stream.members():
+                    note(block_key)
+                    block = stream.value()
+                    edges = block.get("edges") if isinstance(block, dict) else None
+                    for edge in edges if isinstance(edges, list) else []:
+                        target = edge.get("target") if isinstance(edge, dict) else None
+                        if isinstance(target, str):
+                            note(target)
+            else:
+                stream.value()
+    return names
+
+
+def _open(source):
+    """Return (binary file object, path or None, close?)."""
+    if isinstance(source, str) and source.lstrip().startswith("{"):
+        return io.BytesIO(source.encode()), None, True
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(bytes(source)), None, True
+    if hasattr(source, "read"):
+        return source, None, False
+    path = Path(source)
+    return open(path, "rb"), path, True
+
+
+def validate(source, max_errors=MAX_ERRORS):
+    """
+    Validate a UCM JSON export without loading it whole.
+
+    `source` is a path, a binary file object, or the JSON itself as str or
+    bytes. Returns a dict: `valid`, `errors`/`warnings` (the first
+    max_errors messages), `error_counts`/`warning_counts` by code,
+    `blocks`, `structure_entries`, `children`, `edges`, `bytes`,
+    `seconds`, `bytes_per_s`, `index_bytes` (digest tables) and
+    `rss_growth_bytes`.
+    """
+    fileobj, path, close = _open(source)
+    validator = _Validator(max_errors)
+    rss_before = _rss_bytes()
+    start = time.perf_counter()
+    stream = JsonStream(fileobj)
+    try:
+        validator.read(stream)
+    except JsonStreamError as e:
+        validator.error("json", str(e))
+    finally:
+        if close:
+            fileobj.close()
+    pending = validator.pending.values()
+    index_bytes = validator.blocks.nbytes + validator.children.nbytes
+    index_bytes += sum(values.itemsize * len(values) for values in pending)
+    if "json" not in validator.error_counts:
+        validator.finish()
+    seconds = time.perf_counter() - start
+    rss_growth = _rss_bytes() - rss_before
+
+    wanted = validator.digests()
+    names = _name_digests(path, wanted) if wanted and path is not None else {}
+
+    def render(messages):
+        rendered = []
+        for code, detail in messages:
+            if isinstance(detail, int):
+                detail = names.get(detail, f"<digest {detail:016x}>")
+            rendered.append(f"{code}: {detail}")
+        return rendered
+
+    return {
+        "valid": not validator.error_counts,
+        "errors": render(validator.errors),
+        "error_counts": dict(validator.error_counts),
+        "warnings": render(validator.warnings),
+        "warning_counts": dict(validator.warning_counts),
+        "blocks": len(validator.blocks),
+        "structure_entries": validator.structure_entries,
+        "children": len(validator.children),
+        "edges": validator.edges,
+        "bytes": stream.bytes_read,
+        "seconds": round(seconds, 3),
+        "bytes_per_s": round(stream.bytes_read / seconds) if seconds else None,
+        "index_bytes": index_bytes,
+        "rss_growth_bytes": rss_growth,
+    }
+
+
+# -- synthetic exports --------------------------------------------------------
+
+
+def _block_id(index):
+    # Multiplying by an odd constant is a bijection mod 2**96: unique ids
+    return f"{(index * 0x9E3779B97F4A7C15) % (1 << 96):024x}"
+
+
+def write_synthetic(path, blocks):
+    """
+    Stream a valid export with `blocks` blocks to `path`.
+
+    The root holds sections of SECTION_SIZE paragraphs; members are in the
+    order the Rust serializer writes them (structure before blocks).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sections = range(1, blocks, SECTION_SIZE + 1)
+    stamp = json.dumps(TIMESTAMP)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{\n  "id": "doc_%016x",\n' % blocks)
+        f.write(f'  "root": "blk_{ROOT_ID}",\n  "structure": {{\n')
+        root_children = ", ".join(f'"blk_{_block_id(i)}"' for i in sections)
+        f.write(f'    "blk_{ROOT_ID}": [{root_children}]')
+        for section in sections:
+            children = range(section + 1, min(section + SECTION_SIZE + 1, blocks))
+            if children:
+                keys = ", ".join(f'"blk_{_block_id(i)}"' for i in children)
+                f.write(f',\n    "blk_{_block_id(section)}": [{keys}]')
+        f.write('\n  },\n  "blocks": {\n')
+        for index in range(blocks):
+            block_id = ROOT_ID if index == 0 else _block_id(index)
+            if index == 0:
+                text = ""
+            elif (index - 1) % (SECTION_SIZE + 1) == 0:
+                text = f"Section {index}"
+            else:
+                text = f"Paragraph {index} of the synthetic export."
+            content = json.dumps({"type": "text", "text": text, "format": "plain"})
+            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            metadata = (
+                f'{{"content_hash": "{content_hash}", "created_at": {stamp}, '
+                f'"modified_at": {stamp}}}'
+            )
+            f.write(",\n" if index else "")
+            f.write(
+                f'    "blk_{block_id}": {{"id": "{block_id}", "content": {content}, '
+                f'"metadata": {metadata}, "edges": [], '
+                f'"version": {{"counter": 1, "timestamp": {stamp}}}}}'
+            )
+        f.write(
+            '\n  },\n  "metadata": {"title": "Synthetic Export", "authors": [], '
+            f'"created_at": {stamp}, "modified_at": {stamp}}},\n  "version": 1\n}}\n'
+        )
+    return path
+
+
+# -- command line -------------------------------------------------------------
+
+
+def _format(path, result):
+    lines = [
+        f"{path}: {'valid' if result['valid'] else 'INVALID'} - "
+        f"{result['blocks']} blocks, {result['bytes'] / 1e6:.1f} MB in "
+        f"{result['seconds']:.2f}s "
+        f"({(result['bytes_per_s'] or 0) / 1e6:.1f} MB/s), index "
+        f"{result['index_bytes'] / 1e6:.1f} MB, RSS +"
+        f"{result['rss_growth_bytes'] / 1e6:.1f} MB"
+    ]
+    for code, count in sorted(result["error_counts"].items()):
+        lines.append(f"  {count:8} {code}")
+    for code, count in sorted(result["warning_counts"].items()):
+        lines.append(f"  {count:8} {code} (warning)")
+    lines += [f"  - {message}" for message in result["errors"][:10]]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Stream-validate UCM JSON exports in bounded memory"
+    )
+    parser.add_argument("paths", nargs="*", type=Path, help="UCM JSON files")
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="BLOCKS",
+        help=f"Write a synthetic export of BLOCKS blocks to {SYNTHETIC_DIR} "
+        "(if missing) and validate it",
+    )
+    parser.add_argument("--max-errors", type=int, default=MAX_ERRORS)
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+
+    paths = list(args.paths)
+    if args.synthetic:
+        path = SYNTHETIC_DIR / f"synthetic-{args.synthetic}.json"
+        if not path.exists():
+            print(f"Writing {path}...", flush=True)
+            write_synthetic(path, args.synthetic)
+        paths.append(path)
+    if not paths:
+        parser.error("give export paths or --synthetic BLOCKS")
+
+    results = {str(path): validate(path, args.max_errors) for path in paths}
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for path, result in results.items():
+            print(_format(path, result))
+    return 0 if all(result["valid"] for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
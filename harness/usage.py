@@ -0,0 +1,230 @@
+"""
+Token, tool-call and wall-time accounting for agent runs.
+
+`UsageMeter` is fed every line an agent runtime prints (see
+harness.agent) and keeps running totals:
+
+- tool calls: the `| Bash ...` lines of the default text output, or
+  tool_use events in JSON output
+- tokens and cost: only the JSON event streams carry them, so run with
+  `python run.py --usage` to have the runtime emit JSON events
+  (`claude -p --output-format stream-json`, `opencode run --format json`).
+  claude-code ends with a `result` event holding the session totals;
+  opencode reports per step in `step_finish` events, which are summed.
+
+DagRunner records each attempt's totals on its run in the session journal,
+and the session totals plus throughput when the session finishes.
+`summarize` groups run rows (harness.monitor) by item, tier or session
+into items/hour and tokens per completed item; failed attempts count
+towards the cost of the item they were for.
+
+Usage:
+    python -m harness.usage
+    python -m harness.usage --by tier
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+
+from harness import monitor
+from harness.logindex import TOOL_RE, strip_ansi
+
+TOKEN_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+)
+
+
+@dataclass
+class Usage:
+    """Totals for one agent attempt."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+    tool_calls: int = 0
+    # False when the runtime printed no token counts (text output)
+    reported: bool = False
+
+    @property
+    def total_tokens(self):
+        return self.input_tokens + self.output_tokens
+
+    def as_fields(self):
+        """Fields for SessionJournal.update_run; tokens are None if unknown."""
+        fields = asdict(self)
+        del fields["reported"]
+        if not self.reported:
+            for name in (*TOKEN_FIELDS, "cost_usd"):
+                fields[name] = None
+        else:
+            fields["cost_usd"] = round(self.cost_usd, 6)
+        return fields
+
+
+def _int(value):
+    return value if isinstance(value, int) else 0
+
+
+class UsageMeter:
+    """Accumulate a Usage from the lines of one agent run's output."""
+
+    def __init__(self):
+        self.usage = Usage()
+        # Set once claude-code's final totals arrive; later lines are ignored
+        self._final = False
+
+    def feed(self, line):
+        line = line.strip()
+        if line.startswith("{"):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                event = None
+            if isinstance(event, dict):
+                self._event(event)
+                return
+        if TOOL_RE.match(strip_ansi(line)):
+            self.usage.tool_calls += 1
+
+    def _event(self, event):
+        kind = event.get("type")
+        usage = self.usage
+        if kind == "result" and isinstance(event.get("usage"), dict):
+            # claude-code: session totals
+            totals = event["usage"]
+            usage.input_tokens = _int(totals.get("input_tokens"))
+            usage.output_tokens = _int(totals.get("output_tokens"))
+            usage.cache_read_tokens = _int(totals.get("cache_read_input_tokens"))
+            usage.cache_write_tokens = _int(totals.get("cache_creation_input_tokens"))
+            usage.cost_usd = event.get("total_cost_usd") or 0.0
+            usage.reported = self._final = True
+        elif kind == "assistant" and not self._final:
+            content = (event.get("message") or {}).get("content") or []
+            usage.tool_calls += sum(
+                isinstance(block, dict) and block.get("type") == "tool_use"
+                for block in content
+            )
+        elif kind == "step_finish":
+            # opencode: one event per model step
+            part = event.get("part") or {}
+            tokens = part.get("tokens") or {}
+            cache = tokens.get("cache") or {}
+            usage.input_tokens += _int(tokens.get("input"))
+            usage.output_tokens += _int(tokens.get("output")) + _int(
+                tokens.get("reasoning")
+            )
+            usage.cache_read_tokens += _int(cache.get("read"))
+            usage.cache_write_tokens += _int(cache.get("write"))
+            usage.cost_usd += part.get("cost") or 0.0
+            usage.reported = True
+        elif kind == "tool_use":
+            usage.tool_calls += 1
+
+
+# -- reporting ----------------------------------------------------------------
+
+
+def summarize(rows, key="session"):
+    """
+    Per `key` ("session", "tier" or "item"): runs, completed items, wall
+    time, tokens, cost, tool calls, items/hour and tokens per completed item.
+
+    items/hour uses the span from the group's first start to its last
+    finish, so it reflects parallel slots; tokens/item divides all metered
+    tokens (including failed attempts) by the metered items that completed.
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(row[key], []).append(row)
+    result = []
+    for name, group in sorted(groups.items(), key=lambda pair: str(pair[0])):
+        metered = [row for row in group if row.get("input_tokens") is not None]
+        tokens = sum(row["input_tokens"] + row["output_tokens"] for row in metered)
+        completed = {row["item"] for row in group if row["status"] == "completed"}
+        metered_items = {row["item"] for row in metered} & completed
+        starts = [row["started"] for row in group if row["started"]]
+        ends = [row["completed"] for row in group if row["completed"]]
+        hours = (max(ends) - min(starts)) / 3600 if starts and ends else 0
+        result.append(
+            {
+                key: name,
+                "runs": len(group),
+                "metered_runs": len(metered),
+                "completed_items": len(completed),
+                "agent_s": round(sum(row["duration_ms"] or 0 for row in group) / 1000),
+                "input_tokens": sum(row["input_tokens"] for row in metered),
+                "output_tokens": sum(row["output_tokens"] for row in metered),
+                "cost_usd": round(sum(row["cost_usd"] or 0 for row in metered), 4),
+                "tool_calls": sum(row.get("tool_calls") or 0 for row in group),
+                "items_per_hour": round(len(completed) / hours, 2) if hours else None,
+                "tokens_per_item": (
+                    round(tokens / len(metered_items)) if metered_items else None
+                ),
+            }
+        )
+    return result
+
+
+def format_table(summary, key):
+    columns = [
+        (key, key),
+        ("runs", "runs"),
+        ("completed_items", "done"),
+        ("agent_s", "agent s"),
+        ("input_tokens", "in tok"),
+        ("output_tokens", "out tok"),
+        ("cost_usd", "cost $"),
+        ("tool_calls", "tools"),
+        ("items_per_hour", "items/h"),
+        ("tokens_per_item", "tok/item"),
+    ]
+    cells = [[label for _, label in columns]]
+    for row in summary:
+        cells.append(
+            ["-" if row[name] is None else str(row[name]) for name, _ in columns]
+        )
+    widths = [max(len(line[i]) for line in cells) for i in range(len(columns))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        )
+        for line in cells
+    )
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Tokens, tool calls and throughput per session, tier or item"
+    )
+    parser.add_argument(
+        "--by",
+        choices=["session", "tier", "item"],
+        default="session",
+        help="Grouping (default: session)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+
+    store = monitor.SessionStore()
+    store.refresh()
+    summary = summarize(store.rows(), args.by)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    elif not summary:
+        print("No sessions under .processor/")
+    else:
+        print(format_table(summary, args.by))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ for UCP-specific testing.
 
 import argparse
 import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -15,6 +16,11 @@ from pathlib import Path
 from processor import ChecklistProcessor, ProcessorConfig
 from processor.config import ProcessingMode, AgentRuntime
 
+from harness import rust_cache
+from harness.budgets import BudgetPolicy
+from harness.replay import ReplayRunner
+from harness.runner import DagRunner
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -32,6 +38,54 @@ def parse_args():
         default=5,
         help="Number of items to process in parallel (default: 5)",
     )
+    parser.add_argument(
+        "--scheduler",
+        choices=["batch", "dag"],
+        default="batch",
+        help="batch: processor batches; dag: dependency-aware scheduler that "
+        "keeps every slot busy (default: batch)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-run items whose inputs (checklist row, prompts, SDK "
+        "versions, test sources) changed since their last successful run; "
+        "implies --scheduler dag",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust the number of parallel agents to CPU load, memory and "
+        "rate limits (up to 2x --batch-size), and derive per-item timeouts "
+        "from past run durations; implies --scheduler dag",
+    )
+    parser.add_argument(
+        "--usage",
+        action="store_true",
+        help="Have the runtime print JSON events so token usage and cost are "
+        "recorded per run (agent logs then hold raw events); implies "
+        "--scheduler dag",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last session left running by a crash "
+        "(dag scheduler only)",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Skip the agent runtime and re-execute the already-generated "
+        "tests of every item on all platforms",
+    )
+    parser.add_argument(
+        "--run-config",
+        type=Path,
+        default=None,
+        help="Run config whose success_criteria latency budgets are enforced "
+        "on test timings (default: config/run_config.json, else the template; "
+        "dag scheduler and --replay only)",
+    )
     parser.add_argument(
         "--max-iterations",
         type=int,
@@ -56,6 +110,13 @@ def parse_args():
         default=600000,
         help="Agent timeout in milliseconds (default: 600000 = 10 min)",
     )
+    parser.add_argument(
+        "--rust-cache-dir",
+        type=Path,
+        default=None,
+        help="Shared Cargo build cache for item Rust tests "
+        "(default: .processor/cargo-cache)",
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -71,6 +132,15 @@ def main():
     # Get the directory where this script is located
     repo_root = Path(__file__).parent.resolve()
 
+    # Share one content-addressed Cargo cache across all items; agents
+    # inherit this through the environment and build via harness.rust_cache
+    rust_cache_dir = args.rust_cache_dir or repo_root / ".processor" / "cargo-cache"
+    os.environ[rust_cache.CACHE_ENV_VAR] = str(rust_cache_dir.resolve())
+
+    # Let generated tests `import harness` (timing, pool, ...) from any cwd
+    python_path = [str(repo_root), *filter(None, [os.environ.get("PYTHONPATH")])]
+    os.environ["PYTHONPATH"] = os.pathsep.join(python_path)
+
     # Configure processor with UCP-specific agent-resources
     config = ProcessorConfig(
         repo_root=repo_root,
@@ -95,12 +165,40 @@ def main():
     print(f"  Runtime: {config.runtime.value}")
     print(f"  Model: {config.get_model()}")
     print(f"  Batch size: {config.batch_size}")
+    dag = args.incremental or args.resume or args.adaptive or args.usage
+    print(f"  Scheduler: {'dag' if dag else args.scheduler}")
+    print(f"  Incremental: {args.incremental}")
+    print(f"  Adaptive: {args.adaptive}")
+    print(f"  Token usage: {args.usage}")
+    budget_policy = BudgetPolicy.from_config(args.run_config)
+    # Only the DAG and replay runners check timings against budgets
+    if args.replay or args.scheduler == "dag" or dag:
+        print(
+            f"  Latency budgets: {budget_policy.criteria.get('max_latency_ms')}ms "
+            f"at {budget_policy.percentile} (+ overrides)"
+        )
+    else:
+        print("  Latency budgets: not enforced (batch scheduler)")
+    print(f"  Replay: {args.replay}")
     print(f"  Max iterations: {config.max_iterations}")
+    print(f"  Rust cache: {rust_cache.cache_root()}")
     print(f"  Dry run: {config.dry_run}")
     print()
 
     # Create and run processor
-    processor = ChecklistProcessor(config)
+    if args.replay:
+        processor = ReplayRunner(config, budget_policy=budget_policy)
+    elif args.scheduler == "dag" or dag:
+        processor = DagRunner(
+            config,
+            incremental=args.incremental,
+            resume=args.resume,
+            adaptive=args.adaptive,
+            json_events=args.usage,
+            budget_policy=budget_policy,
+        )
+    else:
+        processor = ChecklistProcessor(config)
 
     # Handle Ctrl+C gracefully
     import signal
@@ -123,6 +221,8 @@ def main():
     print(f"  Failed: {result.failed}")
     if result.dry_run:
         print("  (Dry run - no agents were executed)")
+    elif args.replay:
+        print("  (Replay - generated tests only, no agents were executed)")
 
     return 1 if result.failed > 0 else 0
 
@@ -1,43 +1,60 @@
-import streamlit as st
-
-st.title("Welcome to Streamlit")
-
-
-# Session state is like a dictionary that remembers things! 
-
-# First, we need to initialise our counter if it doesn't exist 
-
-if "count" not in st.session_state: 
-
-    st.session_state["count"] = 0 
-
-st.subheader(f"Button pressed: {st.session_state['count']} times") 
-
-if st.button("🎈 Click me!"): 
-
-    st.session_state["count"] = st.session_state["count"] + 1 
-
-    st.balloons() 
+import time
 
-st.write(f"Current count: {st.session_state['count']}")
-
-st.markdown("This is **Streamlit**")
-
-name = st.text_input("What is your name?", placeholder="")
-
-st.header("HEader")
-
-st.write("---")
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.header("Column 1")
-
-with col3:
-    st.header("Column 2")
-
-st.sidebar.title("Sidebar")
-
-st.sidebar.write("This is in the sidebar")
+import streamlit as st
 
+import dashboard
+from harness import monitor
+
+st.set_page_config(page_title="UCP Testers", layout="wide")
+slots = dashboard.sidebar()
+
+st.title("Checklist Runs")
+
+
+@st.fragment(run_every=dashboard.REFRESH_SECONDS)
+def live():
+    version = dashboard.refresh()
+    data = dashboard.overview(version, slots)
+
+    status = data["status"]
+    durations = data["durations"]
+    columns = st.columns(6)
+    columns[0].metric("Items", sum(status.values()))
+    columns[1].metric("Running", status.get("running", 0))
+    columns[2].metric("Completed", status.get("completed", 0))
+    columns[3].metric(
+        "Failed", sum(status.get(name, 0) for name in monitor.FAILED_STATUSES)
+    )
+    columns[4].metric("p50 duration", dashboard.seconds(durations["p50_s"]))
+    columns[5].metric("p95 duration", dashboard.seconds(durations["p95_s"]))
+
+    st.subheader("Item status (latest run per item)")
+    st.bar_chart({"items": status})
+
+    st.subheader("Agent slot utilization")
+    st.dataframe(data["sessions"], use_container_width=True, hide_index=True)
+
+    running = [
+        row for row in dashboard.rows(version) if row["status"] == "running"
+    ]
+    # Rows are cached until the next state change; elapsed time is not
+    now = time.time()
+    st.subheader(f"Running now ({len(running)})")
+    st.dataframe(
+        [
+            {
+                "item": row["item"],
+                "tier": row["tier"],
+                "attempt": f"{row['attempt'] + 1}/{row['max_attempts'] or '?'}",
+                "elapsed": dashboard.seconds(
+                    now - row["started"] if row["started"] else None
+                ),
+            }
+            for row in running
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+live()
@@ -0,0 +1,80 @@
+"""
+Shared state for the dashboard pages.
+
+The SessionStore lives in st.cache_resource, so it survives reruns and only
+reads what changed in .processor/ since the previous refresh. Aggregates are
+st.cache_data functions keyed on the store's version, so a rerun with no new
+state transitions is served from cache. Anything that moves with the clock
+alone (the elapsed time of running items) is computed by the page outside
+these functions; sessions that go stale bump the version themselves (see
+harness.monitor).
+"""
+
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+# Appended (not prepended) so this folder's name never shadows the package
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from harness import monitor  # noqa: E402
+from harness import usage as harness_usage  # noqa: E402
+
+REFRESH_SECONDS = 5
+
+
+@st.cache_resource
+def store():
+    return monitor.SessionStore()
+
+
+def refresh():
+    """Read new session state; return the version to key caches on."""
+    return store().refresh()
+
+
+@st.cache_data(max_entries=4)
+def rows(version):
+    return store().rows()
+
+
+@st.cache_data(max_entries=4)
+def overview(version, slots):
+    data = rows(version)
+    return {
+        "status": monitor.status_counts(data),
+        "durations": monitor.duration_stats(data),
+        "sessions": monitor.slot_utilization(data, slots, store().batch_sizes()),
+    }
+
+
+@st.cache_data(max_entries=4)
+def tiers(version):
+    return monitor.tier_throughput(rows(version))
+
+
+@st.cache_data(max_entries=4)
+def retries(version):
+    return monitor.retry_stats(rows(version))
+
+
+@st.cache_data(max_entries=4)
+def usage(version, key):
+    return harness_usage.summarize(rows(version), key)
+
+
+def sidebar():
+    """Sidebar controls shared by every page; returns the fallback slot count."""
+    st.sidebar.title("24h UCP Testers")
+    slots = st.sidebar.number_input(
+        "Agent slots when a session has no recorded --batch-size",
+        min_value=1,
+        value=monitor.DEFAULT_SLOTS,
+    )
+    st.sidebar.caption(f"Refreshes every {REFRESH_SECONDS}s from .processor/")
+    return slots
+
+
+def seconds(value):
+    return "-" if value is None else f"{value:.0f}s"
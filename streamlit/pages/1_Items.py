@@ -0,0 +1,60 @@
+import streamlit as st
+
+import dashboard
+from harness import monitor
+
+st.set_page_config(page_title="Items", layout="wide")
+dashboard.sidebar()
+
+st.title("Items")
+
+statuses = st.multiselect(
+    "Status",
+    [
+        "running",
+        "pending_retry",
+        "completed",
+        "failed",
+        "timeout",
+        "perf_failed",
+        monitor.STALE_STATUS,
+    ],
+)
+query = st.text_input("Item or tier contains", placeholder="SET-00, Tier 3, ...")
+
+
+@st.fragment(run_every=dashboard.REFRESH_SECONDS)
+def items():
+    version = dashboard.refresh()
+    latest = monitor.latest_runs(dashboard.rows(version))
+    if statuses:
+        latest = [row for row in latest if row["status"] in statuses]
+    if query:
+        needle = query.lower()
+        latest = [
+            row
+            for row in latest
+            if needle in (row["item"] or "").lower() or needle in row["tier"].lower()
+        ]
+    st.caption(f"{len(latest)} items (latest run of each)")
+    st.dataframe(
+        [
+            {
+                "item": row["item"],
+                "tier": row["tier"],
+                "status": row["status"],
+                "attempt": f"{row['attempt'] + 1}/{row['max_attempts'] or '?'}",
+                "duration": dashboard.seconds(
+                    None if row["duration_ms"] is None else row["duration_ms"] / 1000
+                ),
+                "session": row["session"],
+                "error": row["error"],
+            }
+            for row in sorted(latest, key=lambda row: row["item"] or "")
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+items()
@@ -0,0 +1,27 @@
+import streamlit as st
+
+import dashboard
+
+st.set_page_config(page_title="Tiers", layout="wide")
+dashboard.sidebar()
+
+st.title("Tier Throughput")
+
+
+@st.fragment(run_every=dashboard.REFRESH_SECONDS)
+def tiers():
+    data = dashboard.tiers(dashboard.refresh())
+    st.dataframe(data, use_container_width=True, hide_index=True)
+    st.subheader("Completed items per hour")
+    st.bar_chart(
+        {
+            "items/hour": {
+                row["tier"]: row["items_per_hour"]
+                for row in data
+                if row["items_per_hour"] is not None
+            }
+        }
+    )
+
+
+tiers()
@@ -0,0 +1,22 @@
+import streamlit as st
+
+import dashboard
+
+st.set_page_config(page_title="Retries", layout="wide")
+dashboard.sidebar()
+
+st.title("Retries")
+
+
+@st.fragment(run_every=dashboard.REFRESH_SECONDS)
+def retries():
+    data = dashboard.retries(dashboard.refresh())
+    st.metric("Items retried", data["retried_items"])
+    st.subheader("Attempts per item")
+    histogram = data["attempts_histogram"]
+    st.bar_chart({"items": {str(attempts): n for attempts, n in histogram.items()}})
+    st.subheader(f"Out of attempts ({len(data['exhausted'])})")
+    st.dataframe(data["exhausted"], use_container_width=True, hide_index=True)
+
+
+retries()
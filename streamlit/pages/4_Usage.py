@@ -0,0 +1,26 @@
+import streamlit as st
+
+import dashboard
+
+st.set_page_config(page_title="Usage", layout="wide")
+dashboard.sidebar()
+
+st.title("Tokens and Throughput")
+st.caption("Token counts are recorded for runs started with `run.py --usage`.")
+
+key = st.radio("Group by", ["session", "tier", "item"], horizontal=True)
+
+
+@st.fragment(run_every=dashboard.REFRESH_SECONDS)
+def usage():
+    data = dashboard.usage(dashboard.refresh(), key)
+    metered = [row for row in data if row["tokens_per_item"] is not None]
+    if metered:
+        st.subheader("Tokens per completed item")
+        st.bar_chart(
+            {"tokens/item": {row[key]: row["tokens_per_item"] for row in metered}}
+        )
+    st.dataframe(data, use_container_width=True, hide_index=True)
+
+
+usage()
@@ -0,0 +1,58 @@
+"""Shared fixtures for the harness tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Tests import `harness` from the repo root, however pytest is invoked
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from harness.checklist import parse_checklist  # noqa: E402
+
+CHECKLIST = """\
+# Mission Checklist
+
+## Tier 1: Installation & Setup Verification
+
+| ID | Target | Priority | Risk | Status |
+|----|--------|----------|------|--------|
+| SET-001 | Install the CLI | P0 | High | ✅ Completed |
+| SET-002 | Check `ucp --version` | P0 | High | ☐ Not Started |
+| SET-003 | Check `ucp --help` | P1 | Medium | ☐ Not Started |
+
+## Tier 2: Document Lifecycle Operations
+
+| ID | Target | Priority | Risk | Status |
+|----|--------|----------|------|--------|
+| DOC-001 | Create an empty document | P1 | High | ☐ Not Started |
+| DOC-002 | Create a titled document | P0 | Medium | ☐ Not Started |
+
+## Tier 19: Performance & Scale
+
+| ID | Target | Priority | Risk | Status |
+|----|--------|----------|------|--------|
+| PRF-003 | `find_by_tag` on 10K blocks < 100ms | P1 | Medium | ☐ Not Started |
+| PRF-007 | Traverse 1000 blocks < 500ms | P1 | Medium | ☐ Not Started |
+
+## Dependencies
+
+- SET-002, SET-003 after SET-001
+- Tier 2 after SET-002
+
+## Notes
+
+| XYZ-999 | Not an item | P0 | Low | ☐ Not Started |
+"""
+
+
+@pytest.fixture
+def checklist_path(tmp_path):
+    path = tmp_path / "SUT-CHECKLIST.md"
+    path.write_text(CHECKLIST)
+    return path
+
+
+@pytest.fixture
+def items(checklist_path):
+    return {item.id: item for item in parse_checklist(checklist_path)}
@@ -0,0 +1,49 @@
+import json
+
+from harness.agent import COMPLETION_MARKER, CompletionTracker
+
+
+def feed(tracker, *lines):
+    for line in lines:
+        tracker.feed(line + "\n")
+    return tracker
+
+
+def test_text_output_completes_only_on_a_final_marker_line():
+    tool_output = [
+        "| Bash     cat agent-resources/prompts/AGENT_SYSTEM_PROMPT.md",
+        f"When complete, output: `{COMPLETION_MARKER}`",
+        COMPLETION_MARKER,
+    ]
+    assert not feed(CompletionTracker(), *tool_output, "Writing the report").completed
+    finished = feed(CompletionTracker(), *tool_output, "Done.", COMPLETION_MARKER, "")
+    assert finished.completed
+    assert feed(CompletionTracker(), "Done.", f"**{COMPLETION_MARKER}**").completed
+    assert feed(CompletionTracker(), f"\x1b[1m{COMPLETION_MARKER}\x1b[0m").completed
+    assert not CompletionTracker().completed
+
+
+def event(**fields):
+    return json.dumps(fields)
+
+
+def test_claude_code_events_use_the_result_text():
+    tool_result = event(
+        type="user",
+        message={"content": [{"type": "tool_result", "content": COMPLETION_MARKER}]},
+    )
+    result = event(type="result", result=f"All platforms done.\n\n{COMPLETION_MARKER}")
+    assert not feed(CompletionTracker(True), tool_result).completed
+    assert feed(CompletionTracker(True), tool_result, result).completed
+    failed = event(type="result", is_error=True, result=COMPLETION_MARKER)
+    assert not feed(CompletionTracker(True), failed).completed
+
+
+def test_opencode_events_use_the_last_text_part():
+    tool = event(type="tool_use", part={"state": {"output": COMPLETION_MARKER}})
+    done = event(type="text", part={"type": "text", "text": COMPLETION_MARKER})
+    more = event(type="text", part={"type": "text", "text": "One more check."})
+    assert not feed(CompletionTracker(True), tool).completed
+    assert feed(CompletionTracker(True), tool, done).completed
+    assert not feed(CompletionTracker(True), done, more).completed
+    assert not feed(CompletionTracker(True), COMPLETION_MARKER).completed
@@ -0,0 +1,87 @@
+import pytest
+
+from harness.budgets import BudgetPolicy, measures
+
+
+def test_measures_matches_the_operation_and_its_variants():
+    assert measures("find_by_tag", "find_by_tag")
+    assert measures("find_by_tag", "find_by_tag_10k")
+    assert not measures("find_by_tag", "document_create")
+    assert not measures("traverse", "traverse1000")
+
+
+def test_item_budget_beats_operation_budget_beats_max_latency(items):
+    policy = BudgetPolicy(
+        {
+            "max_latency_ms": 5000,
+            "budgets_ms": {"DOC-001": 50},
+            "operations_ms": {"to_json": 200},
+        }
+    )
+    assert policy.budget_for(items["DOC-001"], "to_json") == (50, "budgets_ms.DOC-001")
+    assert policy.budget_for(items["DOC-002"], "to_json") == (
+        200,
+        "operations_ms.to_json",
+    )
+    assert policy.budget_for(items["DOC-002"], "add_block") == (5000, "max_latency_ms")
+
+
+def test_tier_overrides_come_first(items):
+    policy = BudgetPolicy(
+        {
+            "max_latency_ms": 5000,
+            "operations_ms": {"to_json": 200},
+            "tiers": {
+                "1": {"max_latency_ms": 100},
+                "tier_2_document_lifecycle_operations": {
+                    "operations_ms": {"to_json": 20}
+                },
+            },
+        }
+    )
+    assert policy.budget_for(items["SET-002"], "to_json") == (
+        200,
+        "operations_ms.to_json",
+    )
+    assert policy.budget_for(items["SET-002"], "version") == (
+        100,
+        "tiers.1.max_latency_ms",
+    )
+    assert policy.budget_for(items["DOC-001"], "to_json") == (
+        20,
+        "tiers.tier_2_document_lifecycle_operations.operations_ms.to_json",
+    )
+
+
+def test_prf_checklist_limit_applies_only_to_the_measured_operation(items):
+    policy = BudgetPolicy({"max_latency_ms": 5000})
+    assert policy.budget_for(items["PRF-003"], "find_by_tag_10k") == (100, "checklist")
+    assert policy.budget_for(items["PRF-007"], "traverse") == (500, "checklist")
+    assert policy.budget_for(items["PRF-003"], "document_create") == (
+        5000,
+        "max_latency_ms",
+    )
+    assert BudgetPolicy({}).budget_for(items["DOC-001"], "to_json") == (None, None)
+
+
+def test_check_reports_operations_over_budget(items):
+    policy = BudgetPolicy({"max_latency_ms": 10, "latency_percentile": "p99"})
+    record = {
+        "operation": "add_block",
+        "count": 3,
+        "samples_ns": [1_000_000, 2_000_000, 30_000_000],
+        **{f"{name}_ns": 2_000_000 for name in ("min", "p50", "p90", "p95")},
+        "p99_ns": 30_000_000,
+        "max_ns": 30_000_000,
+    }
+    fast = dict(record, operation="to_json", p99_ns=1_000_000)
+    violations = policy.check(items["DOC-001"], [record, fast, {"operation": "x"}])
+    assert [v.operation for v in violations] == ["add_block"]
+    violation = violations[0]
+    assert (violation.measured_ms, violation.budget_ms) == (30.0, 10)
+    assert violation.distribution["histogram_ns"]["count"] == 3
+
+
+def test_unknown_percentile_is_rejected():
+    with pytest.raises(ValueError, match="latency_percentile"):
+        BudgetPolicy({"latency_percentile": "p75"})
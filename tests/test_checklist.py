@@ -0,0 +1,81 @@
+import pytest
+
+from harness.checklist import (
+    COMPLETED_STATUS,
+    mark_status,
+    parse_checklist,
+    parse_dependencies,
+    tier_folder_name,
+)
+
+
+def test_parse_checklist_reads_rows_under_tier_headings(checklist_path):
+    items = parse_checklist(checklist_path)
+    assert [item.id for item in items] == [
+        "SET-001",
+        "SET-002",
+        "SET-003",
+        "DOC-001",
+        "DOC-002",
+        "PRF-003",
+        "PRF-007",
+    ]
+    first = items[0]
+    assert first.target == "Install the CLI"
+    assert (first.priority, first.risk) == ("P0", "High")
+    assert first.completed
+    assert not items[1].completed
+    assert first.tier == "Tier 1: Installation & Setup Verification"
+    assert first.tier_number == 1
+    assert [item.order for item in items] == list(range(len(items)))
+
+
+def test_tier_folder_name():
+    assert (
+        tier_folder_name("Tier 1: Installation & Setup Verification")
+        == "tier_1_installation_setup_verification"
+    )
+    assert tier_folder_name("Tier 19: Perf") == "tier_19_perf"
+
+
+def test_sort_key_prefers_tier_then_priority_then_order(items):
+    ordered = sorted(items.values(), key=lambda item: item.sort_key)
+    assert [item.id for item in ordered][3:5] == ["DOC-002", "DOC-001"]
+
+
+def test_parse_dependencies_expands_items_and_tiers(checklist_path):
+    dependencies = parse_dependencies(checklist_path)
+    assert dependencies["SET-001"] == set()
+    assert dependencies["SET-002"] == {"SET-001"}
+    assert dependencies["SET-003"] == {"SET-001"}
+    assert dependencies["DOC-001"] == {"SET-002"}
+    assert dependencies["DOC-002"] == {"SET-002"}
+    assert dependencies["PRF-003"] == set()
+
+
+def with_rule(checklist_path, rule):
+    """A copy of the checklist with one more dependency rule."""
+    path = checklist_path.with_name("rule.md")
+    path.write_text(f"{checklist_path.read_text()}\n## Dependencies\n\n- {rule}\n")
+    return path
+
+
+def test_parse_dependencies_ignores_self_references(checklist_path):
+    path = with_rule(checklist_path, "Tier 2 after Tier 2")
+    dependencies = parse_dependencies(path)
+    assert dependencies["DOC-001"] == {"SET-002", "DOC-002"}
+    assert dependencies["DOC-002"] == {"SET-002", "DOC-001"}
+
+
+def test_parse_dependencies_rejects_unknown_ids(checklist_path):
+    path = with_rule(checklist_path, "SET-002 after XYZ-001")
+    with pytest.raises(ValueError, match="XYZ-001"):
+        parse_dependencies(path)
+
+
+def test_mark_status_rewrites_one_row(checklist_path):
+    assert mark_status("SET-002", path=checklist_path)
+    items = {item.id: item for item in parse_checklist(checklist_path)}
+    assert items["SET-002"].status == COMPLETED_STATUS
+    assert not items["SET-003"].completed
+    assert not mark_status("SET-999", path=checklist_path)
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from harness.histogram import SUB_BUCKET_BITS, LatencyHistogram
+
+PRECISION = 1 / 2**SUB_BUCKET_BITS
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.value_at(0.5) == 50
+    assert histogram.value_at(0.99) == 99
+    assert histogram.value_at(1.0) == 100
+    assert histogram.summary()["min_ns"] == 1
+
+
+@pytest.mark.parametrize("fraction", [0.5, 0.9, 0.99, 0.999])
+def test_percentiles_stay_within_bucket_precision(fraction):
+    rng = random.Random(7)
+    samples = sorted(int(rng.lognormvariate(13, 1)) for _ in range(20_000))
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+    exact = samples[round(fraction * len(samples)) - 1]
+    assert histogram.value_at(fraction) == pytest.approx(exact, rel=PRECISION)
+
+
+def test_values_are_clamped_to_the_recorded_range():
+    histogram = LatencyHistogram()
+    for value in (1_000_003, 1_000_001):
+        histogram.record(value)
+    assert histogram.value_at(0.0) >= histogram.min
+    assert histogram.value_at(1.0) <= histogram.max
+    assert LatencyHistogram().value_at(0.99) == 0
+    histogram.record(-5)
+    assert histogram.min == 0
+
+
+def test_merge_and_round_trip():
+    first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(1, 5000, 3):
+        (first if value % 2 else second).record(value)
+        combined.record(value)
+    first.merge(second).merge(LatencyHistogram())
+    assert first == combined
+    assert LatencyHistogram.from_dict(first.to_dict()) == combined
@@ -0,0 +1,87 @@
+import json
+
+from harness.journal import ACTIVE_RUNS_NAME, SessionJournal, list_sessions
+
+
+def test_load_replays_the_journal_after_the_checkpoint(tmp_path):
+    journal = SessionJournal.create(tmp_path, compact_every=100)
+    journal.update_run("r1", item_id="SET-001", status="running")
+    journal.update_run("r2", item_id="SET-002", status="running")
+    journal.update_run("r1", status="completed", duration_s=4.2)
+    journal.update_session(batch_size=4)
+    journal.close()
+
+    loaded = SessionJournal.load(journal.session_id, tmp_path)
+    runs = {run["id"]: run for run in loaded.state["runs"]}
+    assert runs["r1"] == {
+        "id": "r1",
+        "item_id": "SET-001",
+        "status": "completed",
+        "duration_s": 4.2,
+    }
+    assert runs["r2"]["status"] == "running"
+    assert loaded.state["batch_size"] == 4
+    assert loaded.snapshot()["summary"]["completed"] == 1
+
+
+def test_compaction_checkpoints_and_truncates(tmp_path):
+    journal = SessionJournal.create(tmp_path, compact_every=3)
+    for index in range(4):
+        journal.update_run(f"r{index}", item_id=f"SET-00{index}", status="pending")
+    journal.close()
+
+    checkpoint = json.loads(journal.snapshot_path.read_text())
+    assert [run["id"] for run in checkpoint["runs"]] == ["r0", "r1", "r2"]
+    mirror = tmp_path / ACTIVE_RUNS_NAME
+    assert mirror.read_text() == journal.snapshot_path.read_text()
+    assert len(journal.journal_path.read_text().splitlines()) == 1
+
+    loaded = SessionJournal.load(journal.session_id, tmp_path)
+    assert [run["id"] for run in loaded.state["runs"]] == ["r0", "r1", "r2", "r3"]
+
+
+def test_torn_final_line_is_skipped_and_only_cut_on_repair(tmp_path):
+    journal = SessionJournal.create(tmp_path)
+    journal.update_run("r1", item_id="SET-001", status="running")
+    journal.close()
+    intact = journal.journal_path.read_text()
+    torn = '{"op": "run", "id": "r2", "fie'
+    with open(journal.journal_path, "a") as f:
+        f.write(torn)
+
+    loaded = SessionJournal.load(journal.session_id, tmp_path)
+    assert [run["id"] for run in loaded.state["runs"]] == ["r1"]
+    assert journal.journal_path.read_text() == intact + torn
+    assert SessionJournal.latest_running(tmp_path).session_id == journal.session_id
+    assert journal.journal_path.read_text() == intact + torn
+
+    SessionJournal.load(journal.session_id, tmp_path, repair=True)
+    assert journal.journal_path.read_text() == intact
+
+
+def test_resume_marks_running_runs_interrupted(tmp_path):
+    finished = SessionJournal.create(tmp_path)
+    finished.finish()
+    crashed = SessionJournal(f"session-{int(finished.session_id[8:]) + 1}", tmp_path)
+    crashed.checkpoint()
+    crashed.update_run("r1", item_id="SET-001", status="completed")
+    crashed.update_run("r2", item_id="SET-002", status="running")
+    crashed.close()
+
+    assert list_sessions(tmp_path) == [finished.session_id, crashed.session_id]
+    resumed = SessionJournal.latest_running(tmp_path, repair=True)
+    assert resumed.session_id == crashed.session_id
+    stale = resumed.recover()
+    assert [run["id"] for run in stale] == ["r2"]
+    resumed.close()
+
+    reloaded = SessionJournal.load(crashed.session_id, tmp_path)
+    runs = {run["id"]: run for run in reloaded.state["runs"]}
+    assert runs["r1"]["status"] == "completed"
+    assert runs["r2"]["status"] == "interrupted"
+    assert reloaded.snapshot()["summary"]["active"] == 0
+
+
+def test_latest_running_skips_finished_sessions(tmp_path):
+    SessionJournal.create(tmp_path).finish()
+    assert SessionJournal.latest_running(tmp_path) is None
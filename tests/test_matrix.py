@@ -0,0 +1,120 @@
+import json
+import sqlite3
+
+from harness.matrix import (
+    SCRIPT_OPERATION,
+    build_database,
+    extract,
+    latency_matrix,
+    normalize_operation,
+    platform_from_name,
+)
+
+# Trimmed from SET-002's results/test_results.txt
+SET_002_OUTPUT = """\
+=== SET-002 Test Results ===
+
+=== CLI Test ===
+Stdout: ucp 0.1.10
+Execution time: 9ms
+PASS: Version string is valid
+
+=== Python Test ===
+Stdout: ucp 0.1.10
+Execution time: 3.20ms
+PASS: Version string is valid
+
+=== Rust Test ===
+warning: unused imports: `Read` and `self`
+    Finished `release` profile [optimized] target(s) in 0.04s
+Stdout: ucp 0.1.10
+Execution time: 3.72ms
+PASS: Version string is valid
+
+=== SDK Version Comparison ===
+CLI Version: ucp 0.1.10
+Python SDK Version: 0.1.9
+"""
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_script_sections_take_their_platforms_labelled_version(tmp_path):
+    rows = extract(write(tmp_path, "test_results.txt", SET_002_OUTPUT))
+    by_platform = {row["platform"]: row for row in rows}
+    assert set(by_platform) == {"cli", "python", "rust"}
+    assert all(row["operation"] == SCRIPT_OPERATION for row in rows)
+    assert by_platform["python"]["sdk_version"] == "0.1.9"
+    assert by_platform["cli"]["sdk_version"] == "0.1.10"
+    assert by_platform["rust"]["sdk_version"] == "0.1.10"
+    assert by_platform["python"]["duration_ms"] == 3.2
+    assert by_platform["python"]["status"] == "PASS"
+
+
+def test_unlabelled_versions_stay_with_the_file_platform(tmp_path):
+    output = "ucp-api v0.1.11\n[TEST 1] Create document...\n  ✓ took: 2ms\n"
+    rows = extract(write(tmp_path, "rust_test_output.txt", output))
+    assert rows == [
+        {
+            "platform": "rust",
+            "operation": "document_create",
+            "status": "PASS",
+            "duration_ms": 2.0,
+            "sdk_version": "0.1.11",
+        }
+    ]
+
+
+def test_keywords_match_whole_words_and_keep_sizes():
+    for name in ("delete_block", "get_block", "move_block", "block_count"):
+        assert normalize_operation(name) == name
+    assert normalize_operation("snapshot_create") == "snapshot_create"
+    assert normalize_operation("validate_json_export") == "validate"
+    assert normalize_operation("Root block exists") == "root_block_exists"
+    assert normalize_operation("Export to JSON 10k") == "to_json_10k"
+    assert normalize_operation("createDocument()") == "document_create"
+    assert normalize_operation("Finding blocks by type") == "find_by_type"
+    assert normalize_operation("ucl_execution_test") == "execute_ucl"
+
+
+def test_timings_keep_their_operation_names(tmp_path):
+    lines = [
+        {"operation": name, "p50_ns": 4_000_000, "sdk_version": "0.1.9"}
+        for name in ("to_json_10k", "document_create_1k", "document_create_10k")
+    ]
+    text = "".join(json.dumps(line) + "\n" for line in lines)
+    rows = extract(write(tmp_path, "timings.jsonl", text))
+    assert [(r["platform"], r["operation"], r["duration_ms"]) for r in rows] == [
+        ("python", "to_json_10k", 4.0),
+        ("python", "document_create_1k", 4.0),
+        ("python", "document_create_10k", 4.0),
+    ]
+
+
+def test_test_lists(tmp_path):
+    tests = {"tests": [{"name": "Add block", "status": "passed", "duration_ms": 1}]}
+    rows = extract(write(tmp_path, "javascript_test_results.json", json.dumps(tests)))
+    assert [(r["platform"], r["operation"], r["status"]) for r in rows] == [
+        ("javascript", "add_block", "PASS")
+    ]
+    assert platform_from_name("js_output") == "javascript"
+
+
+def test_script_runs_stay_out_of_the_latency_matrix(tmp_path):
+    results = tmp_path / "runs" / "tier_1_installation_setup_verification"
+    results = results / "SET-002" / "results"
+    results.mkdir(parents=True)
+    write(results, "test_results.txt", SET_002_OUTPUT)
+    record = {"operation": "document_create", "p50_ns": 1_500_000, "platform": "python"}
+    write(results, "timings.jsonl", json.dumps(record) + "\n")
+
+    db_path = tmp_path / "results.sqlite"
+    build_database(tmp_path / "runs", db_path)
+    conn = sqlite3.connect(db_path)
+    operations = {row[0] for row in conn.execute("SELECT operation FROM measurements")}
+    assert SCRIPT_OPERATION in operations
+    assert latency_matrix(conn) == {"document_create": {"python": 1.5}}
@@ -0,0 +1,48 @@
+import os
+import time
+
+from harness.journal import SessionJournal
+from harness.monitor import STALE_GRACE_S, STALE_STATUS, SessionStore
+
+
+def start_run(directory, timeout_ms):
+    journal = SessionJournal.create(directory)
+    journal.update_run(
+        "r1",
+        item_id="SET-001",
+        status="running",
+        started_at="2026-01-01T00:00:00",
+        timeout_ms=timeout_ms,
+    )
+    journal.close()
+    return journal
+
+
+def age(journal, seconds):
+    past = time.time() - seconds
+    for path in (journal.snapshot_path, journal.journal_path):
+        os.utime(path, (past, past))
+
+
+def test_running_runs_of_a_silent_session_turn_stale(tmp_path):
+    journal = start_run(tmp_path, timeout_ms=1000)
+    store = SessionStore(tmp_path)
+    version = store.refresh()
+    assert [row["status"] for row in store.rows()] == ["running"]
+
+    age(journal, STALE_GRACE_S + 5)
+    assert store.refresh() > version
+    [row] = store.rows()
+    assert row["status"] == STALE_STATUS
+    assert store.session_status() == {journal.session_id: STALE_STATUS}
+    stale_duration = row["duration_ms"]
+    assert store.rows()[0]["duration_ms"] == stale_duration
+
+
+def test_sessions_within_their_timeout_stay_running(tmp_path):
+    journal = start_run(tmp_path, timeout_ms=3_600_000)
+    age(journal, STALE_GRACE_S + 5)
+    store = SessionStore(tmp_path)
+    store.refresh()
+    assert [row["status"] for row in store.rows()] == ["running"]
+    assert store.session_status() == {journal.session_id: "running"}
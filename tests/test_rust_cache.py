@@ -0,0 +1,35 @@
+import json
+
+from harness.rust_cache import _own_executables
+
+
+def artifact(manifest, kind, test, executable):
+    return json.dumps(
+        {
+            "reason": "compiler-artifact",
+            "manifest_path": manifest,
+            "target": {"kind": kind},
+            "profile": {"test": test},
+            "executable": executable,
+        }
+    )
+
+
+def test_only_the_crates_own_executables_are_kept(tmp_path):
+    manifest = str(tmp_path / "Cargo.toml")
+    messages = "\n".join(
+        [
+            artifact("/deps/serde/Cargo.toml", ["lib"], False, None),
+            artifact(manifest, ["custom-build"], False, "/t/build-script-build"),
+            artifact(manifest, ["lib"], False, None),
+            artifact(manifest, ["bin"], False, "/t/debug/ucp_test"),
+            artifact(manifest, ["lib"], True, "/t/debug/deps/ucp_test-1a"),
+            artifact(manifest, ["test"], True, "/t/debug/deps/it-2b"),
+            '{"reason": "build-finished", "success": true}',
+        ]
+    )
+    assert _own_executables(messages, tmp_path, tests=False) == ["/t/debug/ucp_test"]
+    assert _own_executables(messages, tmp_path, tests=True) == [
+        "/t/debug/deps/ucp_test-1a",
+        "/t/debug/deps/it-2b",
+    ]
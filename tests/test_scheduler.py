@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from harness.scheduler import BLOCKED, COMPLETED, FAILED, DagScheduler, check_acyclic
+
+
+def test_plan_follows_dependencies_then_tier_priority_and_order(items):
+    dependencies = {
+        "SET-003": {"SET-002"},
+        "DOC-001": {"SET-003"},
+        "DOC-002": {"SET-002"},
+    }
+    scheduler = DagScheduler(items.values(), dependencies)
+    assert scheduler.plan() == [
+        "SET-001",
+        "SET-002",
+        "SET-003",
+        "DOC-002",
+        "DOC-001",
+        "PRF-003",
+        "PRF-007",
+    ]
+
+
+def test_plan_lets_unblocked_later_tiers_wait_only_on_their_prerequisites(items):
+    dependencies = {"SET-001": {"PRF-007"}}
+    order = DagScheduler(items.values(), dependencies).plan()
+    assert order.index("PRF-007") < order.index("SET-001")
+    assert order[0] == "SET-002"
+
+
+def test_satisfied_prerequisites_outside_the_run_are_dropped(items):
+    selected = [items["SET-002"], items["SET-003"]]
+    dependencies = {"SET-002": {"SET-001"}, "SET-003": {"SET-001"}}
+    scheduler = DagScheduler(selected, dependencies, satisfied={"SET-001"})
+    assert scheduler.plan() == ["SET-002", "SET-003"]
+
+
+def test_cycles_are_rejected(items):
+    dependencies = {"SET-002": {"SET-003"}, "SET-003": {"SET-002"}}
+    with pytest.raises(ValueError, match="cycle"):
+        DagScheduler(items.values(), dependencies)
+    check_acyclic({"a": {"b"}, "b": set(), "c": {"a", "b"}})
+
+
+def test_run_blocks_dependents_of_failures_and_missing_prerequisites(items):
+    selected = [items[i] for i in ("SET-002", "SET-003", "DOC-001", "DOC-002")]
+    dependencies = {
+        "SET-003": {"SET-002"},
+        "DOC-001": {"SET-003"},
+        "DOC-002": {"SET-001"},
+    }
+    started = []
+
+    async def worker(item):
+        started.append(item.id)
+        await asyncio.sleep(0)
+        return item.id != "SET-003"
+
+    scheduler = DagScheduler(selected, dependencies, slots=2)
+    outcomes = asyncio.run(scheduler.run(worker))
+    assert started == ["SET-002", "SET-003"]
+    assert outcomes == {
+        "SET-002": COMPLETED,
+        "SET-003": FAILED,
+        "DOC-001": BLOCKED,
+        "DOC-002": BLOCKED,
+    }
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+
+from harness.timing import TimingRecorder, TimingStats, measure, percentile, timer
+
+MS = 1_000_000
+
+
+def test_timer_records_under_its_operation():
+    recorder = TimingRecorder()
+    with timer("load", recorder, size="1k") as step:
+        time.sleep(0.01)
+    assert step.elapsed_ns >= 10 * MS
+    assert recorder.samples["load"] == [step.elapsed_ns]
+    assert recorder.tags["load"] == {"size": "1k"}
+
+
+def test_nested_use_of_one_timer_keeps_both_start_times():
+    recorder = TimingRecorder()
+    outer = timer("load", recorder)
+    with outer:
+        time.sleep(0.02)
+        with outer:
+            pass
+        inner_ns = outer.elapsed_ns
+    assert outer.elapsed_ns > 20 * MS > inner_ns
+    assert recorder.samples["load"] == [inner_ns, outer.elapsed_ns]
+
+
+def test_shared_timer_across_threads_and_tasks():
+    recorder = TimingRecorder()
+    shared = timer("step", recorder)
+
+    @shared
+    def work(seconds):
+        time.sleep(seconds)
+
+    threads = [threading.Thread(target=work, args=(s,)) for s in (0.05, 0.01)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    async def step(seconds):
+        with shared:
+            await asyncio.sleep(seconds)
+
+    async def both():
+        await asyncio.gather(step(0.05), step(0.01))
+
+    asyncio.run(both())
+    short, _, long, _ = sorted(recorder.samples["step"])
+    assert short < 40 * MS
+    assert long >= 50 * MS
+
+
+def test_measure_records_only_timed_calls():
+    recorder = TimingRecorder()
+    calls = []
+    stats = measure("append", calls.append, 1, warmup=2, repeat=5, recorder=recorder)
+    assert isinstance(stats, TimingStats)
+    assert (len(calls), stats.count, len(recorder.samples["append"])) == (7, 5, 5)
+    assert recorder.tags["append"] == {"warmup": 2, "repeat": 5}
+
+
+def test_percentile_interpolates():
+    assert percentile([], 0.5) == 0
+    assert percentile([10, 20, 30, 40], 0.5) == 25
+    assert percentile([10, 20, 30, 40], 1.0) == 40
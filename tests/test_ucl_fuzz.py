@@ -0,0 +1,33 @@
+from harness.ucl_fuzz import minimize
+
+
+def test_minimize_keeps_the_failing_fragment():
+    text = 'EDIT blk_000000000001 SET content.text = "unterminated'
+    assert minimize(text, lambda candidate: '"u' in candidate) == '"u'
+
+
+def test_minimize_keeps_characters_needed_together():
+    text = "APPEND blk_root text :: (((nested)))"
+
+    def still_fails(candidate):
+        return candidate.count("(") >= 2 and ")" in candidate
+
+    result = minimize(text, still_fails)
+    assert still_fails(result)
+    assert sorted(result) == ["(", "(", ")"]
+
+
+def test_minimize_stops_at_the_test_budget():
+    calls = []
+
+    def still_fails(candidate):
+        calls.append(candidate)
+        return False
+
+    text = "x" * 1000
+    assert minimize(text, still_fails, budget=25) == text
+    assert len(calls) == 25
+
+
+def test_minimize_never_returns_an_empty_input():
+    assert minimize("ab", lambda candidate: True) in ("a", "b")
@@ -0,0 +1,99 @@
+import io
+import json
+
+import pytest
+
+from harness.paths import REPO_ROOT
+from harness.ucm_validate import JsonStream, JsonStreamError, validate, write_synthetic
+
+
+@pytest.fixture
+def export(tmp_path):
+    return write_synthetic(tmp_path / "export.json", 120)
+
+
+def corrupt(export, change):
+    document = json.loads(export.read_text())
+    change(document)
+    return json.dumps(document)
+
+
+def test_synthetic_export_is_valid(export):
+    result = validate(export)
+    assert result["valid"], result["errors"]
+    assert result["blocks"] == 120
+    assert result["children"] == 119
+    assert result["warnings"] == []
+    assert result["bytes"] == export.stat().st_size
+
+
+def test_member_order_does_not_matter(export):
+    document = json.loads(export.read_text())
+    blocks_first = {"blocks": document.pop("blocks"), **document}
+    result = validate(json.dumps(blocks_first))
+    assert result["valid"], result["errors"]
+
+
+def test_dangling_references_are_named_from_the_file(export, tmp_path):
+    def change(document):
+        document["structure"][document["root"]].append("blk_missing")
+        block = next(iter(document["blocks"].values()))
+        block["edges"] = [{"edge_type": "references", "target": "blk_gone"}]
+
+    path = tmp_path / "dangling.json"
+    path.write_text(corrupt(export, change))
+    result = validate(path)
+    assert not result["valid"]
+    assert result["error_counts"] == {"dangling_child": 1, "dangling_edge": 1}
+    assert "dangling_child: blk_missing" in result["errors"]
+    assert "dangling_edge: blk_gone" in result["errors"]
+
+
+def test_schema_errors(export):
+    def change(document):
+        block = next(iter(document["blocks"].values()))
+        del block["version"]
+        block["id"] = "other"
+        del document["metadata"]
+
+    result = validate(corrupt(export, change))
+    assert not result["valid"]
+    assert result["error_counts"]["schema"] == 2
+    assert result["error_counts"]["id_mismatch"] == 1
+
+
+def test_orphans_are_warnings(export):
+    def change(document):
+        document["structure"][document["root"]].pop()
+
+    result = validate(corrupt(export, change))
+    assert result["valid"]
+    assert result["warning_counts"]["orphan"] == 1
+
+
+def test_truncated_json_is_an_error(export):
+    text = export.read_text()
+    result = validate(text[: len(text) // 2])
+    assert not result["valid"]
+    assert list(result["error_counts"]) == ["json"]
+
+
+def test_repo_sample_is_valid():
+    result = validate(REPO_ROOT / "json")
+    assert result["valid"], result["errors"]
+
+
+def test_stream_reads_members_one_value_at_a_time():
+    data = b'{"a": [1, {"b": "}"}], "c": {"d": null, "e": "\\u00e9"}}'
+    stream = JsonStream(io.BytesIO(data), chunk_size=4)
+    members = stream.members()
+    assert next(members) == "a"
+    assert stream.value() == [1, {"b": "}"}]
+    assert next(members) == "c"
+    assert [(key, stream.value()) for key in stream.members()] == [
+        ("d", None),
+        ("e", "\u00e9"),
+    ]
+    assert list(members) == []
+    with pytest.raises(JsonStreamError):
+        list(JsonStream(io.BytesIO(b'{"a" 1}')).members())